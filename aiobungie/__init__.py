@@ -38,7 +38,19 @@ Check either the examples or each of those objects's documentation for more info
 
 from __future__ import annotations
 
-from aiobungie import api, builders, crates, framework, traits, typedefs, url
+from aiobungie import (
+    api,
+    builders,
+    cache,
+    crates,
+    framework,
+    manifest,
+    pagination,
+    ratelimit,
+    traits,
+    typedefs,
+    url,
+)
 from aiobungie.client import Client
 from aiobungie.error import *
 from aiobungie.internal.enums import *
@@ -2,8 +2,12 @@ from _typeshed import Incomplete
 
 from aiobungie import api as api
 from aiobungie import builders as builders
+from aiobungie import cache as cache
 from aiobungie import crates as crates
 from aiobungie import framework as framework
+from aiobungie import manifest as manifest
+from aiobungie import pagination as pagination
+from aiobungie import ratelimit as ratelimit
 from aiobungie import traits as traits
 from aiobungie import typedefs as typedefs
 from aiobungie import url as url
@@ -601,6 +601,26 @@ class Framework(abc.ABC):
             of the deserialized payload.
         """
 
+    @abc.abstractmethod
+    def deserialize_lazy_components(
+        self, payload: typedefs.JSONObject
+    ) -> components.LazyComponent:
+        """Lazily deserialize a JSON payload of Bungie.net profile components information.
+
+        Unlike `deserialize_components`, No component is deserialized up front.
+        Each one is deserialized the first time it is accessed.
+
+        Parameters
+        ----------
+        payload : `aiobungie.internal.helpers.JsonObject`
+            The JSON payload.
+
+        Returns
+        -------
+        `aiobungie.crates.LazyComponent`
+            A component that deserializes its fields on first access.
+        """
+
     @abc.abstractmethod
     def deserialize_items_component(
         self, payload: typedefs.JSONObject
@@ -113,10 +113,14 @@ class RESTClient(traits.RESTful, abc.ABC):
         path: str | pathlib.Path = ".",
         *,
         language: _ALLOWED_LANGS = "en",
+        sync: bool = False,
         executor: concurrent.futures.Executor | None = None,
     ) -> pathlib.Path:
         """Download the Bungie manifest json file.
 
+        The file is streamed to disk in chunks as-is, The whole manifest is never held in memory.
+        Interrupted downloads are resumed using HTTP `Range` requests.
+
         Example
         -------
         ```py
@@ -134,6 +138,9 @@ class RESTClient(traits.RESTful, abc.ABC):
             The path to save the manifest json file. Default is the current directory. Example `"D:/"`
         language: `str`
             The manifest database language bytes to get. Default is English.
+        sync : `bool`
+            If set to `True`, The manifest is only downloaded if Bungie has published a new version
+            since the last download. The version is stored next to the file as `<file_name>.json.version`.
         executor: `concurrent.futures.Executor | None`
             An optional executor which will be used to write the bytes of the manifest.
 
@@ -143,6 +150,60 @@ class RESTClient(traits.RESTful, abc.ABC):
             The path of this JSON manifest.
         """
 
+    @abc.abstractmethod
+    async def download_json_definition(
+        self,
+        definition: str,
+        path: str | pathlib.Path = ".",
+        *,
+        language: _ALLOWED_LANGS = "en",
+        sync: bool = False,
+        executor: concurrent.futures.Executor | None = None,
+        manifest_path: typedefs.JSONObject | None = None,
+    ) -> pathlib.Path:
+        """Download a single definition of the JSON manifest.
+
+        Unlike `download_json_manifest`, Only the requested definition is downloaded.
+        See `aiobungie.manifest.JSONManifest` for a reader that loads the definitions lazily.
+
+        Example
+        -------
+        ```py
+        items = await rest.download_json_definition("DestinyInventoryItemDefinition")
+        with open(items, "r") as f:
+            item_definitions = json.loads(f.read())
+        ```
+
+        Parameters
+        ----------
+        definition : `str`
+            The name of the definition to download, i.e., `DestinyInventoryItemDefinition`.
+        path: `str` | `pathlib.Path`
+            The directory to save the definition in. The file is named `<definition>.json`. Default is the current directory.
+        language: `str`
+            The language of the definition to download. Default is English.
+        sync : `bool`
+            If set to `True`, The definition is only downloaded if Bungie has published a new version
+            since the last download. The version is stored next to the file as `<definition>.json.version`.
+        executor: `concurrent.futures.Executor | None`
+            An optional executor which will be used to write the bytes of the definition.
+        manifest_path : `aiobungie.typedefs.JSONObject | None`
+            An already fetched response of `fetch_manifest_path` to resolve the definition's path and version from,
+            So downloading many definitions doesn't request it each time. If `None`, It's fetched.
+
+        Returns
+        -------
+        `pathlib.Path`
+            The path of the definition's JSON file.
+
+        Raises
+        ------
+        `ValueError`
+            If the provided language was not recognized.
+        `aiobungie.MissingDefinitionError`
+            If the definition doesn't exist in the manifest.
+        """
+
     @abc.abstractmethod
     async def download_sqlite_manifest(
         self,
@@ -151,16 +212,24 @@ class RESTClient(traits.RESTful, abc.ABC):
         path: str | pathlib.Path = ".",
         *,
         force: bool = False,
+        sync: bool = False,
         executor: concurrent.futures.Executor | None = None,
     ) -> pathlib.Path:
         """Downloads the SQLite version of Destiny2's Manifest.
 
+        The archive is streamed to disk in chunks and extracted next to the destination file,
+        The whole manifest is never held in memory. If the download gets interrupted, It is resumed
+        from the partially downloaded file using HTTP `Range` requests, Including on the next call.
+
         Example
         -------
         ```py
         manifest = await rest.download_sqlite_manifest()
         with sqlite3.connect(manifest) as conn:
             ...
+
+        # Only download when there's a new version, e.g. on every deploy.
+        manifest = await rest.download_sqlite_manifest(sync=True)
         ```
 
         Parameters
@@ -173,7 +242,11 @@ class RESTClient(traits.RESTful, abc.ABC):
             The manifest database file name. Default is `manifest`
         force : `bool`
             Whether to force the download. Default is `False`. However if set to true the old
-            file will get unlinked and a new one will begin to download.
+            file will be replaced once the new one has finished downloading.
+        sync : `bool`
+            If set to `True`, The manifest is only downloaded if Bungie has published a new version
+            since the last download, And `FileExistsError` is never raised. The version is stored next
+            to the database as `<name>.sqlite3.version`.
         executor: `concurrent.futures.Executor | None`
             An optional executor which will be used to write the bytes of the manifest.
 
@@ -185,7 +258,7 @@ class RESTClient(traits.RESTful, abc.ABC):
         Raises
         ------
         `FileExistsError`
-            If the manifest file exists and `force` is `False`.
+            If the manifest file exists and both `force` and `sync` are `False`.
         `ValueError`
             If the provided language was not recognized.
         """
@@ -759,8 +832,9 @@ class RESTClient(traits.RESTful, abc.ABC):
         *,
         name: str | None = None,
         type: enums.MembershipType | int = enums.MembershipType.NONE,
+        page: int = 1,
     ) -> typedefs.JSONObject:
-        """Fetch all Bungie Clan members.
+        """Fetch a page of Bungie Clan members.
 
         Parameters
         ----------
@@ -775,11 +849,14 @@ class RESTClient(traits.RESTful, abc.ABC):
             An optional clan member's membership type.
             Default is set to `aiobungie.MembershipType.NONE`
             Which returns the first matched clan member by their name.
+        page : `int`
+            The page to fetch, Pages start from `1`. The response's `hasMore` and `totalResults`
+            fields tell whether there are more pages. Defaults to `1`.
 
         Returns
         -------
         `aiobungie.typedefs.JSONObject`
-            A JSON object of an array of clan members.
+            A JSON object of a page of clan members.
 
         Raises
         ------
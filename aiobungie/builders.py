@@ -23,7 +23,15 @@
 
 from __future__ import annotations
 
-__all__ = ("OAuth2Response", "PlugSocketBuilder", "OAuthURL", "Image", "Settings")
+__all__ = (
+    "OAuth2Response",
+    "PlugSocketBuilder",
+    "OAuthURL",
+    "Image",
+    "ImageDownload",
+    "Settings",
+    "ROUTE_RATE_LIMITS",
+)
 
 import asyncio
 import datetime
@@ -36,6 +44,7 @@ import aiohttp
 import attrs
 
 from . import error, url
+from .internal import _images as image_sessions
 from .internal import enums, helpers
 
 if typing.TYPE_CHECKING:
@@ -47,7 +56,7 @@ if typing.TYPE_CHECKING:
 
     from typing_extensions import Required, Self
 
-    from aiobungie import traits, typedefs
+    from aiobungie import cache, ratelimit, traits, typedefs
 
     class _FinderListingValue(typing.TypedDict):
         valueType: Required[int]
@@ -59,6 +68,13 @@ if typing.TYPE_CHECKING:
         matchType: int
 
 
+ROUTE_RATE_LIMITS: typing.Final[collections.Mapping[str, float]] = {
+    "Destiny2/{}/Profile/*": 10.0,
+    "*/Stats*": 10.0,
+}
+"""Suggested `Settings.route_rate_limits`, Separate buckets for the profile and the stats endpoints."""
+
+
 @typing.final
 @attrs.define(kw_only=True)
 class Settings:
@@ -101,6 +117,108 @@ class Settings:
     ssl: bool | aiohttp.Fingerprint | ssl.SSLContext = attrs.field(default=True)
     """References [ssl](https://docs.aiohttp.org/en/stable/client_reference.html#aiohttp.TCPConnector)"""
 
+    max_concurrent_requests: int = attrs.field(default=16)
+    """The maximum number of HTTP requests that can be in flight at the same time.
+
+    When using `aiobungie.RESTPool`, This limit is shared between all clients acquired from the pool.
+    Setting this to `1` sends the requests one after another.
+
+    Defaults to `16`.
+    """
+
+    max_concurrent_route_requests: int = attrs.field(default=8)
+    """The maximum number of HTTP requests that can be in flight at the same time for a single route.
+
+    Routes are grouped by their template, i.e., fetching two different profiles counts towards the same route.
+
+    Defaults to `8`.
+    """
+
+    rate_limit: float | None = attrs.field(default=None)
+    """How many requests per second the application key is allowed to send.
+
+    Requests are spent from a token bucket that refills at this rate, So bursts are
+    smoothed out before Bungie starts responding with `429`s. The bucket slows down
+    when Bungie returns `ThrottleSeconds` and recovers gradually afterwards.
+
+    When using `aiobungie.RESTPool`, This bucket is shared between all clients acquired from the pool.
+
+    Defaults to `None`, Which disables proactive rate limiting. Set it, i.e. to `20.0`, to opt in.
+    """
+
+    route_rate_limits: collections.Mapping[str, float] = attrs.field(factory=dict)
+    """A mapping of route patterns to how many requests per second the routes matching it are allowed to send.
+
+    Each pattern gets its own token bucket which is spent in addition to `rate_limit`.
+    Patterns are `fnmatch` patterns matched against the route with its
+    numeric segments replaced by `{}` and without the query string or a trailing slash,
+    i.e., `Destiny2/3/Profile/4611686018484639825/?components=100` is matched as `Destiny2/{}/Profile/{}`.
+
+    Defaults to an empty mapping, Set it to `aiobungie.builders.ROUTE_RATE_LIMITS` for separate buckets
+    for the profile and the stats endpoints.
+    """
+
+    rate_limit_backend: ratelimit.RateLimitBackend | None = attrs.field(default=None)
+    """A backend to coordinate `rate_limit` and `route_rate_limits` between multiple processes.
+
+    When set, Tokens are taken from the backend's shared buckets instead of the local ones,
+    So a fleet of workers using the same application key stays under Bungie's limits together.
+    All processes must be configured with the same rate limits.
+
+    See `aiobungie.ratelimit` for the available backends. Defaults to `None`.
+    """
+
+    coalesce_requests: bool = attrs.field(default=True)
+    """Whether identical `GET` requests that are in flight at the same time should share one HTTP call.
+
+    Requests are considered identical when they have the same route, query parameters and authorization.
+    All callers receive the same decoded response object, So it shouldn't be mutated.
+
+    Defaults to `True`.
+    """
+
+    response_cache: cache.ResponseCache | None = attrs.field(default=None)
+    """A cache for the responses of `GET` requests, Routes are cached based on the cache's TTL policies.
+
+    When using `aiobungie.RESTPool`, The cache is shared between all clients acquired from the pool.
+    Cached responses are shared between callers, So they shouldn't be mutated.
+
+    See `aiobungie.cache` for more. Defaults to `None`.
+    """
+
+    conditional_routes: collections.Sequence[str] = attrs.field(
+        default=(
+            "Destiny2/Manifest",
+            "Destiny2/Milestones",
+            "Destiny2/Vendors",
+            "Destiny2/{}/Profile/*",
+        )
+    )
+    """Route patterns that are requested conditionally with `If-None-Match` and `If-Modified-Since`.
+
+    When a response of a matching route has an `ETag` or `Last-Modified` header, The client remembers it
+    along with the decoded body. If the next request for the same route, query parameters and authorization
+    is answered with `304 Not Modified`, The remembered body is returned without downloading or decoding it again.
+
+    Patterns are matched the same way as `route_rate_limits`.
+    Defaults to the manifest, public milestones, vendors and profile routes.
+    """
+
+    image_cache: cache.ImageCache | None = attrs.field(default=None)
+    """An on-disk cache for the bytes of images, Used by `Image.read` and `Image.save`.
+
+    Images deserialized by a `Client` with these settings go through it, So each image path
+    is only downloaded once. See `aiobungie.cache.ImageCache`. Defaults to `None`.
+    """
+
+    conditional_cache_size: int = attrs.field(default=32)
+    """How many remembered bodies each client keeps for `conditional_routes`.
+
+    The least recently used body is dropped when this is exceeded, Set to `0` to disable conditional requests.
+
+    Defaults to `32`.
+    """
+
 
 @typing.final
 class MimeType(str, enums.Enum):
@@ -116,8 +234,66 @@ class MimeType(str, enums.Enum):
         return self.value
 
 
-def _open_write_path(path: pathlib.Path) -> typing.BinaryIO:
-    return path.open("wb")
+def _write_file(path: pathlib.Path, data: bytes) -> None:
+    # Written next to the file first, So an interrupted write never leaves a partial image behind.
+    partial = path.with_name(f"{path.name}.{uuid.uuid4().hex}.part")
+    partial.write_bytes(data)
+    partial.replace(path)
+
+
+def _existing_files(
+    paths: collections.Iterable[pathlib.Path],
+) -> frozenset[pathlib.Path]:
+    return frozenset(path for path in paths if path.exists())
+
+
+@typing.final
+class _ImageStream:
+    """The bytes of a single image response.
+
+    The stream owns its response, It's released once the stream is exhausted, fails or is closed.
+    """
+
+    __slots__ = ("_response", "_session", "_chunks")
+
+    def __init__(
+        self,
+        response: aiohttp.ClientResponse,
+        session: aiohttp.ClientSession | None,
+        chunks: aiohttp.streams.AsyncStreamIterator[bytes],
+    ) -> None:
+        self._response = response
+        # Only set when the session was opened for this stream alone.
+        self._session = session
+        self._chunks = chunks
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> bytes:
+        try:
+            return await self._chunks.__anext__()
+        except BaseException:
+            await self.aclose()
+            raise
+
+    async def aclose(self) -> None:
+        """Release this stream's response, Stopping it early if it's not exhausted yet."""
+        self._response.release()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        exc_tb: types.TracebackType | None,
+    ) -> None:
+        await self.aclose()
 
 
 @typing.final
@@ -125,6 +301,12 @@ class Image:
     """A streamable Bungie resource.
 
     Images are _lazy_, which mean they do nothing unless you `await` or poll them.
+    They're also immutable and hold no state between fetches, So the same instance can be
+    shared and fetched concurrently.
+
+    Images deserialized by a `Client` are fetched through its REST client's HTTP session while it's open
+    and reuse its connections, And `read` and `save` go through its `Settings.image_cache` if it's set.
+    Otherwise a new session is opened for each fetch.
 
     Example
     -------
@@ -135,31 +317,42 @@ class Image:
     # https://www.bungie.net/img/destiny_content/pgcr/raid_eclipse.jpg
 
     # Save the image to a file.
-    async with img:
-        await img.save(
-            "file_name",
-            "/my/path/to/save/to",
-            mime_type="png"
-        )
+    await img.save(
+        "file_name",
+        "/my/path/to/save/to",
+        mime_type="png"
+    )
     ```
 
     Parameters
     ----------
     path : `str | None`
         A valid Bungie resource path. if left `None`, `Image.DEFAULT_PATH` will be used.
+
+    Other Parameters
+    ----------------
+    source : `aiobungie.internal._images.Source | None`
+        The session and image cache of the client this image belongs to,
+        It's set by the framework that deserialized the image.
     """
 
-    __slots__ = ("path", "_client_session", "_call")
+    __slots__ = ("_path", "_source")
     DEFAULT_PATH: typing.ClassVar[str] = "/img/misc/missing_icon_d2.png"
     """Returns the path to the missing Bungie image.
 
     This returns the path only, If you want an actual image object use `Image.default()`
     """
 
-    def __init__(self, path: str | None = None) -> None:
-        self.path = self.DEFAULT_PATH if not path else path
-        self._client_session: aiohttp.ClientSession = NotImplemented
-        self._call: aiohttp.ClientResponse = NotImplemented
+    def __init__(
+        self, path: str | None = None, *, source: image_sessions.Source | None = None
+    ) -> None:
+        self._path = self.DEFAULT_PATH if not path else path
+        self._source = source
+
+    @property
+    def path(self) -> str:
+        """The resource path of this image."""
+        return self._path
 
     @property
     def is_missing(self) -> bool:
@@ -213,30 +406,44 @@ class Image:
         """
         return url.BASE + "/" + self.path
 
-    async def _static_request(self) -> aiohttp.ClientResponse:
-        client_session = aiohttp.ClientSession()
-        request = client_session.request(
-            "GET", self.create_url(), raise_for_status=False
-        )
+    async def _request(
+        self, session: aiohttp.ClientSession | None, /
+    ) -> tuple[aiohttp.ClientResponse, aiohttp.ClientSession | None]:
+        # Returns the response along with the session if one had to be opened for it,
+        # Which is when there's no open client to share a session with.
+        owned = None
+        if session is None:
+            session = owned = aiohttp.ClientSession()
+
         try:
-            await client_session.__aenter__()
-            response = await request.__aenter__()
-            try:
-                if 300 >= response.status >= 200:
-                    self._client_session = client_session
-                    self._call = response
-                    return response
-                else:
+            response = await session.request(
+                "GET", self.create_url(), raise_for_status=False
+            )
+            if not 300 >= response.status >= 200:
+                try:
                     raise await error.panic(response)
-
-            except Exception as e:
-                await response.__aexit__(type(e), e, e.__traceback__)
-                raise
+                finally:
+                    response.release()
 
         except Exception:
-            await client_session.close()
+            if owned is not None:
+                await owned.close()
             raise
 
+        return response, owned
+
+    async def _stream(self, chunk_size: int | None, /) -> _ImageStream:
+        response, owned = await self._request(
+            None if self._source is None else self._source.session
+        )
+        content = response.content
+        chunks = (
+            content.iter_any()
+            if chunk_size is None
+            else content.iter_chunked(chunk_size)
+        )
+        return _ImageStream(response, owned, chunks)
+
     async def save(
         self,
         file_name: str,
@@ -268,7 +475,9 @@ class Image:
         `PermissionError`
             If the path provided is not writable or does not have write permissions.
         `RuntimeError`
-            If the image could not be saved for some other reason.
+            If the image could not be downloaded, Either because of a connection error
+            or an unsuccessful HTTP status. The original `aiohttp.ClientError` or
+            `aiobungie.HTTPError` is set as its `__cause__`.
         """
         if isinstance(path, pathlib.Path) and not path.exists():
             raise FileNotFoundError(f"File does not exist: {path!r}")
@@ -278,19 +487,118 @@ class Image:
             return
 
         path = pathlib.Path(path) / f"{file_name}.{mime_type}"
-        loop = helpers.get_or_make_loop()
-        file = await loop.run_in_executor(executor, _open_write_path, path)
-
-        reader = await self._static_request()
         try:
-            async for chunk in reader.content:
-                await loop.run_in_executor(executor, file.write, chunk)
+            data = await self.read()
+        except (aiohttp.ClientError, error.HTTPError) as err:
+            raise RuntimeError("Encountered an error while saving image.") from err
 
-        except asyncio.CancelledError:
-            pass
+        # The whole image is written at once, Instead of a hop to the executor for each chunk.
+        await helpers.get_or_make_loop().run_in_executor(
+            executor, _write_file, path, data
+        )
 
-        except Exception as err:
-            raise RuntimeError("Encountered an error while saving image.") from err
+    @staticmethod
+    async def save_many(
+        images: collections.Iterable[Image],
+        path: str | os.PathLike[str],
+        /,
+        *,
+        concurrency: int = 16,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> collections.AsyncGenerator[ImageDownload, None]:
+        """Download many images to a directory concurrently, Yielding each result as it completes.
+
+        Each image is saved under the last segment of its path, i.e. `/common/destiny2_content/icons/abc.jpg`
+        is saved as `abc.jpg`. Images whose file already exists are skipped without being downloaded,
+        And images with the same path are only downloaded once.
+
+        A failed download doesn't stop the others, It's yielded with its `ImageDownload.error` set instead.
+
+        Example
+        -------
+        ```py
+        items = await client.fetch_inventory_items(...)
+        async for download in Image.save_many((item.icon for item in items), "icons/"):
+            print(f"{download.completed}/{download.total}", download.path)
+        ```
+
+        Parameters
+        ----------
+        images : `collections.Iterable[Image]`
+            The images to download.
+        path : `str | os.PathLike[str]`
+            The directory to save the images to, It must already exist.
+
+        Other Parameters
+        ----------------
+        concurrency : `int`
+            The maximum number of images to download at the same time. Defaults to `16`.
+        executor : `concurrent.futures.Executor | None`
+            An optional executor to use for checking and writing the files.
+
+        Returns
+        -------
+        `collections.AsyncGenerator[ImageDownload, None]`
+            An async generator that yields the result of each image as it completes.
+
+        Raises
+        ------
+        `ValueError`
+            If images with different paths would be saved under the same file name,
+            i.e. `a/icon.png` and `b/icon.png`. Nothing is downloaded in that case.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be greater than 0.")
+
+        directory = pathlib.Path(path)
+        targets: dict[pathlib.Path, Image] = {}
+        for image in images:
+            target = directory / pathlib.PurePosixPath(image.path).name
+            other = targets.setdefault(target, image)
+            if other.path.lstrip("/") != image.path.lstrip("/"):
+                raise ValueError(
+                    f"{other.path!r} and {image.path!r} would both be saved as {target.name!r}."
+                )
+        loop = helpers.get_or_make_loop()
+        existing = await loop.run_in_executor(executor, _existing_files, targets)
+        limit = asyncio.Semaphore(concurrency)
+
+        async def download(
+            target: pathlib.Path, image: Image
+        ) -> tuple[pathlib.Path, Image, bool, Exception | None]:
+            if target in existing:
+                return target, image, True, None
+
+            async with limit:
+                try:
+                    data = await image.read()
+                    await loop.run_in_executor(executor, _write_file, target, data)
+                except Exception as err:
+                    return target, image, False, err
+
+            return target, image, False, None
+
+        tasks = [
+            asyncio.ensure_future(download(target, image))
+            for target, image in targets.items()
+        ]
+        try:
+            for completed, task in enumerate(asyncio.as_completed(tasks), 1):
+                target, image, skipped, failure = await task
+                yield ImageDownload(
+                    image=image,
+                    path=target,
+                    skipped=skipped,
+                    error=failure,
+                    completed=completed,
+                    total=len(tasks),
+                )
+        finally:
+            # The caller stopped iterating early, Wait for the downloads to unwind
+            # so none of them outlive the generator or write after it's closed.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
     async def read(self) -> bytes:
         """Perform an HTTP call reading this image's entire bytes into memory.
@@ -301,8 +609,7 @@ class Image:
         image = Image.default()
         # you can fetch the bytes in two different ways
         # they do the exact same thing.
-        async with image:
-            buffer = await image.read() or await image
+        buffer = await image.read() or await image
         ```
 
         Returns
@@ -310,17 +617,39 @@ class Image:
         `bytes`:
             The bytes of this image.
         """
-        return await (await self._static_request()).read()
+        session = image_cache = None
+        if (source := self._source) is not None:
+            session, image_cache = source.session, source.cache
+
+        if (
+            image_cache is not None
+            and (data := await image_cache.get(self.path)) is not None
+        ):
+            return data
+
+        response, owned = await self._request(session)
+        try:
+            data = await response.read()
+        finally:
+            response.release()
+            if owned is not None:
+                await owned.close()
+
+        if image_cache is not None:
+            await image_cache.set(self.path, data)
+        return data
 
-    async def stream(self) -> aiohttp.streams.AsyncStreamIterator[bytes]:
+    async def stream(self) -> collections.AsyncIterator[bytes]:
         """Stream this image's data.
 
+        The stream releases its connection once it's exhausted,
+        Use it as a context manager to release it if you stop iterating early.
+
         Example
         -------
         ```py
         image = Image.default()
-        async with image:
-            stream = await image.stream()
+        async with await image.stream() as stream:
             async for byte in stream:
                 # write chunk to file
             ...
@@ -328,35 +657,34 @@ class Image:
 
         Returns
         -------
-        `AsyncStreamIterator[bytes]`:
+        `collections.AsyncIterator[bytes]`:
             A streaming iterator of this image bytes, yielding the entire data as soon as its received.
         """
-        return (await self._static_request()).content.iter_any()
+        return await self._stream(None)
 
-    async def chunks(self, n: int) -> aiohttp.streams.AsyncStreamIterator[bytes]:
+    async def chunks(self, n: int) -> collections.AsyncIterator[bytes]:
         """Stream the bytes of this image in `n` chunks.
 
+        The stream releases its connection once it's exhausted,
+        Use it as a context manager to release it if you stop iterating early.
+
         Example
         -------
         ```py
         buffer_size = 1024
         image = Image.default()
 
-        async with image:
-            chunks = await image.chunks(buffer_size)
-            while True:
-                next_chunk = await anext(chunks)
-                if not next_chunk:
-                    break
+        async with await image.chunks(buffer_size) as chunks:
+            async for chunk in chunks:
                 # write chunk to file
         ```
 
         Returns
         -------
-        `AsyncStreamIterator[bytes]`:
+        `collections.AsyncIterator[bytes]`:
             A chunking stream of bytes.
         """
-        return (await self._static_request()).content.iter_chunked(n)
+        return await self._stream(n)
 
     async def iter(self) -> collections.AsyncGenerator[bytes, None]:
         """Yield each byte in this image from start to end.
@@ -365,9 +693,8 @@ class Image:
         -------
         ```py
         resource = Image.default()
-        async with resource:
-            async for byte in resource.iter():
-                print(byte)
+        async for byte in resource.iter():
+            print(byte)
         ```
 
         Returns
@@ -376,11 +703,13 @@ class Image:
             An async generator that yields this image's bytes from start to end.
         """
 
-        reader = await self.chunks(1024)
-        async for chunk in reader:
-            yield chunk
+        async with await self._stream(1024) as reader:
+            async for chunk in reader:
+                yield chunk
 
     async def __aenter__(self) -> Self:
+        # Kept for compatibility, Images hold no state to release.
+        # Each stream releases its own response instead.
         return self
 
     async def __aexit__(
@@ -389,8 +718,7 @@ class Image:
         exc: BaseException | None,
         exc_tb: types.TracebackType | None,
     ) -> None:
-        await self._client_session.close()
-        await self._call.__aexit__(exc_type, exc, exc_tb)
+        return None
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, str):
@@ -412,6 +740,10 @@ class Image:
     def __str__(self) -> str:
         return self.create_url()
 
+    def __reduce__(self) -> tuple[type[Image], tuple[str]]:
+        # The source holds an open session, So it's left behind.
+        return Image, (self._path,)
+
     def __await__(self) -> collections.Generator[None, None, bytes]:
         return self.read().__await__()
 
@@ -423,6 +755,35 @@ This is always returned by calling `Image.default()`
 """
 
 
+@typing.final
+@attrs.frozen(kw_only=True)
+class ImageDownload:
+    """The result of downloading a single image with `Image.save_many`."""
+
+    image: Image
+    """The downloaded image."""
+
+    path: pathlib.Path
+    """The path of the image's file."""
+
+    skipped: bool
+    """Whether the download was skipped because the file already exists."""
+
+    error: Exception | None
+    """The error the download failed with, Or `None` if it didn't fail."""
+
+    completed: int
+    """How many images have completed so far, Including this one."""
+
+    total: int
+    """The total number of images being downloaded."""
+
+    @property
+    def ok(self) -> bool:
+        """Whether the image's file exists, i.e. it was downloaded or skipped."""
+        return self.error is None
+
+
 @typing.final
 @attrs.frozen(kw_only=True, repr=False)
 class OAuth2Response:
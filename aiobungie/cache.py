@@ -0,0 +1,563 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""HTTP response caching for the REST clients.
+
+A `ResponseCache` stores decoded responses of `GET` requests for routes that have a TTL policy,
+Any request for the same route, query parameters and authorization is then served from the
+cache until the entry expires.
+
+Responses of requests made with an access token are keyed by a hash of that token,
+So one user's data is never served to another.
+
+Example
+-------
+```py
+import aiobungie
+from aiobungie import builders, cache
+
+response_cache = cache.ResponseCache(cache.MemoryCache(max_size=4096))
+client = aiobungie.Client(
+    "token", settings=builders.Settings(response_cache=response_cache)
+)
+
+async with client.rest:
+    # The first call is an HTTP request, The second one is served from the cache.
+    await client.fetch_inventory_item(1216319404)
+    await client.fetch_inventory_item(1216319404)
+
+    # Drop this entry from the cache.
+    await response_cache.invalidate("Destiny2/Manifest/DestinyInventoryItemDefinition/1216319404")
+```
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "CacheBackend",
+    "MemoryCache",
+    "SQLiteCache",
+    "ResponseCache",
+    "ImageCache",
+    "DEFAULT_POLICIES",
+)
+
+import abc
+import asyncio
+import fnmatch
+import hashlib
+import os
+import pathlib
+import re
+import sqlite3
+import threading
+import time
+import typing
+import urllib.parse
+
+from aiobungie.internal import _ratelimit as ratelimit
+from aiobungie.internal import helpers
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+    from aiobungie import typedefs
+
+DEFAULT_POLICIES: typing.Final[collections.Mapping[str, float]] = {
+    "Destiny2/Manifest/*": 3600.0,
+    "Destiny2/Stats/Definition": 86400.0,
+    "Destiny2/Clan/ClanBannerDictionary": 86400.0,
+    "User/GetAvailableThemes": 86400.0,
+    "GroupV2/GetAvailableAvatars": 86400.0,
+}
+"""The default TTL policies in seconds.
+
+These cover the definition endpoints, i.e., `fetch_entity`, `fetch_historical_definition`,
+`fetch_clan_banners` and friends which only change with a new manifest version.
+"""
+
+
+class CacheBackend(abc.ABC):
+    """An interface for the storage of a `ResponseCache`.
+
+    Implement this to store the responses somewhere else, i.e., Redis or Memcached.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def get(self, key: str, /) -> typedefs.JSONIsh:
+        """Return the value stored under `key`, Or `None` if it's missing or expired."""
+
+    @abc.abstractmethod
+    async def set(self, key: str, value: typedefs.JSONIsh, /, ttl: float) -> None:
+        """Store `value` under `key` for `ttl` seconds."""
+
+    @abc.abstractmethod
+    async def delete(self, key: str, /) -> None:
+        """Delete the value stored under `key` if it exists."""
+
+    @abc.abstractmethod
+    async def clear(self) -> None:
+        """Delete all the stored values."""
+
+    def close(self) -> None:
+        """Release any resources held by this backend."""
+
+
+@typing.final
+class MemoryCache(CacheBackend):
+    """An in-memory cache backend with LRU eviction.
+
+    Values are stored as is, So a cache hit costs no decoding.
+
+    Parameters
+    ----------
+    max_size : `int`
+        The maximum number of entries to keep, The least recently used entry
+        is evicted when this is exceeded. Defaults to `1024`.
+    """
+
+    __slots__ = ("_max_size", "_entries")
+
+    def __init__(self, max_size: int = 1024) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self._max_size = max_size
+        # Dicts keep their insertion order, The first key is the least recently used.
+        self._entries: dict[str, tuple[float, typedefs.JSONIsh]] = {}
+
+    async def get(self, key: str, /) -> typedefs.JSONIsh:
+        if (entry := self._entries.get(key)) is None:
+            return None
+
+        expires_at, value = entry
+        del self._entries[key]
+        if expires_at <= time.monotonic():
+            return None
+
+        self._entries[key] = entry
+        return value
+
+    async def set(self, key: str, value: typedefs.JSONIsh, /, ttl: float) -> None:
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        while len(self._entries) > self._max_size:
+            del self._entries[next(iter(self._entries))]
+
+    async def delete(self, key: str, /) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_SCHEMA: typing.Final[str] = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+@typing.final
+class SQLiteCache(CacheBackend):
+    """An on-disk cache backend stored in an SQLite database.
+
+    The cache outlives the process, And can be shared between processes on the same host.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike[str]`
+        The path to the database file, It's created if it doesn't exist.
+    max_size : `int`
+        The maximum number of entries to keep, The least recently used entries
+        are evicted when this is exceeded. Defaults to `10000`.
+    dumps : `aiobungie.typedefs.Dumps`
+        The function used to encode the stored values.
+    loads : `aiobungie.typedefs.Loads`
+        The function used to decode the stored values.
+    """
+
+    __slots__ = ("_max_size", "_connection", "_lock", "_dumps", "_loads")
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        max_size: int = 10_000,
+        dumps: typedefs.Dumps = helpers.dumps,
+        loads: typedefs.Loads = helpers.loads,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self._max_size = max_size
+        self._dumps = dumps
+        self._loads = loads
+        self._connection = sqlite3.connect(
+            pathlib.Path(path), isolation_level=None, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        # The connection is used from the executor's threads.
+        self._lock = threading.Lock()
+
+    def _get(self, key: str) -> bytes | None:
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            if row[1] <= now:
+                self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+                return None
+
+            self._connection.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            return row[0]
+
+    def _set(self, key: str, value: bytes, ttl: float) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, value, now + ttl, now),
+            )
+            self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ? OR key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at "
+                "LIMIT MAX(0, (SELECT COUNT(*) FROM responses) - ?))",
+                (now, self._max_size),
+            )
+
+    def _execute(self, sql: str, *args: typing.Any) -> None:
+        with self._lock:
+            self._connection.execute(sql, args)
+
+    async def get(self, key: str, /) -> typedefs.JSONIsh:
+        value = await asyncio.get_running_loop().run_in_executor(None, self._get, key)
+        if value is None:
+            return None
+        return self._loads(value)
+
+    async def set(self, key: str, value: typedefs.JSONIsh, /, ttl: float) -> None:
+        encoded = self._dumps(value)  # type: ignore[arg-type]
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._set, key, encoded, ttl
+        )
+
+    async def delete(self, key: str, /) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._execute, "DELETE FROM responses WHERE key = ?", key
+        )
+
+    async def clear(self) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._execute, "DELETE FROM responses"
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
+
+
+_PARTIAL_SUFFIX: typing.Final[str] = ".partial"
+_IMAGE_NAME: typing.Final[re.Pattern[str]] = re.compile(
+    r"[0-9a-f]{64}(?:\.\d+\.\d+\.partial)?"
+)
+"""Matches the names of the files `ImageCache` writes, Stored images and their partial writes."""
+
+
+@typing.final
+class ImageCache:
+    """A content-addressed on-disk cache for the bytes of `aiobungie.builders.Image`.
+
+    Each image is stored in its own file named after the SHA-256 hash of its path,
+    Set this to `aiobungie.builders.Settings.image_cache` to have images read and saved
+    while a client is open served from the disk instead of downloaded again.
+
+    Example
+    -------
+    ```py
+    import aiobungie
+    from aiobungie import builders, cache
+
+    client = aiobungie.Client(
+        "token", settings=builders.Settings(image_cache=cache.ImageCache("icons/"))
+    )
+
+    async with client.rest:
+        item = await client.fetch_inventory_item(1216319404)
+        # Downloaded once, Every read after that is served from `icons/`.
+        data = await item.icon.read()
+    ```
+
+    Parameters
+    ----------
+    path : `str | os.PathLike[str]`
+        The directory to store the images in, It's created if it doesn't exist.
+    max_size : `int`
+        The maximum total size of the stored images in bytes, The least recently used images
+        are evicted when this is exceeded. Defaults to `512` MiB.
+    """
+
+    __slots__ = ("_directory", "_max_size", "_lock", "_entries", "_size")
+
+    def __init__(
+        self, path: str | os.PathLike[str], *, max_size: int = 512 * 1024 * 1024
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be greater than 0.")
+
+        self._directory = pathlib.Path(path)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        # The files are read and written from the executor's threads.
+        self._lock = threading.Lock()
+
+        # Dicts keep their insertion order, The first name is the least recently used.
+        self._entries: dict[str, int] = {}
+        self._size = 0
+        files: list[pathlib.Path] = []
+        for file in self._directory.iterdir():
+            if not file.is_file() or not _IMAGE_NAME.fullmatch(file.name):
+                # Anything the cache didn't write is left alone.
+                continue
+
+            if file.suffix == _PARTIAL_SUFFIX:
+                # A partial write that was interrupted.
+                file.unlink(missing_ok=True)
+            else:
+                files.append(file)
+
+        for file in sorted(files, key=lambda file: file.stat().st_mtime):
+            self._entries[file.name] = size = file.stat().st_size
+            self._size += size
+
+    @property
+    def size(self) -> int:
+        """The total size of the stored images in bytes."""
+        return self._size
+
+    @staticmethod
+    def _name(key: str) -> str:
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def _get(self, key: str) -> bytes | None:
+        name = self._name(key)
+        with self._lock:
+            if (size := self._entries.pop(name, None)) is None:
+                return None
+
+            file = self._directory / name
+            try:
+                data = file.read_bytes()
+                # The modification time keeps the recently used order between runs.
+                file.touch()
+            except FileNotFoundError:
+                self._size -= size
+                return None
+
+            self._entries[name] = size
+            return data
+
+    def _set(self, key: str, value: bytes) -> None:
+        if len(value) > self._max_size:
+            return
+
+        name = self._name(key)
+        # Written to a temporary file first, So a crash never leaves a partial image behind.
+        # Named after the writer, Since other processes may share the directory.
+        partial = (
+            self._directory
+            / f"{name}.{os.getpid()}.{threading.get_ident()}{_PARTIAL_SUFFIX}"
+        )
+        partial.write_bytes(value)
+        with self._lock:
+            try:
+                partial.replace(self._directory / name)
+            except FileNotFoundError:
+                # Removed by another process that opened a cache in the same directory.
+                return
+
+            self._size += len(value) - self._entries.pop(name, 0)
+            self._entries[name] = len(value)
+
+            while self._size > self._max_size:
+                evicted = next(iter(self._entries))
+                self._size -= self._entries.pop(evicted)
+                (self._directory / evicted).unlink(missing_ok=True)
+
+    def _delete(self, key: str) -> None:
+        name = self._name(key)
+        with self._lock:
+            if (size := self._entries.pop(name, None)) is not None:
+                self._size -= size
+                (self._directory / name).unlink(missing_ok=True)
+
+    def _clear(self) -> None:
+        with self._lock:
+            for name in self._entries:
+                (self._directory / name).unlink(missing_ok=True)
+            self._entries.clear()
+            self._size = 0
+
+    async def get(self, key: str, /) -> bytes | None:
+        """Return the stored bytes of the image at `key`, Or `None` if it's not stored."""
+        return await asyncio.get_running_loop().run_in_executor(None, self._get, key)
+
+    async def set(self, key: str, value: bytes, /) -> None:
+        """Store the bytes of the image at `key`, Evicting the least recently used images if needed."""
+        await asyncio.get_running_loop().run_in_executor(None, self._set, key, value)
+
+    async def delete(self, key: str, /) -> None:
+        """Remove the image at `key` if it's stored."""
+        await asyncio.get_running_loop().run_in_executor(None, self._delete, key)
+
+    async def clear(self) -> None:
+        """Remove all of the stored images."""
+        await asyncio.get_running_loop().run_in_executor(None, self._clear)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@typing.final
+class ResponseCache:
+    """Caches the decoded responses of `GET` requests based on per-route TTL policies.
+
+    Set this to `aiobungie.builders.Settings.response_cache` to enable it, When using
+    `aiobungie.RESTPool` the cache is shared between all clients acquired from the pool.
+
+    Parameters
+    ----------
+    backend : `CacheBackend | None`
+        Where the responses are stored. If `None`, A `MemoryCache` with the default size will be used.
+    policies : `collections.Mapping[str, float]`
+        A mapping of route patterns to how many seconds the responses of matching routes are cached for.
+        Patterns are `fnmatch` patterns matched against the route with its numeric segments replaced
+        by `{}` and without the query string, i.e., `Destiny2/Manifest/DestinyInventoryItemDefinition/{}`.
+        Routes that don't match any pattern are never cached. Defaults to `DEFAULT_POLICIES`.
+    """
+
+    __slots__ = ("_backend", "_policies")
+
+    def __init__(
+        self,
+        backend: CacheBackend | None = None,
+        policies: collections.Mapping[str, float] = DEFAULT_POLICIES,
+    ) -> None:
+        self._backend = backend or MemoryCache()
+        self._policies = dict(policies)
+
+    @property
+    def backend(self) -> CacheBackend:
+        """The backend the responses are stored in."""
+        return self._backend
+
+    @property
+    def policies(self) -> collections.MutableMapping[str, float]:
+        """A mutable mapping of the route patterns to their TTL in seconds."""
+        return self._policies
+
+    def ttl_for(self, route: str, /) -> float:
+        """Return how many seconds the response of `route` is cached for, `0` if it's never cached."""
+        key = ratelimit.route_key(route)
+        for pattern, ttl in self._policies.items():
+            if fnmatch.fnmatchcase(key, pattern):
+                return ttl
+        return 0.0
+
+    @staticmethod
+    def make_key(
+        route: str,
+        /,
+        params: collections.Mapping[str, typing.Any] | None = None,
+        auth: str | None = None,
+        base: bool = False,
+    ) -> str:
+        """Build the key a response is stored under.
+
+        `base` routes are relative to `aiobungie.url.BASE` instead of the REST endpoint,
+        So they're stored apart from the REST routes with the same path.
+        """
+        scope = hashlib.sha256(auth.encode()).hexdigest() if auth else "public"
+        query = urllib.parse.urlencode(sorted(params.items())) if params else ""
+        root = "base" if base else "platform"
+        return f"{scope}:{root}:{route.strip('/')}?{query}"
+
+    async def get(
+        self,
+        route: str,
+        /,
+        *,
+        params: collections.Mapping[str, typing.Any] | None = None,
+        auth: str | None = None,
+        base: bool = False,
+    ) -> typedefs.JSONIsh:
+        """Return the cached response for this request, Or `None` if it's not cached."""
+        if not self.ttl_for(route):
+            return None
+        return await self._backend.get(self.make_key(route, params, auth, base))
+
+    async def set(
+        self,
+        route: str,
+        value: typedefs.JSONIsh,
+        /,
+        *,
+        params: collections.Mapping[str, typing.Any] | None = None,
+        auth: str | None = None,
+        base: bool = False,
+    ) -> None:
+        """Cache the response of this request if its route has a TTL policy."""
+        if ttl := self.ttl_for(route):
+            await self._backend.set(
+                self.make_key(route, params, auth, base), value, ttl=ttl
+            )
+
+    async def invalidate(
+        self,
+        route: str,
+        /,
+        *,
+        params: collections.Mapping[str, typing.Any] | None = None,
+        auth: str | None = None,
+        base: bool = False,
+    ) -> None:
+        """Drop the cached response of this request."""
+        await self._backend.delete(self.make_key(route, params, auth, base))
+
+    async def clear(self) -> None:
+        """Drop all the cached responses."""
+        await self._backend.clear()
@@ -26,20 +26,29 @@ from __future__ import annotations
 
 __all__ = ("Client",)
 
+import asyncio
+import concurrent.futures
+import contextlib
+import functools
 import typing
 
 import sain
 
-from aiobungie import framework
+from aiobungie import error, pagination
+from aiobungie import framework as framework_
 from aiobungie import rest as rest_
 from aiobungie import traits
 from aiobungie.crates import fireteams, user
+from aiobungie.internal import _bodies as response_bodies
+from aiobungie.internal import _images as image_sessions
 from aiobungie.internal import enums, helpers
 
 if typing.TYPE_CHECKING:
     import collections.abc as collections
+    import datetime
 
-    from aiobungie import api, builders
+    from aiobungie import api, builders, decoding, typedefs
+    from aiobungie import manifest as manifest_
     from aiobungie.crates import (
         activity,
         application,
@@ -52,6 +61,55 @@ if typing.TYPE_CHECKING:
     )
 
 
+def _run_deserializer(
+    framework: api.Framework, method: str, payload: typedefs.JSONIsh, many: bool
+) -> typing.Any:
+    deserialize = getattr(framework, method)
+    if many:
+        return {int(key): deserialize(value) for key, value in payload.items()}  # type: ignore[union-attr]
+    return deserialize(payload)
+
+
+_worker_framework: api.Framework | None = None
+"""The framework of a process pool worker created by `Client.process_pool`."""
+
+_worker_loads: typedefs.Loads | None = None
+"""The JSON loader of a process pool worker created by `Client.process_pool`."""
+
+
+def _init_worker(framework: api.Framework, loads: typedefs.Loads, /) -> None:
+    # Runs once in each worker process when it starts.
+    global _worker_framework, _worker_loads
+    _worker_framework = framework
+    _worker_loads = loads
+
+
+def _deserialize_offloaded(
+    framework: api.Framework | None,
+    loads: typedefs.Loads | None,
+    method: str,
+    payload: typedefs.JSONIsh | bytes,
+    *,
+    raw: bool = False,
+    many: bool = False,
+) -> tuple[typing.Any, bool]:
+    # This runs inside the executor, Possibly in another process.
+    if framework is None or loads is None:
+        assert _worker_framework is not None and _worker_loads is not None, (
+            "The worker wasn't initialized."
+        )
+        framework, loads = _worker_framework, _worker_loads
+
+    if raw:
+        payload = loads(payload)["Response"]  # type: ignore
+
+    result = _run_deserializer(framework, method, payload, many)  # type: ignore[arg-type]
+    if isinstance(result, sain.Iter):
+        # Lazy iterators can't be sent back from another process.
+        return result.collect(), True  # pyright: ignore
+    return result, False
+
+
 class Client(traits.Compact):
     """Compact standard client implementation.
 
@@ -93,9 +151,46 @@ class Client(traits.Compact):
         The max retries number to retry if the request hit a `5xx` status code.
     debug: `"TRACE" | bool | int`
         The level of logging to enable.
+    manifest : `aiobungie.manifest.BaseManifest | None`
+        An optional local manifest, If set, Entity definitions are looked up in it first
+        and only requested over HTTP if they're not found. See `Client.manifest`.
+    executor : `concurrent.futures.Executor | None`
+        An optional executor to run the heavy deserializers in, i.e., Profile components,
+        Post activities, Clan members and inventory entities. This keeps the event loop free
+        to serve other requests while large responses are being deserialized.
+
+        With a `concurrent.futures.ProcessPoolExecutor`, The raw response bodies are sent to the worker
+        and the deserialized objects are sent back. Any other executor receives the payloads as-is.
+        See `Client.process_pool` to create a process pool whose workers keep this client's framework.
+    offload_threshold : `int`
+        The size in bytes of the response body below which it's deserialized on the
+        event loop even if an `executor` is set. Payloads that weren't read from a response body,
+        i.e. ones served from a local manifest or `Settings.response_cache`, Are always deserialized
+        on the event loop. Defaults to `262144` (256 KiB).
+    decoder : `aiobungie.decoding.TypedDecoder | None`
+        An optional typed decoder, If set, Clan members, Activity history and post activity
+        responses are decoded with it, Skipping the keys its framework doesn't read.
+        This requires `msgspec` to be installed.
+    framework : `aiobungie.api.Framework | None`
+        An optional framework to deserialize the responses with, i.e., `aiobungie.framework.GeneratedFramework`.
+        If `None`, A default `aiobungie.framework.Framework` is used. The images it deserializes are fetched
+        with this client's HTTP session and `Settings.image_cache`.
+    loads : `aiobungie.typedefs.Loads`
+        The function to load JSON response bodies with, Defaults to `json.loads` or `orjson.loads` if installed.
+        Raw bodies sent to a process pool are loaded with it in the worker, So it has to be picklable there,
+        i.e. a module-level function.
     """
 
-    __slots__ = ("_rest", "_framework")
+    __slots__ = (
+        "_rest",
+        "_framework",
+        "_manifest",
+        "_executor",
+        "_worker_pool",
+        "_offload_threshold",
+        "_decoder",
+        "_loads",
+    )
 
     def __init__(
         self,
@@ -107,7 +202,14 @@ class Client(traits.Compact):
         settings: builders.Settings | None = None,
         max_retries: int = 4,
         debug: typing.Literal["TRACE"] | bool | int = False,
+        manifest: manifest_.BaseManifest | None = None,
+        executor: concurrent.futures.Executor | None = None,
+        offload_threshold: int = 256 * 1024,
+        decoder: decoding.TypedDecoder | None = None,
+        framework: api.Framework | None = None,
+        loads: typedefs.Loads = helpers.loads,
     ) -> None:
+        images = image_sessions.Source(settings.image_cache if settings else None)
         self._rest = rest_.RESTClient(
             token,
             client_secret=client_secret,
@@ -115,14 +217,53 @@ class Client(traits.Compact):
             settings=settings,
             max_retries=max_retries,
             debug=debug,
+            loads=loads,
+            images=images,
         )
 
-        self._framework = framework.Framework()
+        self._framework = framework if framework is not None else framework_.Framework()
+        # The images this client deserializes reuse its session and image cache.
+        for framework_in_use in (
+            self._framework,
+            decoder.framework if decoder is not None else None,
+        ):
+            if isinstance(framework_in_use, framework_.Framework):
+                framework_in_use._fetch_images_with(images)  # pyright: ignore[reportPrivateUsage]
+
+        self._manifest = manifest
+        self._executor = executor
+        self._worker_pool: concurrent.futures.ProcessPoolExecutor | None = None
+        self._offload_threshold = offload_threshold
+        self._decoder = decoder
+        self._loads = loads
 
     @property
     def framework(self) -> api.Framework:
         return self._framework
 
+    @property
+    def manifest(self) -> manifest_.BaseManifest | None:
+        """The local manifest entity definitions are looked up in first, If set.
+
+        This can be set at any time, i.e., after the manifest has been downloaded.
+
+        Example
+        -------
+        ```py
+        async with client.rest:
+            path = await client.rest.download_sqlite_manifest(sync=True)
+            client.manifest = aiobungie.manifest.Manifest(path)
+
+            # Served from the local manifest.
+            item = await client.fetch_inventory_item(1216319404)
+        ```
+        """
+        return self._manifest
+
+    @manifest.setter
+    def manifest(self, manifest: manifest_.BaseManifest | None) -> None:
+        self._manifest = manifest
+
     @property
     def rest(self) -> api.RESTClient:
         return self._rest
@@ -135,6 +276,82 @@ class Client(traits.Compact):
     def settings(self) -> builders.Settings:
         return self._rest.settings
 
+    def process_pool(
+        self, max_workers: int | None = None, /
+    ) -> concurrent.futures.ProcessPoolExecutor:
+        """Create a process pool to deserialize in and set it as this client's executor.
+
+        Each worker receives this client's framework and `loads` once when it starts instead of with every payload,
+        So its interned strings are kept between payloads. The pool should be shut down once the client is done.
+
+        Example
+        -------
+        ```py
+        client = aiobungie.Client("token")
+        with client.process_pool(4):
+            async with client.rest:
+                profile = await client.fetch_profile(...)
+        ```
+
+        Parameters
+        ----------
+        max_workers : `int | None`
+            The maximum number of worker processes, Defaults to the number of processors.
+
+        Returns
+        -------
+        `concurrent.futures.ProcessPoolExecutor`
+            The created process pool.
+        """
+        pool = concurrent.futures.ProcessPoolExecutor(
+            max_workers,
+            initializer=_init_worker,
+            initargs=(self._framework, self._loads),
+        )
+        self._executor = self._worker_pool = pool
+        return pool
+
+    async def _deserialize(
+        self,
+        method: str,
+        payload: typedefs.JSONIsh,
+        /,
+        *,
+        body: response_bodies.Body | None = None,
+        many: bool = False,
+    ) -> typing.Any:
+        if (
+            self._executor is None
+            or body is None
+            or body.size is None
+            or body.size < self._offload_threshold
+        ):
+            return _run_deserializer(self._framework, method, payload, many)
+
+        # Processes don't share memory, Sending the raw body is much cheaper than pickling the objects.
+        raw = (
+            body.raw is not None
+            and not many
+            and isinstance(self._executor, concurrent.futures.ProcessPoolExecutor)
+        )
+        result, lazy = await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            functools.partial(
+                _deserialize_offloaded,
+                # Workers of `process_pool` already have the framework and loads.
+                *(
+                    (None, None)
+                    if self._executor is self._worker_pool
+                    else (self._framework, self._loads)
+                ),
+                method,
+                body.raw if raw else payload,
+                raw=raw,
+                many=many,
+            ),
+        )
+        return sain.Iter(result) if lazy else result
+
     # * User methods.
 
     async def fetch_current_user_memberships(self, access_token: str, /) -> user.User:
@@ -240,8 +457,10 @@ class Client(traits.Compact):
 
         return user.HardLinkedMembership(
             id=int(payload["membershipId"]),
-            type=enums.MembershipType(payload["membershipType"]),
-            cross_save_type=enums.MembershipType(payload["CrossSaveOverriddenType"]),
+            type=enums.decode(enums.MembershipType, payload["membershipType"]),
+            cross_save_type=enums.decode(
+                enums.MembershipType, payload["CrossSaveOverriddenType"]
+            ),
         )
 
     async def fetch_membership_from_id(
@@ -324,13 +543,37 @@ class Client(traits.Compact):
 
     # * Destiny 2.
 
+    @typing.overload
+    async def fetch_profile(
+        self,
+        member_id: int,
+        type: enums.MembershipType | int,
+        components: collections.Sequence[enums.ComponentType],
+        auth: str | None = None,
+        *,
+        lazy: typing.Literal[False] = False,
+    ) -> components.Component: ...
+
+    @typing.overload
     async def fetch_profile(
         self,
         member_id: int,
         type: enums.MembershipType | int,
         components: collections.Sequence[enums.ComponentType],
         auth: str | None = None,
-    ) -> components.Component:
+        *,
+        lazy: typing.Literal[True],
+    ) -> components.LazyComponent: ...
+
+    async def fetch_profile(
+        self,
+        member_id: int,
+        type: enums.MembershipType | int,
+        components: collections.Sequence[enums.ComponentType],
+        auth: str | None = None,
+        *,
+        lazy: bool = False,
+    ) -> components.Component | components.LazyComponent:
         """Fetch a Bungie profile with the required components.
 
         Example
@@ -362,10 +605,14 @@ class Client(traits.Compact):
         auth : `str | None`
             A Bearer access_token to make the request with.
             This is optional and limited to components that only requires an Authorization token.
+        lazy : `bool`
+            If set to `True`, A `aiobungie.crates.LazyComponent` is returned instead,
+            Which only deserializes each component the first time it is accessed.
+            Defaults to `False`.
 
         Returns
         --------
-        `aiobungie.crates.Component`
+        `aiobungie.crates.Component | aiobungie.crates.LazyComponent`
             A Destiny 2 player profile with its components.
             Only passed components will be available if they exists. Otherwise they will be `None`
 
@@ -374,8 +621,13 @@ class Client(traits.Compact):
         `aiobungie.MembershipTypeError`
             The provided membership type was invalid.
         """
-        data = await self._rest.fetch_profile(member_id, type, components, auth)
-        return self._framework.deserialize_components(data)
+        with response_bodies.measure() as body:
+            data = await self._rest.fetch_profile(member_id, type, components, auth)
+
+        if lazy:
+            return self._framework.deserialize_lazy_components(data)
+
+        return await self._deserialize("deserialize_components", data, body=body)
 
     async def fetch_linked_profiles(
         self,
@@ -501,11 +753,14 @@ class Client(traits.Compact):
         `aiobungie.MembershipTypeError`
             The provided membership type was invalid.
         """
-        resp = await self._rest.fetch_character(
-            member_id, membership_type, character_id, components, auth
-        )
+        with response_bodies.measure() as body:
+            resp = await self._rest.fetch_character(
+                member_id, membership_type, character_id, components, auth
+            )
 
-        return self._framework.deserialize_character_component(resp)
+        return await self._deserialize(
+            "deserialize_character_component", resp, body=body
+        )
 
     async def fetch_unique_weapon_history(
         self,
@@ -580,6 +835,18 @@ class Client(traits.Compact):
         `aiobungie.MembershipTypeError`
             The provided membership type was invalid.
         """
+        if self._decoder is not None:
+            activities: typing.Any = await self._rest.fetch_activities(
+                member_id,
+                character_id,
+                mode,
+                membership_type=membership_type,
+                page=page,
+                limit=limit,
+                decode=self._decoder.decode_activities,
+            )
+            return sain.Iter(activities)
+
         resp = await self._rest.fetch_activities(
             member_id,
             character_id,
@@ -591,6 +858,107 @@ class Client(traits.Compact):
 
         return self._framework.deserialize_activities(resp)
 
+    async def stream_activities(
+        self,
+        member_id: int,
+        character_id: int,
+        mode: enums.GameMode | int,
+        membership_type: enums.MembershipType | int,
+        *,
+        since: datetime.datetime | None = None,
+        last_instance_id: int | None = None,
+        limit: int = 250,
+        look_ahead: int = 2,
+    ) -> collections.AsyncGenerator[activity.Activity, None]:
+        """Stream a character's activity history, From the most recent activity to the oldest.
+
+        Pages are fetched ahead of the one being yielded, Streaming stops at the end of the history
+        or at the first activity that reaches `since` or `last_instance_id`, The pages
+        fetched ahead of it are then cancelled.
+
+        Example
+        -------
+        ```py
+        last_week = datetime.datetime.now(datetime.UTC) - datetime.timedelta(days=7)
+        async for activity in client.stream_activities(
+            4611686018484639825,
+            2305843009444904605,
+            aiobungie.GameMode.RAID,
+            aiobungie.MembershipType.STEAM,
+            since=last_week,
+        ):
+            print(activity.instance_id, activity.occurred_at)
+        ```
+
+        Parameters
+        ----------
+        member_id: `int`
+            The user id that starts with `4611`.
+        character_id: `int`
+            The id of the character to retrieve the activities for.
+        mode: `aiobungie.aiobungie.internal.enums.GameMode | int`
+            This parameter filters the game mode, Nightfall, Strike, Iron Banner, etc.
+        membership_type: `aiobungie.internal.enums.MembershipType`
+            The Destiny 2 membership type.
+
+        Other Parameters
+        ----------------
+        since : `datetime.datetime | None`
+            A timezone aware datetime, If provided, Activities that occurred before it aren't yielded.
+        last_instance_id : `int | None`
+            The instance id of an already known activity, i.e. The most recent activity from a previous run,
+            If provided, This activity and the ones before it aren't yielded.
+        limit : `int`
+            The number of activities to request per page. Default is `250`.
+        look_ahead : `int`
+            How many pages to fetch concurrently ahead of the one being yielded. Default is `2`.
+
+        Returns
+        -------
+        `collections.AsyncGenerator[aiobungie.crates.Activity, None]`
+            An async generator of the player's activities.
+
+        Raises
+        ------
+        `ValueError`
+            `since` is not timezone aware.
+        `aiobungie.MembershipTypeError`
+            The provided membership type was invalid.
+        """
+        if since is not None and since.tzinfo is None:
+            # Activity dates are in UTC and can't be compared with a naive datetime.
+            raise ValueError("since must be a timezone aware datetime.")
+
+        async def fetch_page(page: int) -> list[activity.Activity]:
+            # Collected, Since an iterator page is consumed once the paginator has looked at it.
+            activities = await self.fetch_activities(
+                member_id,
+                character_id,
+                mode,
+                membership_type,
+                page=page,
+                limit=limit,
+            )
+            return activities.collect()
+
+        paginator = pagination.Paginator(fetch_page, look_ahead=look_ahead)
+        async with contextlib.aclosing(paginator.pages()) as pages:
+            async for page in pages:
+                count = 0
+                for activity_ in page:
+                    if since is not None and activity_.occurred_at < since:
+                        return
+
+                    if activity_.instance_id == last_instance_id:
+                        return
+
+                    count += 1
+                    yield activity_
+
+                # A page that isn't full is the last one.
+                if count < limit:
+                    return
+
     async def fetch_post_activity(self, instance_id: int, /) -> activity.PostActivity:
         """Fetch a post activity details.
 
@@ -604,9 +972,16 @@ class Client(traits.Compact):
         `aiobungie.crates.PostActivity`
            A post activity object.
         """
-        resp = await self._rest.fetch_post_activity(instance_id)
+        if self._decoder is not None:
+            post_activity: typing.Any = await self._rest.fetch_post_activity(
+                instance_id, decode=self._decoder.decode_post_activity
+            )
+            return post_activity
 
-        return self._framework.deserialize_post_activity(resp)
+        with response_bodies.measure() as body:
+            resp = await self._rest.fetch_post_activity(instance_id)
+
+        return await self._deserialize("deserialize_post_activity", resp, body=body)
 
     async def fetch_aggregated_activity_stats(
         self,
@@ -831,6 +1206,74 @@ class Client(traits.Compact):
             self._framework.deserialize_group_member(group) for group in resp["results"]
         )
 
+    async def _fetch_clan_members_page(
+        self,
+        clan_id: int,
+        page: int,
+        name: str | None,
+        type: enums.MembershipType | int,
+    ) -> tuple[typedefs.JSONObject, collections.Sequence[clans.ClanMember]]:
+        if self._decoder is not None:
+            page_ = await self._rest.fetch_clan_members(
+                clan_id,
+                type=type,
+                name=name,
+                page=page,
+                decode=self._decoder.decode_clan_members,
+            )
+            return page_, page_["results"]
+
+        with response_bodies.measure() as body:
+            resp = await self._rest.fetch_clan_members(
+                clan_id, type=type, name=name, page=page
+            )
+
+        members: sain.Iterator[clans.ClanMember] = await self._deserialize(
+            "deserialize_clan_members", resp, body=body
+        )
+        return resp, members.collect()
+
+    async def _clan_member_pages(
+        self, clan_id: int, name: str | None, type: enums.MembershipType | int
+    ) -> collections.AsyncGenerator[
+        tuple[int, collections.Sequence[clans.ClanMember]], None
+    ]:
+        resp, members = await self._fetch_clan_members_page(clan_id, 1, name, type)
+        yield 1, members
+        if not resp.get("hasMore") or not members:
+            return
+
+        # The first page tells how many pages there are, So the rest are fetched concurrently.
+        last = max(-(-int(resp.get("totalResults", 0)) // len(members)), 2)
+
+        async def fetch_page(
+            page: int,
+        ) -> tuple[int, typedefs.JSONObject, collections.Sequence[clans.ClanMember]]:
+            return page, *await self._fetch_clan_members_page(clan_id, page, name, type)
+
+        pending = [
+            asyncio.ensure_future(fetch_page(page)) for page in range(2, last + 1)
+        ]
+        try:
+            for future in asyncio.as_completed(pending):
+                page, _, members = await future
+                yield page, members
+
+            _, resp, members = pending[-1].result()
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        # Members may have joined since the first page, Any pages after it are fetched one by one.
+        page = last
+        while resp.get("hasMore") and members:
+            page += 1
+            resp, members = await self._fetch_clan_members_page(
+                clan_id, page, name, type
+            )
+            yield page, members
+
     async def fetch_clan_members(
         self,
         clan_id: int,
@@ -839,7 +1282,9 @@ class Client(traits.Compact):
         name: str | None = None,
         type: enums.MembershipType | int = enums.MembershipType.NONE,
     ) -> sain.Iterator[clans.ClanMember]:
-        """Fetch Bungie clan members.
+        """Fetch all of the members of a Bungie clan.
+
+        All of the roster's pages are fetched, The pages after the first one concurrently.
 
         Parameters
         ----------
@@ -866,9 +1311,60 @@ class Client(traits.Compact):
         `aiobungie.NotFound`
             The clan was not found.
         """
-        resp = await self._rest.fetch_clan_members(clan_id, type=type, name=name)
+        pages: dict[int, collections.Sequence[clans.ClanMember]] = {}
+        async for page, members in self._clan_member_pages(clan_id, name, type):
+            pages[page] = members
 
-        return self._framework.deserialize_clan_members(resp)
+        return sain.Iter(member for page in sorted(pages) for member in pages[page])
+
+    async def stream_clan_members(
+        self,
+        clan_id: int,
+        /,
+        *,
+        name: str | None = None,
+        type: enums.MembershipType | int = enums.MembershipType.NONE,
+    ) -> collections.AsyncGenerator[clans.ClanMember, None]:
+        """Stream the members of a Bungie clan as their pages arrive.
+
+        The first page is yielded as soon as it arrives, The pages after it are then fetched
+        concurrently and yielded in the order they arrive in.
+
+        Example
+        -------
+        ```py
+        async for member in client.stream_clan_members(4389205):
+            print(member.last_seen_name)
+        ```
+
+        Parameters
+        ----------
+        clan_id : `int`
+            The clans id
+
+        Other Parameters
+        ----------------
+        name : `str | None`
+            If provided, Only players matching this name will be returned.
+        type : `aiobungie.MembershipType`
+            An optional clan member's membership type to filter the members by.
+
+        Returns
+        -------
+        `collections.AsyncGenerator[aiobungie.crates.ClanMember, None]`
+            An async generator of the clan members.
+
+        Raises
+        ------
+        `aiobungie.NotFound`
+            The clan was not found.
+        """
+        async with contextlib.aclosing(
+            self._clan_member_pages(clan_id, name, type)
+        ) as pages:
+            async for _, members in pages:
+                for member in members:
+                    yield member
 
     async def fetch_clan_banners(self) -> collections.Sequence[clans.ClanBanner]:
         """Fetch the clan banners.
@@ -1017,6 +1513,9 @@ class Client(traits.Compact):
     async def fetch_inventory_item(self, hash: int, /) -> entity.InventoryEntity:
         """Fetch a static inventory item entity given a its hash.
 
+        If `Client.manifest` is set, The item is looked up there first. It's requested over HTTP
+        if it isn't found, Or if the manifest doesn't have the inventory item definitions.
+
         Parameters
         ----------
         hash: `int`
@@ -1027,13 +1526,104 @@ class Client(traits.Compact):
         `aiobungie.crates.InventoryEntity`
             A bungie inventory item.
         """
-        resp = await self._rest.fetch_inventory_item(hash)
+        resp = (
+            await self._from_manifest("DestinyInventoryItemDefinition", (hash,))
+        ).get(hash)
+
+        body = None
+        if resp is None:
+            with response_bodies.measure() as body:
+                resp = await self._rest.fetch_inventory_item(hash)
+
+        return await self._deserialize("deserialize_inventory_entity", resp, body=body)
+
+    async def _from_manifest(
+        self, definition: str, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, typedefs.JSONObject]:
+        # Looks up the definitions in the manifest, If it's set and has them.
+        if self._manifest is None:
+            return {}
+
+        try:
+            return await self._manifest.fetch_many(definition, hashes)
+        except error.MissingDefinitionError:
+            # The manifest doesn't have this definition, i.e. a `MappedManifest` over a
+            # partial file. The API still has it, So it's requested over HTTP instead.
+            return {}
+
+    async def _fetch_definitions(
+        self,
+        definition: str,
+        hashes: collections.Iterable[int],
+        fetch: collections.Callable[[int], collections.Awaitable[typedefs.JSONObject]],
+        method: str,
+        /,
+    ) -> typing.Any:
+        hashes = tuple(dict.fromkeys(hashes))
+        payloads = dict(await self._from_manifest(definition, hashes))
+
+        # The bodies of the definitions that were requested, Their sizes add up to the size of the payload.
+        bodies: list[response_bodies.Body] = []
+
+        async def fetch_one(hash: int) -> None:
+            try:
+                with response_bodies.measure() as body:
+                    payloads[hash] = await fetch(hash)
+            except error.NotFound:
+                pass
+            else:
+                bodies.append(body)
+
+        tasks = [
+            asyncio.ensure_future(fetch_one(hash))
+            for hash in hashes
+            if hash not in payloads
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # Any other error fails the whole call, The requests still in flight are cancelled with it.
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Keep the order of the given hashes, JSON objects are keyed by strings.
+        ordered = {str(hash): payloads[hash] for hash in hashes if hash in payloads}
+        total = response_bodies.Body()
+        total.size = sum(body.size or 0 for body in bodies)
+        return await self._deserialize(method, ordered, body=total, many=True)
+
+    async def fetch_inventory_items(
+        self, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, entity.InventoryEntity]:
+        """Fetch many static inventory item entities given their hashes.
+
+        If `Client.manifest` is set, The items are looked up there first and only the ones
+        that weren't found are requested concurrently over HTTP.
 
-        return self._framework.deserialize_inventory_entity(resp)
+        Parameters
+        ----------
+        hashes: `collections.Iterable[int]`
+            The hashes of the inventory items.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.crates.InventoryEntity]`
+            A mapping of the hashes to their items, Hashes that weren't found are not included.
+        """
+        return await self._fetch_definitions(
+            "DestinyInventoryItemDefinition",
+            hashes,
+            self._rest.fetch_inventory_item,
+            "deserialize_inventory_entity",
+        )
 
     async def fetch_objective_entity(self, hash: int, /) -> entity.ObjectiveEntity:
         """Fetch a Destiny objective entity given a its hash.
 
+        If `Client.manifest` is set, The objective is looked up there first. It's requested over HTTP
+        if it isn't found, Or if the manifest doesn't have the objective definitions.
+
         Parameters
         ----------
         hash: `int`
@@ -1044,10 +1634,39 @@ class Client(traits.Compact):
         `aiobungie.crates.ObjectiveEntity`
             An objective entity item.
         """
-        resp = await self._rest.fetch_objective_entity(hash)
+        resp = (await self._from_manifest("DestinyObjectiveDefinition", (hash,))).get(
+            hash
+        )
+        if resp is None:
+            resp = await self._rest.fetch_objective_entity(hash)
 
         return self._framework.deserialize_objective_entity(resp)
 
+    async def fetch_objective_entities(
+        self, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, entity.ObjectiveEntity]:
+        """Fetch many Destiny objective entities given their hashes.
+
+        If `Client.manifest` is set, The objectives are looked up there first and only the ones
+        that weren't found are requested concurrently over HTTP.
+
+        Parameters
+        ----------
+        hashes: `collections.Iterable[int]`
+            The hashes of the objectives.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.crates.ObjectiveEntity]`
+            A mapping of the hashes to their objectives, Hashes that weren't found are not included.
+        """
+        return await self._fetch_definitions(
+            "DestinyObjectiveDefinition",
+            hashes,
+            self._rest.fetch_objective_entity,
+            "deserialize_objective_entity",
+        )
+
     @helpers.unstable
     async def search_entities(
         self, name: str, entity_type: str, *, page: int = 0
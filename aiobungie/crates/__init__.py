@@ -69,6 +69,7 @@ __all__ = (
     "GroupMember",
     # components.py
     "Component",
+    "LazyComponent",
     "CharacterComponent",
     "ProfileComponent",
     "RecordsComponent",
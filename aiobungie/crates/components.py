@@ -30,6 +30,7 @@ from __future__ import annotations
 
 __all__ = (
     "Component",
+    "LazyComponent",
     "CharacterComponent",
     "ProfileComponent",
     "RecordsComponent",
@@ -619,3 +620,95 @@ class Component(
     This will be available when `aiobungie.ComponentType.` is passed to the request.
     otherwise will be `None`.
     """
+
+
+if typing.TYPE_CHECKING:
+    _ComponentView = Component
+else:
+    _ComponentView = object
+
+
+class _LazyField:
+    """A descriptor that deserializes a single component field on first access."""
+
+    __slots__ = ("_name",)
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+
+    def __get__(
+        self, instance: LazyComponent | None, owner: type[LazyComponent] | None = None
+    ) -> typing.Any:
+        if instance is None:
+            return self
+
+        try:
+            return instance._values[self._name]
+        except KeyError:
+            value = instance._resolvers[self._name](instance._payload)
+            instance._values[self._name] = value
+            return value
+
+    def __set__(self, instance: LazyComponent, value: typing.Any) -> typing.NoReturn:
+        raise attrs.exceptions.FrozenInstanceError
+
+
+@typing.final
+class LazyComponent(_ComponentView):
+    """A `Component` that deserializes each of its fields on first access.
+
+    The raw profile payload is kept as is, and a field is only deserialized the first
+    time it is accessed, The result is then cached for later accesses.
+
+    This is useful when requesting many components but only reading a few of them.
+
+    This exposes the same fields as `Component`, Use `LazyComponent.into_component`
+    to deserialize the remaining fields and get a concrete `Component`.
+
+    Example
+    -------
+    ```py
+    profile = await client.fetch_profile(
+        id,
+        aiobungie.MembershipType.STEAM,
+        components,
+        lazy=True,
+    )
+    # Only the characters component gets deserialized here.
+    print(profile.characters)
+    ```
+    """
+
+    __slots__ = ("_payload", "_resolvers", "_values")
+
+    def __init__(
+        self,
+        payload: collections.Mapping[str, typing.Any],
+        resolvers: collections.Mapping[
+            str, collections.Callable[[typing.Any], typing.Any]
+        ],
+    ) -> None:
+        self._payload = payload
+        self._resolvers = resolvers
+        self._values: dict[str, typing.Any] = {}
+
+    @property
+    def resolved(self) -> collections.Set[str]:
+        """The names of the fields that have been deserialized so far."""
+        return self._values.keys()
+
+    def into_component(self) -> Component:
+        """Deserialize all remaining fields and return a concrete `Component`.
+
+        Fields that have already been accessed are not deserialized again.
+        """
+        return Component(**{name: getattr(self, name) for name in self._resolvers})
+
+    def __repr__(self) -> str:
+        return f"LazyComponent(resolved={sorted(self._values)})"
+
+
+for _field in attrs.fields(Component):
+    setattr(LazyComponent, _field.name, _LazyField(_field.name))
+
+del _field
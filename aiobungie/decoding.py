@@ -0,0 +1,215 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Typed decoding of Bungie's responses, Only materializing the keys a framework reads.
+
+This is an optional decoding path that requires [msgspec](https://jcristharif.com/msgspec/),
+Install it with `pip install aiobungie[typed]`.
+
+The default path decodes a whole response body into dicts then the framework builds the crates from them,
+`TypedDecoder` instead decodes the body into dicts that only hold the keys the framework's generated
+deserializers read, Everything else in the body is skipped without being materialized. Which keys are
+read is derived from the specs of `aiobungie.framework.GeneratedFramework` and the crates are still built by the
+framework, So both paths produce the same objects.
+
+Only the hottest endpoints are covered, The rest always go through the framework.
+
+* Clan members.
+* Activity history.
+* Post activity reports (PGCR).
+
+Example
+-------
+```py
+import aiobungie
+from aiobungie import decoding
+
+client = aiobungie.Client("token", decoder=decoding.TypedDecoder())
+
+async with client.rest:
+    # Decoded with the typed decoder.
+    members = await client.fetch_clan_members(4389205)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ("TypedDecoder",)
+
+import typing
+
+import msgspec
+
+from aiobungie import framework as framework_
+from aiobungie.internal import codegen
+
+if typing.TYPE_CHECKING:
+    from aiobungie import api, typedefs
+
+_T = typing.TypeVar("_T")
+
+
+class _Envelope(msgspec.Struct, typing.Generic[_T]):
+    Response: _T
+    ThrottleSeconds: int = 0
+
+
+def _typed_dict(name: str, shape: codegen.Shape) -> typing.Any:
+    # A `TypedDict` only holds the keys it declares, Anything else in the body is skipped
+    # while decoding and the framework reads the result like the dict it would've got.
+    if shape.whole:
+        return typing.Any
+
+    fields: dict[str, typing.Any] = {}
+    for key, inner in shape.keys.items():
+        value: typing.Any = typing.Any
+        if (
+            inner is not None
+            and (object_ := _typed_dict(f"{name}_{key}", inner)) is not typing.Any
+        ):
+            value = (list[object_] if inner.many else object_) | None
+
+        fields[key] = value
+
+    return typing.TypedDict(name, fields, total=False)  # type: ignore[operator]
+
+
+@typing.final
+class TypedDecoder:
+    """Decodes the response bodies of hot endpoints straight into `aiobungie.crates` objects.
+
+    Each method takes a raw response body, Including Bungie's `Response` envelope,
+    And returns the envelope with the crates under its `Response` key.
+
+    Bodies that don't match the expected shape, i.e., an array where an object is expected,
+    Raise `msgspec.ValidationError`. Missing keys raise the same errors the framework raises for them.
+
+    Example
+    -------
+    ```py
+    from aiobungie import decoding
+
+    decoder = decoding.TypedDecoder()
+    with open("pgcr.json", "rb") as file:
+        # Already an `aiobungie.crates.PostActivity`.
+        post_activity = decoder.decode_post_activity(file.read())["Response"]
+    ```
+
+    Parameters
+    ----------
+    framework : `aiobungie.framework.GeneratedFramework | None`
+        The framework the decoded responses are deserialized with, Only the keys its generated
+        deserializers read are decoded. If `None`, A new `GeneratedFramework` is used.
+    """
+
+    __slots__ = ("_framework", "_clan_members", "_activities", "_post_activity")
+
+    def __init__(self, framework: framework_.GeneratedFramework | None = None) -> None:
+        self._framework = framework or framework_.GeneratedFramework()
+        generated = type(self._framework)
+
+        def resolve(method: str) -> codegen.Spec | None:
+            return codegen.spec_of(getattr(generated, method, None))
+
+        def shape_of(method: str, *, many: bool = False) -> codegen.Shape | None:
+            if (spec := resolve(method)) is None:
+                return None
+
+            shape = codegen.shape(spec, resolve)
+            shape.many = many
+            return shape
+
+        # The pages the framework's `deserialize_*s` methods iterate over.
+        clan_members = codegen.Shape(
+            {
+                "results": shape_of("deserialize_clan_member", many=True),
+                "totalResults": None,
+                "hasMore": None,
+            }
+        )
+        activities = codegen.Shape(
+            {"activities": shape_of("deserialize_activity", many=True)}
+        )
+        post_activity = shape_of("deserialize_post_activity") or codegen.Shape(
+            whole=True
+        )
+
+        self._clan_members = msgspec.json.Decoder(
+            _Envelope[_typed_dict("_ClanMembers", clan_members)]
+        )
+        self._activities = msgspec.json.Decoder(
+            _Envelope[_typed_dict("_Activities", activities)]
+        )
+        self._post_activity = msgspec.json.Decoder(
+            _Envelope[_typed_dict("_PostActivity", post_activity)]
+        )
+
+    @property
+    def framework(self) -> api.Framework:
+        """The framework the decoded responses are deserialized with."""
+        return self._framework
+
+    def decode_clan_members(self, body: str | bytes) -> typedefs.JSONObject:
+        """Decode the body of a page of clan members.
+
+        The `Response` key holds the page with its `results` as a `tuple` of `aiobungie.crates.ClanMember`,
+        Along with `totalResults` and `hasMore`.
+        """
+        envelope = self._clan_members.decode(body)
+        page = envelope.Response
+        return {
+            "Response": {
+                "results": tuple(
+                    self._framework.deserialize_clan_members(page).collect()
+                ),
+                "totalResults": page.get("totalResults", 0),
+                "hasMore": page.get("hasMore", False),
+            },
+            "ThrottleSeconds": envelope.ThrottleSeconds,
+        }
+
+    def decode_activities(self, body: str | bytes) -> typedefs.JSONObject:
+        """Decode the body of an activity history response.
+
+        The `Response` key holds a `tuple` of `aiobungie.crates.Activity`.
+        """
+        envelope = self._activities.decode(body)
+        return {
+            "Response": tuple(
+                self._framework.deserialize_activities(envelope.Response).collect()
+            ),
+            "ThrottleSeconds": envelope.ThrottleSeconds,
+        }
+
+    def decode_post_activity(self, body: str | bytes) -> typedefs.JSONObject:
+        """Decode the body of a post activity report response.
+
+        The `Response` key holds an `aiobungie.crates.PostActivity`.
+        """
+        envelope = self._post_activity.decode(body)
+        return {
+            "Response": self._framework.deserialize_post_activity(envelope.Response),
+            "ThrottleSeconds": envelope.ThrottleSeconds,
+        }
+
+    def __repr__(self) -> str:
+        return f"TypedDecoder(framework={self._framework!r})"
@@ -36,6 +36,7 @@ __all__ = (
     "InternalServerError",
     "HTTPError",
     "BadRequest",
+    "MissingDefinitionError",
     "panic",
     "stringify_headers",
 )
@@ -285,6 +286,21 @@ class RateLimitedError(HTTPError):
         return self.message
 
 
+@attrs.define(auto_exc=True)
+class MissingDefinitionError(ValueError):
+    """Raised when a definition doesn't exist in a manifest.
+
+    i.e. A `manifest.MappedManifest` over a partial JSON file, Or a misspelled definition name.
+    This is a `ValueError`, So code that catches `ValueError` keeps working.
+    """
+
+    definition: str
+    """The name of the missing definition."""
+
+    def __str__(self) -> str:
+        return f"{self.definition} is not a definition of this manifest."
+
+
 async def panic(response: aiohttp.ClientResponse) -> HTTPError:
     """Immediately raise an exception based on the response."""
 
@@ -27,10 +27,11 @@
 
 from __future__ import annotations
 
-__all__ = ("Framework", "Global")
+__all__ = ("Framework", "GeneratedFramework", "Global")
 
 import typing
 
+import attrs
 import sain
 
 from aiobungie import api, builders, typedefs
@@ -51,7 +52,8 @@ from aiobungie.crates import (
     season,
     user,
 )
-from aiobungie.internal import enums, time
+from aiobungie.internal import _images as image_sessions
+from aiobungie.internal import codegen, enums, time
 
 if typing.TYPE_CHECKING:
     import collections.abc as collections
@@ -59,6 +61,8 @@ if typing.TYPE_CHECKING:
 
     # from aiobungie import traits
 
+    _StrT = typing.TypeVar("_StrT", str, str | None)
+
 
 class Framework(api.Framework):
     """The base deserialization framework implementation.
@@ -94,18 +98,74 @@ class Framework(api.Framework):
 
     asyncio.run(main())
     ```
+
+    Parameters
+    ----------
+    intern_size : `int`
+        The maximum number of images and strings to share between deserialized objects.
+
+        Inventories and clan rosters repeat the same icons, names and locale codes a lot,
+        Images with equal paths and equal strings are shared instead of kept as copies. The tables are
+        cleared once they're full, And they aren't sent along when the framework is pickled to a process pool.
+        Setting this to `0` disables interning. Defaults to `4096`.
     """
 
-    __slots__ = ()
+    __slots__ = ("_intern_size", "_strings", "_images", "_source")
 
-    def __init__(self) -> None:
+    def __init__(self, *, intern_size: int = 4096) -> None:
         super().__init__()
+        self._intern_size = intern_size
+        self._strings: dict[str, str] = {}
+        self._images: dict[str, builders.Image] = {}
+        self._source: image_sessions.Source | None = None
+
+    def _fetch_images_with(self, source: image_sessions.Source, /) -> None:
+        # Called by `Client`, The images deserialized from now on are fetched
+        # with its REST client's session and image cache.
+        self._source = source
+        self._images.clear()
+
+    def _image(self, path: str | None, /) -> builders.Image:
+        if not path:
+            return builders.Image.default()
+
+        if not self._intern_size:
+            return builders.Image(path, source=self._source)
+
+        # Images are immutable, So one instance is shared by every object with the same path.
+        if (image := self._images.get(path)) is None:
+            if len(self._images) >= self._intern_size:
+                self._images.clear()
+            image = self._images[path] = builders.Image(path, source=self._source)
+
+        return image
+
+    def _string(self, value: _StrT, /) -> _StrT:
+        if not value or not self._intern_size:
+            return value
+
+        if (interned := self._strings.get(value)) is None:
+            # Clearing is atomic, So this is safe to call from executor threads.
+            if len(self._strings) >= self._intern_size:
+                self._strings.clear()
+            interned = self._strings[value] = value
+
+        return interned
+
+    def __getstate__(self) -> dict[str, int]:
+        return {"intern_size": self._intern_size}
+
+    def __setstate__(self, state: dict[str, int]) -> None:
+        self._intern_size = state["intern_size"]
+        self._strings = {}
+        self._images = {}
+        self._source = None
 
     def deserialize_bungie_user(self, data: typedefs.JSONObject) -> user.BungieUser:
         return user.BungieUser(
             id=int(data["membershipId"]),
             created_at=time.clean_date(data["firstAccess"]),
-            name=data.get("cachedBungieGlobalDisplayName"),
+            name=self._string(data.get("cachedBungieGlobalDisplayName")),
             is_deleted=data["isDeleted"],
             about=data["about"],
             updated_at=time.clean_date(data["lastUpdate"]),
@@ -116,8 +176,8 @@ class Framework(api.Framework):
             blizzard_name=data.get("blizzardDisplayName", None),
             egs_name=data.get("egsDisplayName", None),
             status=data["statusText"],
-            locale=data["locale"],
-            picture=builders.Image(path=data["profilePicturePath"]),
+            locale=self._string(data["locale"]),
+            picture=self._image(data["profilePicturePath"]),
             code=data.get("cachedBungieGlobalDisplayNameCode", None),
             unique_name=data.get("uniqueName", None),
             theme_id=int(data["profileTheme"]),
@@ -134,17 +194,21 @@ class Framework(api.Framework):
     ) -> user.PartialBungieUser:
         return user.PartialBungieUser(
             types=tuple(
-                enums.MembershipType(type_)
+                enums.decode(enums.MembershipType, type_)
                 for type_ in payload.get("applicableMembershipTypes", ())
             ),
-            name=payload["bungieGlobalDisplayName"]
-            if "bungieGlobalDisplayName" in payload
-            else payload.get("displayName"),
+            name=self._string(
+                payload["bungieGlobalDisplayName"]
+                if "bungieGlobalDisplayName" in payload
+                else payload.get("displayName")
+            ),
             id=int(payload["membershipId"]),
-            crossave_override=enums.MembershipType(payload["crossSaveOverride"]),
+            crossave_override=enums.decode(
+                enums.MembershipType, payload["crossSaveOverride"]
+            ),
             is_public=payload["isPublic"],
-            icon=builders.Image(path=payload.get("iconPath", "")),
-            type=enums.MembershipType(payload["membershipType"]),
+            icon=self._image(payload.get("iconPath", "")),
+            type=enums.decode(enums.MembershipType, payload["membershipType"]),
             code=payload.get("bungieGlobalDisplayNameCode"),
         )
 
@@ -153,21 +217,23 @@ class Framework(api.Framework):
     ) -> user.DestinyMembership:
         name: str | None = None
         if (raw_name := payload.get("bungieGlobalDisplayName")) is not None:
-            name = typedefs.unknown(raw_name)
+            name = self._string(typedefs.unknown(raw_name))
 
         return user.DestinyMembership(
             id=int(payload["membershipId"]),
             name=name,
             code=payload.get("bungieGlobalDisplayNameCode", None),
-            last_seen_name=payload.get("LastSeenDisplayName")
-            or payload.get("displayName")  # noqa: W503
-            or "",  # noqa: W503
-            type=enums.MembershipType(payload["membershipType"]),
+            last_seen_name=self._string(
+                payload.get("LastSeenDisplayName") or payload.get("displayName") or ""
+            ),
+            type=enums.decode(enums.MembershipType, payload["membershipType"]),
             is_public=payload["isPublic"],
-            crossave_override=enums.MembershipType(payload["crossSaveOverride"]),
-            icon=builders.Image(path=payload.get("iconPath", "")),
+            crossave_override=enums.decode(
+                enums.MembershipType, payload["crossSaveOverride"]
+            ),
+            icon=self._image(payload.get("iconPath", "")),
             types=tuple(
-                enums.MembershipType(type_)
+                enums.decode(enums.MembershipType, type_)
                 for type_ in payload.get("applicableMembershipTypes", ())
             ),
         )
@@ -228,7 +294,7 @@ class Framework(api.Framework):
     ) -> collections.Sequence[user.UserCredentials]:
         return tuple(
             user.UserCredentials(
-                type=enums.CredentialType(int(credit["credentialType"])),
+                type=enums.decode(enums.CredentialType, int(credit["credentialType"])),
                 display_name=credit["credentialDisplayName"],
                 is_public=credit["isPublic"],
                 self_as_string=credit.get("credentialAsString"),
@@ -271,8 +337,8 @@ class Framework(api.Framework):
             remote_group_id=int(payload["remoteGroupId"])
             if "remoteGroupId" in payload
             else None,
-            group_type=enums.GroupType(int(payload["groupType"])),
-            avatar_path=builders.Image(payload["avatarPath"]),
+            group_type=enums.decode(enums.GroupType, int(payload["groupType"])),
+            avatar_path=self._image(payload["avatarPath"]),
             theme=payload["theme"],
         )
 
@@ -303,14 +369,14 @@ class Framework(api.Framework):
         return clans.Clan(
             id=int(data["groupId"]),
             name=data["name"],
-            type=enums.GroupType(data["groupType"]),
+            type=enums.decode(enums.GroupType, data["groupType"]),
             created_at=time.clean_date(data["creationDate"]),
             member_count=data["memberCount"],
             motto=data["motto"],
             about=data["about"],
             is_public=data["isPublic"],
-            banner=builders.Image(path=data["bannerPath"]),
-            avatar=builders.Image(path=data["avatarPath"]),
+            banner=self._image(data["bannerPath"]),
+            avatar=self._image(data["avatarPath"]),
             tags=tuple(data["tags"]),
             features=features_obj,
             owner=clan_founder,
@@ -359,7 +425,7 @@ class Framework(api.Framework):
             bungie_user=self.deserialize_partial_bungie_user(data["bungieNetUserInfo"])
             if "bungieNetUserInfo" in data
             else None,
-            member_type=enums.ClanMemberType(int(data["memberType"])),
+            member_type=enums.decode(enums.ClanMemberType, int(data["memberType"])),
         )
 
     def deserialize_clan_members(
@@ -376,7 +442,7 @@ class Framework(api.Framework):
         return clans.GroupMember(
             join_date=time.clean_date(member["joinDate"]),
             group_id=int(member["groupId"]),
-            member_type=enums.ClanMemberType(member["memberType"]),
+            member_type=enums.decode(enums.ClanMemberType, member["memberType"]),
             is_online=member["isOnline"],
             last_online=time.from_timestamp(int(member["lastOnlineStatusChange"])),
             inactive_memberships=payload.get("areAllMembershipsInactive", None),
@@ -442,24 +508,26 @@ class Framework(api.Framework):
 
         return character.Character(
             id=int(payload["characterId"]),
-            gender=enums.Gender(payload["genderType"]),
-            race=enums.Race(payload["raceType"]),
-            class_type=enums.Class(payload["classType"]),
-            emblem=builders.Image(path=payload["emblemBackgroundPath"])
+            gender=enums.decode(enums.Gender, payload["genderType"]),
+            race=enums.decode(enums.Race, payload["raceType"]),
+            class_type=enums.decode(enums.Class, payload["classType"]),
+            emblem=self._image(payload["emblemBackgroundPath"])
             if "emblemBackgroundPath" in payload
             else None,
-            emblem_icon=builders.Image(path=payload["emblemPath"])
+            emblem_icon=self._image(payload["emblemPath"])
             if "emblemPath" in payload
             else None,
             emblem_hash=int(payload["emblemHash"]) if "emblemHash" in payload else None,
             last_played=time.clean_date(payload["dateLastPlayed"]),
             total_played_time=int(payload["minutesPlayedTotal"]),
             member_id=int(payload["membershipId"]),
-            member_type=enums.MembershipType(payload["membershipType"]),
+            member_type=enums.decode(enums.MembershipType, payload["membershipType"]),
             level=payload["baseCharacterLevel"],
             title_hash=payload.get("titleRecordHash", None),
             light=payload["light"],
-            stats={enums.Stat(int(k)): v for k, v in payload["stats"].items()},
+            stats={
+                enums.decode(enums.Stat, int(k)): v for k, v in payload["stats"].items()
+            },
             emblem_color=emblem_color,
             minutes_played_this_session=int(payload["minutesPlayedThisSession"])
             if "minutesPlayedThisSession" in payload
@@ -471,7 +539,9 @@ class Framework(api.Framework):
         return profile.Profile(
             user=self.deserialize_destiny_membership(payload["userInfo"]),
             last_played=time.clean_date(payload["dateLastPlayed"]),
-            versions_owned=enums.GameVersions(int(payload["versionsOwned"])),
+            versions_owned=enums.decode(
+                enums.GameVersions, int(payload["versionsOwned"])
+            ),
             character_ids=tuple(
                 int(character_id) for character_id in payload["characterIds"]
             ),
@@ -495,17 +565,17 @@ class Framework(api.Framework):
         if raw_version := payload.get("versionNumber"):
             version_number = int(raw_version)
 
-        transfer_status = enums.TransferStatus(payload["transferStatus"])
+        transfer_status = enums.decode(enums.TransferStatus, payload["transferStatus"])
 
         return profile.ProfileItemImpl(
             hash=payload["itemHash"],
             quantity=payload["quantity"],
-            bind_status=enums.ItemBindStatus(payload["bindStatus"]),
-            location=enums.ItemLocation(payload["location"]),
+            bind_status=enums.decode(enums.ItemBindStatus, payload["bindStatus"]),
+            location=enums.decode(enums.ItemLocation, payload["location"]),
             bucket=payload["bucketHash"],
             transfer_status=transfer_status,
             lockable=payload["lockable"],
-            state=enums.ItemState(payload["state"]),
+            state=enums.decode(enums.ItemState, payload["state"]),
             dismantle_permissions=payload["dismantlePermission"],
             is_wrapper=payload["isWrapper"],
             instance_id=instance_id,
@@ -535,7 +605,7 @@ class Framework(api.Framework):
         interval_objectives: collections.Sequence[records.Objective] | None = None
         record_state: records.RecordState | int
 
-        record_state = records.RecordState(payload["state"])
+        record_state = enums.decode(records.RecordState, payload["state"])
 
         if raw_objs := payload.get("objectives"):
             objectives = tuple(self.deserialize_objectives(obj) for obj in raw_objs)
@@ -638,7 +708,7 @@ class Framework(api.Framework):
             is_visible=payload["isVisible"],
             display_level=payload.get("displayLevel"),
             recommended_light=payload.get("recommendedLight"),
-            difficulty=activity.Difficulty(payload["difficultyTier"]),
+            difficulty=enums.decode(activity.Difficulty, payload["difficultyTier"]),
             can_join=payload["canJoin"],
             can_lead=payload["canLead"],
         )
@@ -648,11 +718,11 @@ class Framework(api.Framework):
     ) -> activity.CharacterActivity:
         current_mode = enums.GameMode.NONE
         if raw_current_mode := payload.get("currentActivityModeType"):
-            current_mode = enums.GameMode(raw_current_mode)
+            current_mode = enums.decode(enums.GameMode, raw_current_mode)
 
         if raw_current_modes := payload.get("currentActivityModeTypes"):
             current_mode_types = tuple(
-                enums.GameMode(type_) for type_ in raw_current_modes
+                enums.decode(enums.GameMode, type_) for type_ in raw_current_modes
             )
         else:
             current_mode_types = ()
@@ -1104,57 +1174,53 @@ class Framework(api.Framework):
             },
         )
 
-    def deserialize_components(  # noqa: C901 Too complex.
+    def _component_profiles(
         self, payload: typedefs.JSONObject
-    ) -> components.Component:
-        # Due to how complex this method is, We'll stick to
-        # typing.Optional here.
-
-        profile_: profile.Profile | None = None
+    ) -> profile.Profile | None:
         if raw_profile := payload.get("profile"):
-            profile_ = self.deserialize_profile(raw_profile["data"])
+            return self.deserialize_profile(raw_profile["data"])
+        return None
 
-        profile_progression: profile.ProfileProgression | None = None
+    def _component_profile_progression(
+        self, payload: typedefs.JSONObject
+    ) -> profile.ProfileProgression | None:
         if raw_profile_progression := payload.get("profileProgression"):
-            profile_progression = self.deserialize_profile_progression(
-                raw_profile_progression
-            )
+            return self.deserialize_profile_progression(raw_profile_progression)
+        return None
 
-        profile_currencies: typing.Optional[
-            collections.Sequence[profile.ProfileItemImpl]
-        ] = None
+    def _component_profile_currencies(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Sequence[profile.ProfileItemImpl] | None:
         if raw_profile_currencies := payload.get("profileCurrencies"):
             if "data" in raw_profile_currencies:
-                profile_currencies = self.deserialize_profile_items(
-                    raw_profile_currencies["data"]
-                )
+                return self.deserialize_profile_items(raw_profile_currencies["data"])
+        return None
 
-        profile_inventories: typing.Optional[
-            collections.Sequence[profile.ProfileItemImpl]
-        ] = None
+    def _component_profile_inventories(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Sequence[profile.ProfileItemImpl] | None:
         if raw_profile_inventories := payload.get("profileInventory"):
             if "data" in raw_profile_inventories:
-                profile_inventories = self.deserialize_profile_items(
-                    raw_profile_inventories["data"]
-                )
-
-        profile_records: typing.Optional[collections.Mapping[int, records.Record]] = (
-            None
-        )
+                return self.deserialize_profile_items(raw_profile_inventories["data"])
+        return None
 
+    def _component_profile_records(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, records.Record] | None:
         if raw_profile_records_ := payload.get("profileRecords"):
-            profile_records = self.deserialize_profile_records(raw_profile_records_)
+            return self.deserialize_profile_records(raw_profile_records_)
+        return None
 
-        characters: typing.Optional[collections.Mapping[int, character.Character]] = (
-            None
-        )
+    def _component_characters(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, character.Character] | None:
         if raw_characters := payload.get("characters"):
-            characters = self.deserialize_characters(raw_characters)
-
-        character_records: typing.Optional[
-            collections.Mapping[int, records.CharacterRecord]
-        ] = None
+            return self.deserialize_characters(raw_characters)
+        return None
 
+    def _component_character_records(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, records.CharacterRecord] | None:
         if raw_character_records := payload.get("characterRecords"):
             # Had to do it in two steps..
             to_update = {}
@@ -1162,76 +1228,79 @@ class Framework(api.Framework):
                 for record_id, record in data.items():
                     to_update[record_id] = record
 
-            character_records = {
+            return {
                 int(rec_id): self.deserialize_character_records(
                     rec, record_hashes=to_update.get("featuredRecordHashes", ())
                 )
                 for rec_id, rec in to_update["records"].items()
             }
+        return None
 
-        character_equipments: typing.Optional[
-            collections.Mapping[int, collections.Sequence[profile.ProfileItemImpl]]
-        ] = None
+    def _component_character_equipments(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Sequence[profile.ProfileItemImpl]] | None:
         if raw_character_equips := payload.get("characterEquipment"):
-            character_equipments = self.deserialize_character_equipments(
-                raw_character_equips
-            )
+            return self.deserialize_character_equipments(raw_character_equips)
+        return None
 
-        character_inventories: typing.Optional[
-            collections.Mapping[int, collections.Sequence[profile.ProfileItemImpl]]
-        ] = None
+    def _component_character_inventories(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Sequence[profile.ProfileItemImpl]] | None:
         if raw_character_inventories := payload.get("characterInventories"):
             if "data" in raw_character_inventories:
-                character_inventories = self.deserialize_character_equipments(
-                    raw_character_inventories
-                )
+                return self.deserialize_character_equipments(raw_character_inventories)
+        return None
 
-        character_activities: typing.Optional[
-            collections.Mapping[int, activity.CharacterActivity]
-        ] = None
+    def _component_character_activities(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, activity.CharacterActivity] | None:
         if raw_char_acts := payload.get("characterActivities"):
-            character_activities = self.deserialize_character_activities(raw_char_acts)
+            return self.deserialize_character_activities(raw_char_acts)
+        return None
 
-        character_render_data: typing.Optional[
-            collections.Mapping[int, character.RenderedData]
-        ] = None
+    def _component_character_render_data(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, character.RenderedData] | None:
         if raw_character_render_data := payload.get("characterRenderData"):
-            character_render_data = self.deserialize_characters_render_data(
-                raw_character_render_data
-            )
-
-        character_progressions: typing.Optional[
-            collections.Mapping[int, character.CharacterProgression]
-        ] = None
+            return self.deserialize_characters_render_data(raw_character_render_data)
+        return None
 
+    def _component_character_progressions(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, character.CharacterProgression] | None:
         if raw_character_progressions := payload.get("characterProgressions"):
-            character_progressions = self.deserialize_character_progressions_mapping(
+            return self.deserialize_character_progressions_mapping(
                 raw_character_progressions
             )
+        return None
 
-        profile_string_vars: typing.Optional[collections.Mapping[int, int]] = None
+    def _component_profile_string_variables(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, int] | None:
         if raw_profile_string_vars := payload.get("profileStringVariables"):
-            profile_string_vars = raw_profile_string_vars["data"]["integerValuesByHash"]
+            return raw_profile_string_vars["data"]["integerValuesByHash"]
+        return None
 
-        character_string_vars: typing.Optional[
-            collections.Mapping[int, collections.Mapping[int, int]]
-        ] = None
+    def _component_character_string_variables(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Mapping[int, int]] | None:
         if raw_character_string_vars := payload.get("characterStringVariables"):
-            character_string_vars = {
+            return {
                 int(char_id): data["integerValuesByHash"]
                 for char_id, data in raw_character_string_vars["data"].items()
             }
+        return None
 
-        metrics: typing.Optional[
-            collections.Sequence[
-                collections.Mapping[int, tuple[bool, records.Objective | None]]
-            ]
-        ] = None
-        root_node_hash: int | None = None
-
+    def _component_metrics(
+        self, payload: typedefs.JSONObject
+    ) -> (
+        collections.Sequence[
+            collections.Mapping[int, tuple[bool, records.Objective | None]]
+        ]
+        | None
+    ):
         if raw_metrics := payload.get("metrics"):
-            root_node_hash = raw_metrics["data"]["metricsRootNodeHash"]
-            metrics = tuple(
+            return tuple(
                 {
                     int(metrics_hash): (
                         data["invisible"],
@@ -1242,32 +1311,48 @@ class Framework(api.Framework):
                 }
                 for metrics_hash, data in raw_metrics["data"]["metrics"].items()
             )
-        transitory: fireteams.FireteamParty | None = None
+        return None
+
+    def _component_root_node_hash(self, payload: typedefs.JSONObject) -> int | None:
+        if raw_metrics := payload.get("metrics"):
+            return raw_metrics["data"]["metricsRootNodeHash"]
+        return None
+
+    def _component_transitory(
+        self, payload: typedefs.JSONObject
+    ) -> fireteams.FireteamParty | None:
         if raw_transitory := payload.get("profileTransitoryData"):
             if "data" in raw_transitory:
-                transitory = self.deserialize_fireteam_party(raw_transitory["data"])
+                return self.deserialize_fireteam_party(raw_transitory["data"])
+        return None
 
-        item_components: components.ItemsComponent | None = None
+    def _component_item_components(
+        self, payload: typedefs.JSONObject
+    ) -> components.ItemsComponent | None:
         if raw_item_components := payload.get("itemComponents"):
-            item_components = self.deserialize_items_component(raw_item_components)
-
-        profile_plugsets: typing.Optional[
-            collections.Mapping[int, collections.Sequence[items.PlugItemState]]
-        ] = None
+            return self.deserialize_items_component(raw_item_components)
+        return None
 
+    def _component_profile_plugsets(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Sequence[items.PlugItemState]] | None:
         if raw_profile_plugs := payload.get("profilePlugSets"):
-            profile_plugsets = {
+            return {
                 int(index): [self.deserialize_plug_item_state(state) for state in data]
                 for index, data in raw_profile_plugs["data"]["plugs"].items()
             }
+        return None
 
-        character_plugsets: typing.Optional[
-            collections.Mapping[
-                int, collections.Mapping[int, collections.Sequence[items.PlugItemState]]
-            ]
-        ] = None
+    def _component_character_plugsets(
+        self, payload: typedefs.JSONObject
+    ) -> (
+        collections.Mapping[
+            int, collections.Mapping[int, collections.Sequence[items.PlugItemState]]
+        ]
+        | None
+    ):
         if raw_char_plugsets := payload.get("characterPlugSets"):
-            character_plugsets = {
+            return {
                 int(char_id): {
                     int(index): [
                         self.deserialize_plug_item_state(state) for state in data
@@ -1276,126 +1361,131 @@ class Framework(api.Framework):
                 }
                 for char_id, inner in raw_char_plugsets["data"].items()
             }
+        return None
 
-        character_collectibles: typing.Optional[
-            collections.Mapping[int, items.Collectible]
-        ] = None
+    def _component_character_collectibles(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, items.Collectible] | None:
         if raw_character_collectibles := payload.get("characterCollectibles"):
-            character_collectibles = {
+            return {
                 int(char_id): self._deserialize_collectible(data)
                 for char_id, data in raw_character_collectibles["data"].items()
             }
+        return None
 
-        profile_collectibles: items.Collectible | None = None
+    def _component_profile_collectibles(
+        self, payload: typedefs.JSONObject
+    ) -> items.Collectible | None:
         if raw_profile_collectibles := payload.get("profileCollectibles"):
-            profile_collectibles = self._deserialize_collectible(
-                raw_profile_collectibles["data"]
-            )
+            return self._deserialize_collectible(raw_profile_collectibles["data"])
+        return None
 
-        profile_nodes: typing.Optional[collections.Mapping[int, records.Node]] = None
+    def _component_profile_nodes(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, records.Node] | None:
         if raw_profile_nodes := payload.get("profilePresentationNodes"):
-            profile_nodes = {
+            return {
                 int(node_hash): self._deserialize_node(node)
                 for node_hash, node in raw_profile_nodes["data"]["nodes"].items()
             }
+        return None
 
-        character_nodes: typing.Optional[
-            collections.Mapping[int, collections.Mapping[int, records.Node]]
-        ] = None
+    def _component_character_nodes(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Mapping[int, records.Node]] | None:
         if raw_character_nodes := payload.get("characterPresentationNodes"):
-            character_nodes = {
+            return {
                 int(char_id): {
                     int(node_hash): self._deserialize_node(node)
                     for node_hash, node in each_character["nodes"].items()
                 }
                 for char_id, each_character in raw_character_nodes["data"].items()
             }
+        return None
 
-        platform_silver: typing.Optional[
-            collections.Mapping[str, profile.ProfileItemImpl]
-        ] = None
+    def _component_platform_silver(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[str, profile.ProfileItemImpl] | None:
         if raw_platform_silver := payload.get("platformSilver"):
             if "data" in raw_platform_silver:
-                platform_silver = {
+                return {
                     platform_name: self.deserialize_profile_item(item)
                     for platform_name, item in raw_platform_silver["data"][
                         "platformSilver"
                     ].items()
                 }
+        return None
 
-        character_currency_lookups: typing.Optional[
-            collections.Mapping[int, collections.Sequence[items.Currency]]
-        ] = None
+    def _component_character_currency_lookups(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Sequence[items.Currency]] | None:
         if raw_char_lookups := payload.get("characterCurrencyLookups"):
             if "data" in raw_char_lookups:
-                character_currency_lookups = {
+                return {
                     int(char_id): self._deserialize_currencies(currency)
                     for char_id, currency in raw_char_lookups["data"].items()
                 }
+        return None
 
-        character_craftables: typing.Optional[
-            collections.Mapping[int, components.CraftablesComponent]
-        ] = None
+    def _component_character_craftables(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, components.CraftablesComponent] | None:
         if raw_character_craftables := payload.get("characterCraftables"):
             if "data" in raw_character_craftables:
-                character_craftables = {
+                return {
                     int(char_id): self.deserialize_craftables_component(craftable)
                     for char_id, craftable in raw_character_craftables["data"].items()
                 }
+        return None
 
-        character_loadouts: (
-            collections.Mapping[int, collections.Sequence[character.Loadout]] | None
-        ) = None
+    def _component_character_loadouts(
+        self, payload: typedefs.JSONObject
+    ) -> collections.Mapping[int, collections.Sequence[character.Loadout]] | None:
         if raw_character_loadouts := payload.get("characterLoadouts"):
             if "data" in raw_character_loadouts:
-                character_loadouts = {
+                return {
                     int(char_id): tuple(
                         self.deserialize_character_loadout(loadout)
                         for loadout in raw_loadouts["loadouts"]
                     )
                     for char_id, raw_loadouts in raw_character_loadouts["data"].items()
                 }
+        return None
 
-        commendations: components.Commendation | None = None
+    def _component_commendation(
+        self, payload: typedefs.JSONObject
+    ) -> components.Commendation | None:
         if (
             raw_commendations := payload.get("profileCommendations")
         ) and "data" in raw_commendations:
-            commendations = self._deserialize_commendations_component(
-                raw_commendations["data"]
-            )
+            return self._deserialize_commendations_component(raw_commendations["data"])
+        return None
+
+    def _component_resolvers(
+        self,
+    ) -> dict[str, collections.Callable[[typedefs.JSONObject], typing.Any]]:
+        # Each field of `Component` is deserialized by its own `_component_<field>` method,
+        # So the lazy component can deserialize them one at a time.
+        return {
+            field.name: getattr(self, f"_component_{field.name}")
+            for field in attrs.fields(components.Component)
+        }
 
+    def deserialize_components(
+        self, payload: typedefs.JSONObject
+    ) -> components.Component:
         return components.Component(
-            profiles=profile_,
-            profile_progression=profile_progression,
-            profile_currencies=profile_currencies,
-            profile_inventories=profile_inventories,
-            profile_records=profile_records,
-            characters=characters,
-            character_records=character_records,
-            character_equipments=character_equipments,
-            character_inventories=character_inventories,
-            character_activities=character_activities,
-            character_render_data=character_render_data,
-            character_progressions=character_progressions,
-            profile_string_variables=profile_string_vars,
-            character_string_variables=character_string_vars,
-            metrics=metrics,
-            root_node_hash=root_node_hash,
-            transitory=transitory,
-            item_components=item_components,
-            profile_plugsets=profile_plugsets,
-            character_plugsets=character_plugsets,
-            character_collectibles=character_collectibles,
-            profile_collectibles=profile_collectibles,
-            profile_nodes=profile_nodes,
-            character_nodes=character_nodes,
-            platform_silver=platform_silver,
-            character_currency_lookups=character_currency_lookups,
-            character_craftables=character_craftables,
-            character_loadouts=character_loadouts,
-            commendation=commendations,
+            **{
+                name: resolve(payload)
+                for name, resolve in self._component_resolvers().items()
+            }
         )
 
+    def deserialize_lazy_components(
+        self, payload: typedefs.JSONObject
+    ) -> components.LazyComponent:
+        return components.LazyComponent(payload, self._component_resolvers())
+
     def deserialize_items_component(
         self, payload: typedefs.JSONObject
     ) -> components.ItemsComponent:
@@ -1596,8 +1686,8 @@ class Framework(api.Framework):
         self, payload: typedefs.JSONObject, *, key: str = "displayProperties"
     ) -> entity.Entity:
         properties = payload[key]
-        name = typedefs.unknown(properties["name"])
-        description = typedefs.unknown(properties["description"])
+        name = self._string(typedefs.unknown(properties["name"]))
+        description = self._string(typedefs.unknown(properties["description"]))
 
         return entity.Entity(
             hash=payload["hash"],
@@ -1605,7 +1695,7 @@ class Framework(api.Framework):
             name=name,
             description=description,
             has_icon=properties["hasIcon"],
-            icon=builders.Image(properties.get("icon")),
+            icon=self._image(properties.get("icon")),
         )
 
     def deserialize_inventory_results(
@@ -1620,7 +1710,7 @@ class Framework(api.Framework):
                 name=data["displayProperties"]["name"],
                 has_icon=data["displayProperties"]["hasIcon"],
                 description=typedefs.unknown(data["displayProperties"]["description"]),
-                icon=builders.Image(path=data["displayProperties"]["icon"]),
+                icon=self._image(data["displayProperties"]["icon"]),
             )
             for data in payload["results"]["results"]
         )
@@ -1664,47 +1754,47 @@ class Framework(api.Framework):
 
         secondary_icon: builders.Image | None = None
         if raw_second_icon := payload.get("secondaryIcon"):
-            secondary_icon = builders.Image(path=raw_second_icon)
+            secondary_icon = self._image(raw_second_icon)
 
         secondary_overlay: builders.Image | None = None
         if raw_second_overlay := payload.get("secondaryOverlay"):
-            secondary_overlay = builders.Image(path=raw_second_overlay)
+            secondary_overlay = self._image(raw_second_overlay)
 
         secondary_special: builders.Image | None = None
         if raw_second_special := payload.get("secondarySpecial"):
-            secondary_special = builders.Image(path=raw_second_special)
+            secondary_special = self._image(raw_second_special)
 
         screenshot: builders.Image | None = None
         if raw_screenshot := payload.get("screenshot"):
-            screenshot = builders.Image(path=raw_screenshot)
+            screenshot = self._image(raw_screenshot)
 
         watermark_icon: builders.Image | None = None
         if raw_watermark_icon := payload.get("iconWatermark"):
-            watermark_icon = builders.Image(path=raw_watermark_icon)
+            watermark_icon = self._image(raw_watermark_icon)
 
         watermark_shelved: builders.Image | None = None
         if raw_watermark_shelved := payload.get("iconWatermarkShelved"):
-            watermark_shelved = builders.Image(path=raw_watermark_shelved)
+            watermark_shelved = self._image(raw_watermark_shelved)
 
         about: str | None = None
         if raw_about := payload.get("flavorText"):
-            about = raw_about
+            about = self._string(raw_about)
 
         ui_item_style: str | None = None
         if raw_ui_style := payload.get("uiItemDisplayStyle"):
-            ui_item_style = raw_ui_style
+            ui_item_style = self._string(raw_ui_style)
 
         tier_and_name: str | None = None
         if raw_tier_and_name := payload.get("itemTypeAndTierDisplayName"):
-            tier_and_name = raw_tier_and_name
+            tier_and_name = self._string(raw_tier_and_name)
 
         type_name: str | None = None
         if raw_type_name := payload.get("itemTypeDisplayName"):
-            type_name = raw_type_name
+            type_name = self._string(raw_type_name)
 
         display_source: str | None = None
         if raw_display_source := payload.get("displaySource"):
-            display_source = raw_display_source
+            display_source = self._string(raw_display_source)
 
         lorehash: int | None = None
         if raw_lore_hash := payload.get("loreHash"):
@@ -1747,11 +1837,11 @@ class Framework(api.Framework):
         stack_label: str | None = None
 
         if inventory := payload.get("inventory"):
-            tier_type = enums.TierType(int(inventory["tierType"]))
-            tier = enums.ItemTier(int(inventory["tierTypeHash"]))
+            tier_type = enums.decode(enums.TierType, int(inventory["tierType"]))
+            tier = enums.decode(enums.ItemTier, int(inventory["tierTypeHash"]))
             bucket_hash = int(inventory["bucketTypeHash"])
             recovery_hash = int(inventory["recoveryBucketTypeHash"])
-            tier_name = inventory["tierTypeName"]
+            tier_name = self._string(inventory["tierTypeName"])
             isinstance_item = inventory["isInstanceItem"]
             suppress_expiration = inventory["suppressExpirationWhenObjectivesComplete"]
             max_stack_size = int(inventory["maxStackSize"])
@@ -1808,12 +1898,12 @@ class Framework(api.Framework):
             secondary_icon=secondary_icon,
             secondary_overlay=secondary_overlay,
             secondary_special=secondary_special,
-            type=enums.ItemType(int(payload["itemType"])),
+            type=enums.decode(enums.ItemType, int(payload["itemType"])),
             category_hashes=tuple(
                 int(hash_) for hash_ in payload["itemCategoryHashes"]
             ),
-            item_class=enums.Class(int(payload["classType"])),
-            sub_type=enums.ItemSubType(int(payload["itemSubType"])),
+            item_class=enums.decode(enums.Class, int(payload["classType"])),
+            sub_type=enums.decode(enums.ItemSubType, int(payload["itemSubType"])),
             breaker_type=int(payload["breakerType"]),
             default_damagetype=int(payload["defaultDamageType"]),
             default_damagetype_hash=default_damagetype_hash,
@@ -1843,12 +1933,12 @@ class Framework(api.Framework):
             icon=props.icon,
             unlock_value_hash=payload["unlockValueHash"],
             completion_value=payload["completionValue"],
-            scope=entity.GatingScope(int(payload["scope"])),
+            scope=enums.decode(entity.GatingScope, int(payload["scope"])),
             location_hash=payload["locationHash"],
             allowed_negative_value=payload["allowNegativeValue"],
             allowed_value_change=payload["allowValueChangeWhenCompleted"],
             counting_downward=payload["isCountingDownward"],
-            value_style=entity.ValueUIStyle(int(payload["valueStyle"])),
+            value_style=enums.decode(entity.ValueUIStyle, int(payload["valueStyle"])),
             progress_description=payload["progressDescription"],
             perks=payload["perks"],
             stats=payload["stats"],
@@ -1856,14 +1946,14 @@ class Framework(api.Framework):
             allow_over_completion=payload["allowOvercompletion"],
             show_value_style=payload["showValueOnComplete"],
             display_only_objective=payload["isDisplayOnlyObjective"],
-            complete_value_style=entity.ValueUIStyle(
-                int(payload["completedValueStyle"])
+            complete_value_style=enums.decode(
+                entity.ValueUIStyle, int(payload["completedValueStyle"])
             ),
-            progress_value_style=entity.ValueUIStyle(
-                int(payload["inProgressValueStyle"])
+            progress_value_style=enums.decode(
+                entity.ValueUIStyle, int(payload["inProgressValueStyle"])
             ),
             ui_label=payload["uiLabel"],
-            ui_style=entity.ObjectiveUIStyle(int(payload["uiStyle"])),
+            ui_style=enums.decode(entity.ObjectiveUIStyle, int(payload["uiStyle"])),
         )
 
     def _deserialize_activity_values(
@@ -1901,10 +1991,14 @@ class Framework(api.Framework):
         details = payload["activityDetails"]
         ref_id = int(details["referenceId"])
         instance_id = int(details["instanceId"])
-        mode = enums.GameMode(details["mode"])
-        modes = tuple(enums.GameMode(int(mode_)) for mode_ in details["modes"])
+        mode = enums.decode(enums.GameMode, details["mode"])
+        modes = tuple(
+            enums.decode(enums.GameMode, int(mode_)) for mode_ in details["modes"]
+        )
         is_private = details["isPrivate"]
-        membership_type = enums.MembershipType(int(details["membershipType"]))
+        membership_type = enums.decode(
+            enums.MembershipType, int(details["membershipType"])
+        )
 
         # Since we're using the same fields for post activity method
         # this check is required since post activity doesn't values values
@@ -1925,7 +2019,9 @@ class Framework(api.Framework):
         self, payload: typedefs.JSONObject
     ) -> sain.Iterator[activity.Activity]:
         return sain.Iter(
-            self.deserialize_activity(activity_) for activity_ in payload["activities"]
+            # Pages past the end of the history have no activities.
+            self.deserialize_activity(activity_)
+            for activity_ in payload.get("activities", ())
         )
 
     def deserialize_extended_weapon_values(
@@ -1978,37 +2074,16 @@ class Framework(api.Framework):
         self, payload: typedefs.JSONObject, /
     ) -> activity.PostActivityPlayer:
         player = payload["player"]
-
-        class_hash: int | None = None
-        if (class_hash := player.get("classHash")) is not None:
-            class_hash = class_hash
-
-        race_hash: int | None = None
-        if (race_hash := player.get("raceHash")) is not None:
-            race_hash = race_hash
-
-        gender_hash: int | None = None
-        if (gender_hash := player.get("genderHash")) is not None:
-            gender_hash = gender_hash
-
-        character_class: str | None = None
-        if character_class := player.get("characterClass"):
-            character_class = character_class
-
-        character_level: int | None = None
-        if (character_level := player.get("characterLevel")) is not None:
-            character_level = character_level
-
         return activity.PostActivityPlayer(
             standing=int(payload["standing"]),
             score=int(payload["score"]["basic"]["value"]),
             character_id=payload["characterId"],
             destiny_user=self.deserialize_destiny_membership(player["destinyUserInfo"]),
-            character_class=character_class,
-            character_level=character_level,
-            race_hash=race_hash,
-            gender_hash=gender_hash,
-            class_hash=class_hash,
+            character_class=player.get("characterClass"),
+            character_level=player.get("characterLevel"),
+            race_hash=player.get("raceHash"),
+            gender_hash=player.get("genderHash"),
+            class_hash=player.get("classHash"),
             light_level=int(player["lightLevel"]),
             emblem_hash=int(player["emblemHash"]),
             values=self._deserialize_activity_values(payload["values"]),
@@ -2032,10 +2107,14 @@ class Framework(api.Framework):
         details = payload["activityDetails"]
         ref_id = int(details["referenceId"])
         instance_id = int(details["instanceId"])
-        mode = enums.GameMode(details["mode"])
-        modes = tuple(enums.GameMode(int(mode_)) for mode_ in details["modes"])
+        mode = enums.decode(enums.GameMode, details["mode"])
+        modes = tuple(
+            enums.decode(enums.GameMode, int(mode_)) for mode_ in details["modes"]
+        )
         is_private = details["isPrivate"]
-        membership_type = enums.MembershipType(int(details["membershipType"]))
+        membership_type = enums.decode(
+            enums.MembershipType, int(details["membershipType"])
+        )
         return activity.PostActivity(
             hash=ref_id,
             membership_type=membership_type,
@@ -2140,8 +2219,8 @@ class Framework(api.Framework):
             banner_obj = tuple(
                 clans.ClanBanner(
                     id=int(k),
-                    foreground=builders.Image(path=v["foregroundPath"]),
-                    background=builders.Image(path=v["backgroundPath"]),
+                    foreground=self._image(v["foregroundPath"]),
+                    background=self._image(v["backgroundPath"]),
                 )
                 for k, v in banners.items()
             )
@@ -2179,11 +2258,13 @@ class Framework(api.Framework):
             id=int(payload["lastSeenAsMembershipId"]),
             name=typedefs.unknown(payload.get("bungieGlobalDisplayName", "")),
             code=payload.get("bungieGlobalDisplayNameCode"),
-            relationship=enums.Relationship(payload["relationship"]),
+            relationship=enums.decode(enums.Relationship, payload["relationship"]),
             user=bungie_user,
-            online_status=enums.Presence(payload["onlineStatus"]),
+            online_status=enums.decode(enums.Presence, payload["onlineStatus"]),
             online_title=payload["onlineTitle"],
-            type=enums.MembershipType(payload["lastSeenAsBungieMembershipType"]),
+            type=enums.decode(
+                enums.MembershipType, payload["lastSeenAsBungieMembershipType"]
+            ),
         )
 
     def deserialize_friends(
@@ -2215,11 +2296,13 @@ class Framework(api.Framework):
     def _set_fireteam_fields(
         self, payload: typedefs.JSONObject, total_results: int | None = None
     ) -> fireteams.Fireteam:
-        activity_type = fireteams.FireteamActivity(payload["activityType"])
+        activity_type = enums.decode(
+            fireteams.FireteamActivity, payload["activityType"]
+        )
         return fireteams.Fireteam(
             id=int(payload["fireteamId"]),
             group_id=int(payload["groupId"]),
-            platform=fireteams.FireteamPlatform(payload["platform"]),
+            platform=enums.decode(fireteams.FireteamPlatform, payload["platform"]),
             is_immediate=payload["isImmediate"],
             activity_type=activity_type,
             owner_id=int(payload["ownerMembershipId"]),
@@ -2229,7 +2312,7 @@ class Framework(api.Framework):
             title=payload["title"],
             date_created=time.clean_date(payload["dateCreated"]),
             is_public=payload["isPublic"],
-            locale=fireteams.FireteamLanguage(payload["locale"]),
+            locale=enums.decode(fireteams.FireteamLanguage, payload["locale"]),
             is_valid=payload["isValid"],
             last_modified=time.clean_date(payload["datePlayerModified"]),
             date_modified=time.clean_date(payload["dateModified"])
@@ -2270,8 +2353,8 @@ class Framework(api.Framework):
             name=destiny_obj.name,
             last_seen_name=destiny_obj.last_seen_name,
             fireteam_display_name=payload["FireteamDisplayName"],
-            fireteam_membership_id=enums.MembershipType(
-                payload["FireteamMembershipType"]
+            fireteam_membership_id=enums.decode(
+                enums.MembershipType, payload["FireteamMembershipType"]
             ),
         )
 
@@ -2366,7 +2449,7 @@ class Framework(api.Framework):
     def _deserialize_fireteam_party_member(
         self, payload: typedefs.JSONObject
     ) -> fireteams.FireteamPartyMember:
-        status = fireteams.FireteamPartyMemberState(payload["status"])
+        status = enums.decode(fireteams.FireteamPartyMemberState, payload["status"])
 
         return fireteams.FireteamPartyMember(
             membership_id=int(payload["membershipId"]),
@@ -2397,10 +2480,12 @@ class Framework(api.Framework):
     def _deserialize_fireteam_party_settings(
         self, payload: typedefs.JSONObject
     ) -> fireteams.FireteamPartySettings:
-        closed_reasons = enums.ClosedReasons(payload["closedReasons"])
+        closed_reasons = enums.decode(enums.ClosedReasons, payload["closedReasons"])
         return fireteams.FireteamPartySettings(
             open_slots=int(payload["openSlots"]),
-            privacy_setting=enums.PrivacySetting(int(payload["privacySetting"])),
+            privacy_setting=enums.decode(
+                enums.PrivacySetting, int(payload["privacySetting"])
+            ),
             closed_reasons=closed_reasons,
         )
 
@@ -2466,7 +2551,7 @@ class Framework(api.Framework):
 
         breaker_type: items.ItemBreakerType | None = None
         if raw_break_type := payload.get("breakerType"):
-            breaker_type = items.ItemBreakerType(int(raw_break_type))
+            breaker_type = enums.decode(items.ItemBreakerType, int(raw_break_type))
 
         breaker_type_hash: int | None = None
         if raw_break_type_hash := payload.get("breakerTypeHash"):
@@ -2481,7 +2566,7 @@ class Framework(api.Framework):
             primary_stats = self.deserialize_item_stats_view(raw_primary_stats)
 
         return items.ItemInstance(
-            damage_type=enums.DamageType(int(payload["damageType"])),
+            damage_type=enums.decode(enums.DamageType, int(payload["damageType"])),
             damage_type_hash=damage_type_hash,
             primary_stat=primary_stats,
             item_level=int(payload["itemLevel"]),
@@ -2503,7 +2588,7 @@ class Framework(api.Framework):
 
         return items.ItemEnergy(
             hash=energy_hash,
-            type=items.ItemEnergyType(int(payload["energyType"])),
+            type=enums.decode(items.ItemEnergyType, int(payload["energyType"])),
             capacity=int(payload["energyCapacity"]),
             used_energy=int(payload["energyUsed"]),
             unused_energy=int(payload["energyUnused"]),
@@ -2516,7 +2601,7 @@ class Framework(api.Framework):
 
         return items.ItemPerk(
             hash=perk_hash,
-            icon=builders.Image(path=payload["iconPath"]),
+            icon=self._image(payload["iconPath"]),
             is_active=payload["isActive"],
             is_visible=payload["visible"],
         )
@@ -2568,6 +2653,454 @@ class Framework(api.Framework):
         )
 
 
+def _value(*path: str) -> codegen.Key:
+    # Bungie's stats are all nested as `{"basic": {"value": ..., "displayValue": ...}}`.
+    return codegen.Key((*path, "basic", "value"))
+
+
+def _display_value(*path: str) -> codegen.Key:
+    return codegen.Key((*path, "basic", "displayValue"))
+
+
+_ACTIVITY_DETAILS: dict[str, codegen.Rule] = {
+    "hash": codegen.Key(("activityDetails", "referenceId"), int),
+    "instance_id": codegen.Key(("activityDetails", "instanceId"), int),
+    "mode": codegen.Key(("activityDetails", "mode"), enums.GameMode),
+    "modes": codegen.Each(("activityDetails", "modes"), (int, enums.GameMode)),
+    "is_private": codegen.Key(("activityDetails", "isPrivate")),
+    "membership_type": codegen.Key(
+        ("activityDetails", "membershipType"), (int, enums.MembershipType)
+    ),
+    "occurred_at": codegen.Key("period", time.clean_date),
+}
+
+
+class GeneratedFramework(Framework):
+    """A framework with generated deserializers for the hottest crates.
+
+    The deserializers of these crates are generated at import time from declarative field
+    mappings into straight-line functions, They produce the same objects as `Framework`
+    with less overhead. Everything else is inherited from `Framework`.
+
+    * Destiny memberships, partial Bungie users and clan members.
+    * Activities, post activities and their players, teams and values.
+    * Inventory and objective entities.
+    * Plug item states.
+
+    Example
+    -------
+    ```py
+    import aiobungie
+    from aiobungie import framework
+
+    client = aiobungie.Client("token", framework=framework.GeneratedFramework())
+    ```
+    """
+
+    __slots__ = ()
+
+    deserialize_destiny_membership = codegen.generate(
+        "deserialize_destiny_membership",
+        codegen.Spec(
+            user.DestinyMembership,
+            {
+                "id": codegen.Key("membershipId", int),
+                "name": codegen.Maybe(
+                    "bungieGlobalDisplayName",
+                    (typedefs.unknown, "_string"),
+                    check="not_none",
+                ),
+                "code": codegen.Get("bungieGlobalDisplayNameCode"),
+                "last_seen_name": codegen.Maybe(
+                    "LastSeenDisplayName",
+                    "_string",
+                    default=codegen.Maybe("displayName", "_string", default=""),
+                ),
+                "type": codegen.Key("membershipType", enums.MembershipType),
+                "is_public": codegen.Key("isPublic"),
+                "crossave_override": codegen.Key(
+                    "crossSaveOverride", enums.MembershipType
+                ),
+                "icon": codegen.Get("iconPath", "", "_image"),
+                "types": codegen.Each(
+                    "applicableMembershipTypes", enums.MembershipType, default=()
+                ),
+            },
+        ),
+    )
+
+    deserialize_partial_bungie_user = codegen.generate(
+        "deserialize_partial_bungie_user",
+        codegen.Spec(
+            user.PartialBungieUser,
+            {
+                "types": codegen.Each(
+                    "applicableMembershipTypes", enums.MembershipType, default=()
+                ),
+                "name": codegen.Maybe(
+                    "bungieGlobalDisplayName",
+                    "_string",
+                    default=codegen.Get("displayName", convert="_string"),
+                    check="present",
+                ),
+                "id": codegen.Key("membershipId", int),
+                "crossave_override": codegen.Key(
+                    "crossSaveOverride", enums.MembershipType
+                ),
+                "is_public": codegen.Key("isPublic"),
+                "icon": codegen.Get("iconPath", "", "_image"),
+                "type": codegen.Key("membershipType", enums.MembershipType),
+                "code": codegen.Get("bungieGlobalDisplayNameCode"),
+            },
+        ),
+    )
+
+    deserialize_clan_member = codegen.generate(
+        "deserialize_clan_member",
+        codegen.Spec(
+            clans.ClanMember,
+            {
+                "last_seen_name": codegen.Attr("user", "last_seen_name"),
+                "id": codegen.Attr("user", "id"),
+                "name": codegen.Attr("user", "name"),
+                "icon": codegen.Attr("user", "icon"),
+                "last_online": codegen.Key(
+                    "lastOnlineStatusChange", (int, time.from_timestamp)
+                ),
+                "group_id": codegen.Key("groupId", int),
+                "joined_at": codegen.Key("joinDate", time.clean_date),
+                "types": codegen.Attr("user", "types"),
+                "is_public": codegen.Attr("user", "is_public"),
+                "type": codegen.Attr("user", "type"),
+                "code": codegen.Attr("user", "code"),
+                "is_online": codegen.Key("isOnline"),
+                "crossave_override": codegen.Attr("user", "crossave_override"),
+                "bungie_user": codegen.Maybe(
+                    "bungieNetUserInfo",
+                    "deserialize_partial_bungie_user",
+                    check="present",
+                ),
+                "member_type": codegen.Key("memberType", (int, enums.ClanMemberType)),
+            },
+            bindings={
+                "user": codegen.Key("destinyUserInfo", "deserialize_destiny_membership")
+            },
+        ),
+    )
+
+    _deserialize_activity_values = codegen.generate(
+        "_deserialize_activity_values",
+        codegen.Spec(
+            activity.ActivityValues,
+            {
+                "assists": _value("assists"),
+                "deaths": _value("deaths"),
+                "kills": _value("kills"),
+                "is_completed": codegen.Key(("completed", "basic", "value"), bool),
+                "opponents_defeated": _value("opponentsDefeated"),
+                "efficiency": _value("efficiency"),
+                "kd_ratio": _value("killsDeathsRatio"),
+                "kd_assists": _value("killsDeathsAssists"),
+                "score": _value("score"),
+                "duration": _display_value("activityDurationSeconds"),
+                "team": codegen.In("team", _value()),
+                "completion_reason": _display_value("completionReason"),
+                "fireteam_id": _value("fireteamId"),
+                "start_seconds": _value("startSeconds"),
+                "played_time": _display_value("timePlayedSeconds"),
+                "player_count": _value("playerCount"),
+                "team_score": _value("teamScore"),
+            },
+        ),
+    )
+
+    deserialize_activity = codegen.generate(
+        "deserialize_activity",
+        codegen.Spec(
+            activity.Activity,
+            {
+                **_ACTIVITY_DETAILS,
+                "values": codegen.Key("values", "_deserialize_activity_values"),
+            },
+        ),
+    )
+
+    deserialize_extended_weapon_values = codegen.generate(
+        "deserialize_extended_weapon_values",
+        codegen.Spec(
+            activity.ExtendedWeaponValues,
+            {
+                "reference_id": codegen.Key("referenceId", int),
+                "kills": _value("values", "uniqueWeaponKills"),
+                "precision_kills": _value("values", "uniqueWeaponPrecisionKills"),
+                "assists": codegen.In(("values", "uniqueWeaponAssists"), _value()),
+                "assists_damage": codegen.In(
+                    ("values", "uniqueWeaponAssistDamage"), _value()
+                ),
+                "precision_kills_percentage": codegen.Pack(
+                    (
+                        _value("values", "uniqueWeaponKillsPrecisionKills"),
+                        _display_value("values", "uniqueWeaponKillsPrecisionKills"),
+                    )
+                ),
+            },
+        ),
+    )
+
+    _deserialize_extended_values = codegen.generate(
+        "_deserialize_extended_values",
+        codegen.Spec(
+            activity.ExtendedValues,
+            {
+                "precision_kills": _value("values", "precisionKills"),
+                "grenade_kills": _value("values", "weaponKillsGrenade"),
+                "melee_kills": _value("values", "weaponKillsMelee"),
+                "super_kills": _value("values", "weaponKillsSuper"),
+                "ability_kills": _value("values", "weaponKillsAbility"),
+                "weapons": codegen.Each(
+                    "weapons",
+                    "deserialize_extended_weapon_values",
+                    default=(),
+                    check="truthy",
+                ),
+            },
+        ),
+    )
+
+    deserialize_post_activity_player = codegen.generate(
+        "deserialize_post_activity_player",
+        codegen.Spec(
+            activity.PostActivityPlayer,
+            {
+                "standing": codegen.Key("standing", int),
+                "score": codegen.Key(("score", "basic", "value"), int),
+                "character_id": codegen.Key("characterId"),
+                "destiny_user": codegen.Key(
+                    ("player", "destinyUserInfo"), "deserialize_destiny_membership"
+                ),
+                "character_class": codegen.Get(("player", "characterClass")),
+                "character_level": codegen.Get(("player", "characterLevel")),
+                "race_hash": codegen.Get(("player", "raceHash")),
+                "gender_hash": codegen.Get(("player", "genderHash")),
+                "class_hash": codegen.Get(("player", "classHash")),
+                "light_level": codegen.Key(("player", "lightLevel"), int),
+                "emblem_hash": codegen.Key(("player", "emblemHash"), int),
+                "values": codegen.Key("values", "_deserialize_activity_values"),
+                "extended_values": codegen.Key(
+                    "extended", "_deserialize_extended_values"
+                ),
+            },
+        ),
+    )
+
+    _deserialize_post_activity_team = codegen.generate(
+        "_deserialize_post_activity_team",
+        codegen.Spec(
+            activity.PostActivityTeam,
+            {
+                "id": codegen.Key("teamId"),
+                "is_defeated": codegen.Key(("standing", "basic", "value"), bool),
+                "score": codegen.Key(("score", "basic", "value"), int),
+                "name": codegen.Key("teamName"),
+            },
+        ),
+    )
+
+    deserialize_post_activity = codegen.generate(
+        "deserialize_post_activity",
+        codegen.Spec(
+            activity.PostActivity,
+            {
+                **_ACTIVITY_DETAILS,
+                "starting_phase": codegen.Key("startingPhaseIndex", int),
+                "players": codegen.Each("entries", "deserialize_post_activity_player"),
+                "teams": codegen.Each("teams", "_deserialize_post_activity_team"),
+            },
+        ),
+    )
+
+    _deserialize_inventory_item_objects = codegen.generate(
+        "_deserialize_inventory_item_objects",
+        codegen.Spec(
+            entity.InventoryEntityObjects,
+            {
+                "action": codegen.Get("action"),
+                "set_data": codegen.Get("setData"),
+                "stats": codegen.Get("stats"),
+                "equipping_block": codegen.Get("equippingBlock"),
+                "translation_block": codegen.Get("translationBlock"),
+                "preview": codegen.Get("preview"),
+                "quality": codegen.Get("quality"),
+                "value": codegen.Get("value"),
+                "source_data": codegen.Get("sourceData"),
+                "objectives": codegen.Get("objectives"),
+                "plug": codegen.Get("plug"),
+                "metrics": codegen.Get("metrics"),
+                "gearset": codegen.Get("gearset"),
+                "sack": codegen.Get("sack"),
+                "sockets": codegen.Get("sockets"),
+                "summary": codegen.Get("summary"),
+                "talent_gird": codegen.Get("talentGrid"),
+                "investments_stats": codegen.Get("investmentStats"),
+                "perks": codegen.Get("perks"),
+                "animations": codegen.Get("animations", ()),
+                "links": codegen.Get("links", ()),
+            },
+        ),
+    )
+
+    deserialize_inventory_entity = codegen.generate(
+        "deserialize_inventory_entity",
+        codegen.Spec(
+            entity.InventoryEntity,
+            {
+                "collectible_hash": codegen.Maybe("collectibleHash", int),
+                "name": codegen.Key(
+                    ("displayProperties", "name"), (typedefs.unknown, "_string")
+                ),
+                "about": codegen.Maybe("flavorText", "_string"),
+                "emblem_objective_hash": codegen.Maybe("emblemObjectiveHash", int),
+                "suppress_expiration": codegen.In(
+                    "inventory",
+                    codegen.Key("suppressExpirationWhenObjectivesComplete"),
+                    default=False,
+                ),
+                "max_stack_size": codegen.In(
+                    "inventory", codegen.Key("maxStackSize", int)
+                ),
+                "stack_label": codegen.In("inventory", codegen.Get("stackUniqueLabel")),
+                "tier": codegen.In(
+                    "inventory", codegen.Key("tierTypeHash", (int, enums.ItemTier))
+                ),
+                "tier_type": codegen.In(
+                    "inventory", codegen.Key("tierType", (int, enums.TierType))
+                ),
+                "tier_name": codegen.In(
+                    "inventory", codegen.Key("tierTypeName", "_string")
+                ),
+                "bucket_hash": codegen.In(
+                    "inventory", codegen.Key("bucketTypeHash", int)
+                ),
+                "recovery_bucket_hash": codegen.In(
+                    "inventory", codegen.Key("recoveryBucketTypeHash", int)
+                ),
+                "isinstance_item": codegen.In(
+                    "inventory", codegen.Key("isInstanceItem"), default=False
+                ),
+                "expire_in_orbit_message": codegen.Const(None),
+                "expiration_tooltip": codegen.Const(None),
+                "lore_hash": codegen.Maybe("loreHash", int),
+                "type_and_tier_name": codegen.Maybe(
+                    "itemTypeAndTierDisplayName", "_string"
+                ),
+                "summary_hash": codegen.Maybe("summaryItemHash"),
+                "ui_display_style": codegen.Maybe("uiItemDisplayStyle", "_string"),
+                "type_name": codegen.Maybe("itemTypeDisplayName", "_string"),
+                "breaker_type_hash": codegen.Maybe("breakerTypeHash", int),
+                "description": codegen.Key(
+                    ("displayProperties", "description"), (typedefs.unknown, "_string")
+                ),
+                "display_source": codegen.Maybe("displaySource", "_string"),
+                "hash": codegen.Key("hash"),
+                "damage_types": codegen.Each(
+                    "damageTypes", int, default=None, check="truthy"
+                ),
+                "index": codegen.Key("index"),
+                "icon": codegen.Get(("displayProperties", "icon"), None, "_image"),
+                "has_icon": codegen.Key(("displayProperties", "hasIcon")),
+                "screenshot": codegen.Maybe("screenshot", "_image"),
+                "watermark_icon": codegen.Maybe("iconWatermark", "_image"),
+                "watermark_shelved": codegen.Maybe("iconWatermarkShelved", "_image"),
+                "secondary_icon": codegen.Maybe("secondaryIcon", "_image"),
+                "secondary_overlay": codegen.Maybe("secondaryOverlay", "_image"),
+                "secondary_special": codegen.Maybe("secondarySpecial", "_image"),
+                "type": codegen.Key("itemType", (int, enums.ItemType)),
+                "category_hashes": codegen.Each("itemCategoryHashes", int),
+                "item_class": codegen.Key("classType", (int, enums.Class)),
+                "sub_type": codegen.Key("itemSubType", (int, enums.ItemSubType)),
+                "breaker_type": codegen.Key("breakerType", int),
+                "default_damagetype": codegen.Key("defaultDamageType", int),
+                "default_damagetype_hash": codegen.Maybe("defaultDamageTypeHash", int),
+                "damagetype_hashes": codegen.Each(
+                    "damageTypeHashes", int, default=None, check="truthy"
+                ),
+                "tooltip_notifications": codegen.Key("tooltipNotifications"),
+                "not_transferable": codegen.Key("nonTransferrable"),
+                "allow_actions": codegen.Key("allowActions"),
+                "is_equippable": codegen.Key("equippable"),
+                "objects": codegen.Key((), "_deserialize_inventory_item_objects"),
+                "background_colors": codegen.Get("backgroundColor", {}),
+                "season_hash": codegen.Get("seasonHash"),
+                "has_postmaster_effect": codegen.Key(
+                    "doesPostmasterPullHaveSideEffects"
+                ),
+                "trait_hashes": codegen.Each("traitHashes", int, default=()),
+                "trait_ids": codegen.Each("traitIds", default=()),
+            },
+        ),
+    )
+
+    deserialize_objective_entity = codegen.generate(
+        "deserialize_objective_entity",
+        codegen.Spec(
+            entity.ObjectiveEntity,
+            {
+                "hash": codegen.Key("hash"),
+                "index": codegen.Key("index"),
+                "description": codegen.Key(
+                    ("displayProperties", "description"), (typedefs.unknown, "_string")
+                ),
+                "name": codegen.Key(
+                    ("displayProperties", "name"), (typedefs.unknown, "_string")
+                ),
+                "has_icon": codegen.Key(("displayProperties", "hasIcon")),
+                "icon": codegen.Get(("displayProperties", "icon"), None, "_image"),
+                "unlock_value_hash": codegen.Key("unlockValueHash"),
+                "completion_value": codegen.Key("completionValue"),
+                "scope": codegen.Key("scope", (int, entity.GatingScope)),
+                "location_hash": codegen.Key("locationHash"),
+                "allowed_negative_value": codegen.Key("allowNegativeValue"),
+                "allowed_value_change": codegen.Key("allowValueChangeWhenCompleted"),
+                "counting_downward": codegen.Key("isCountingDownward"),
+                "value_style": codegen.Key("valueStyle", (int, entity.ValueUIStyle)),
+                "progress_description": codegen.Key("progressDescription"),
+                "perks": codegen.Key("perks"),
+                "stats": codegen.Key("stats"),
+                "minimum_visibility": codegen.Key("minimumVisibilityThreshold"),
+                "allow_over_completion": codegen.Key("allowOvercompletion"),
+                "show_value_style": codegen.Key("showValueOnComplete"),
+                "display_only_objective": codegen.Key("isDisplayOnlyObjective"),
+                "complete_value_style": codegen.Key(
+                    "completedValueStyle", (int, entity.ValueUIStyle)
+                ),
+                "progress_value_style": codegen.Key(
+                    "inProgressValueStyle", (int, entity.ValueUIStyle)
+                ),
+                "ui_label": codegen.Key("uiLabel"),
+                "ui_style": codegen.Key("uiStyle", (int, entity.ObjectiveUIStyle)),
+            },
+        ),
+    )
+
+    deserialize_plug_item_state = codegen.generate(
+        "deserialize_plug_item_state",
+        codegen.Spec(
+            items.PlugItemState,
+            {
+                "item_hash": codegen.Maybe("plugItemHash", int),
+                "insert_fail_indexes": codegen.Each(
+                    "insertFailIndexes", int, default=None, check="truthy"
+                ),
+                "enable_fail_indexes": codegen.Each(
+                    "enableFailIndexes", int, default=None, check="truthy"
+                ),
+                "is_enabled": codegen.Key("enabled"),
+                "can_insert": codegen.Key("canInsert"),
+            },
+        ),
+    )
+
+
 Global = Framework()
 """The global framework instance.
 
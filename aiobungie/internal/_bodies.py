@@ -0,0 +1,82 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Per-call hooks into the response bodies the REST client reads.
+
+The REST client decodes response bodies before returning them, `Client` measures
+a call with `measure` to get the size and raw bytes of the body it was decoded from.
+The hook is a context variable, So concurrent calls only see their own bodies.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = (
+    "Body",
+    "measure",
+    "record",
+)
+
+import contextlib
+import contextvars
+import typing
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+
+@typing.final
+class Body:
+    """The body of the last response read inside `measure`."""
+
+    __slots__ = ("size", "raw")
+
+    def __init__(self) -> None:
+        self.size: int | None = None
+        """The size of the body in bytes, `None` if it wasn't read from a response."""
+        self.raw: bytes | None = None
+        """The raw bytes of the body including Bungie's envelope, If they're still available."""
+
+
+_current: contextvars.ContextVar[Body | None] = contextvars.ContextVar(
+    "aiobungie_body", default=None
+)
+
+
+@contextlib.contextmanager
+def measure() -> collections.Iterator[Body]:
+    """Record the body of the responses read inside this context."""
+    body = Body()
+    token = _current.set(body)
+    try:
+        yield body
+    finally:
+        _current.reset(token)
+
+
+def record(raw: bytes | None, /, *, size: int | None = None) -> None:
+    """Record the body of a response if it's being measured.
+
+    `size` is used for bodies whose raw bytes weren't kept, i.e. a `304` response.
+    """
+    if (body := _current.get()) is not None:
+        body.raw = raw
+        body.size = len(raw) if raw is not None else size
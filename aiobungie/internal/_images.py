@@ -0,0 +1,85 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+
+"""The HTTP session and the on-disk cache that a `builders.Image` fetches with.
+
+A `Client` hands its source to the framework that deserializes its responses,
+So the images it builds reuse the REST client's connections and image cache
+instead of opening a new session for each fetch.
+"""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("Source",)
+
+import asyncio
+import typing
+
+if typing.TYPE_CHECKING:
+    import aiohttp
+
+    from aiobungie import cache
+
+
+def _running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+@typing.final
+class Source:
+    """The session and image cache of the REST client that owns an image.
+
+    The REST client attaches its session while it's open, Images fetched while
+    it's closed or from another event loop open their own session instead.
+    """
+
+    __slots__ = ("cache", "_session", "_loop")
+
+    def __init__(self, image_cache: cache.ImageCache | None = None, /) -> None:
+        self.cache = image_cache
+        """The cache `Image.read` and `Image.save` go through, If any."""
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def attach(self, session: aiohttp.ClientSession, /) -> None:
+        """Fetch images with an open session."""
+        self._session = session
+        # Sessions are bound to the loop they were opened in, A session attached
+        # outside of a loop is trusted to be used from the right one.
+        self._loop = _running_loop()
+
+    def detach(self) -> None:
+        """Stop fetching images with the attached session, This is called before it's closed."""
+        self._session = self._loop = None
+
+    @property
+    def session(self) -> aiohttp.ClientSession | None:
+        """The attached session if it's still open and belongs to the running event loop."""
+        session = self._session
+        if session is None or session.closed:
+            return None
+
+        if self._loop is not None and self._loop is not _running_loop():
+            return None
+
+        return session
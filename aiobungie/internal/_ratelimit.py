@@ -0,0 +1,255 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Concurrency and rate limits for the REST clients."""
+
+from __future__ import annotations
+
+__all__: tuple[str, ...] = ("Limiter", "TokenBucket", "route_key")
+
+import asyncio
+import contextlib
+import fnmatch
+import typing
+
+from aiobungie.internal import time
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+    from aiobungie import ratelimit
+
+
+_APPLICATION_BUCKET: typing.Final[str] = "application"
+
+
+def route_key(route: str, /) -> str:
+    """Collapse a request route into the route template it was built from.
+
+    Numeric path segments and the query string are dropped, So
+    `Destiny2/3/Profile/4611686018484639825/?components=100` and
+    `Destiny2/1/Profile/4611686018467284386/?components=200` share the same key.
+    """
+    path = route.partition("?")[0].strip("/")
+    return "/".join(
+        "{}" if segment.lstrip("-").isdigit() else segment
+        for segment in path.split("/")
+    )
+
+
+@typing.final
+class TokenBucket:
+    """A token bucket that refills at a constant `rate` of tokens per second.
+
+    Each request takes a single token, When the bucket is empty the request waits
+    until the next token is available.
+
+    The bucket also learns from Bungie's `ThrottleSeconds`, When throttled it
+    stops handing out tokens for that duration and halves its rate. Each request after
+    that recovers a small part of the original rate.
+
+    Parameters
+    ----------
+    rate : `float`
+        How many tokens are added to the bucket per second.
+    capacity : `float | None`
+        The maximum number of tokens the bucket can hold, i.e. the largest possible burst.
+        If `None`, This will be the same as `rate`.
+    """
+
+    __slots__ = (
+        "_base_rate",
+        "rate",
+        "capacity",
+        "_tokens",
+        "_updated_at",
+        "_blocked_until",
+    )
+
+    def __init__(self, rate: float, capacity: float | None = None) -> None:
+        if rate <= 0:
+            raise ValueError("Rate must be greater than 0.")
+
+        self._base_rate = rate
+        self.rate = rate
+        self.capacity = max(capacity or rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated_at) * self.rate
+        )
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            if self._blocked_until > now:
+                await asyncio.sleep(self._blocked_until - now)
+                continue
+
+            self._refill(now)
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                self.recover()
+                return
+
+            await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def recover(self) -> None:
+        """Get a small part of the rate lost to throttling back."""
+        # Additive increase, Slowly get back to the configured rate.
+        self.rate = min(self._base_rate, self.rate + self._base_rate / 100)
+
+    def throttle(self, seconds: float, /) -> None:
+        """Stop handing out tokens for `seconds` and halve the refill rate."""
+        now = time.monotonic()
+        self._refill(now)
+        self._tokens = 0.0
+        self._blocked_until = max(self._blocked_until, now + seconds)
+        self.rate = max(self.rate / 2, self._base_rate / 10)
+
+
+class _RouteSlot:
+    __slots__ = ("semaphore", "users")
+
+    def __init__(self, limit: int) -> None:
+        self.semaphore = asyncio.Semaphore(limit)
+        self.users = 0
+
+
+@typing.final
+class Limiter:
+    """Bounds how many requests can be in flight at once and how fast they're sent.
+
+    A request first waits for a free slot on its route, Then for a token from
+    its route group's bucket and the application bucket, And finally for a free slot
+    in the global pool. Waiting on the route first means that a single hot route
+    can't starve every other route of global slots.
+
+    Parameters
+    ----------
+    max_concurrency : `int`
+        The maximum number of requests that can be in flight at the same time.
+    max_route_concurrency : `int`
+        The maximum number of requests that can be in flight for a single route at the same time.
+    rate : `float | None`
+        How many requests per second the application key is allowed to send.
+        If `None`, Requests are not rate limited.
+    route_rates : `collections.Mapping[str, float] | None`
+        A mapping of route patterns to how many requests per second all routes matching
+        the pattern are allowed to send. Patterns are matched against `route_key` with `fnmatch`.
+    backend : `aiobungie.ratelimit.RateLimitBackend | None`
+        If provided, Tokens are taken from this backend instead of the local buckets.
+        The application bucket is named `application` and the route groups are named after their patterns.
+
+    Raises
+    ------
+    `ValueError`
+        If any of the limits is less than `1`.
+    """
+
+    __slots__ = ("_global", "_route_limit", "_routes", "_bucket", "_groups", "_backend")
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        max_route_concurrency: int,
+        rate: float | None = None,
+        route_rates: collections.Mapping[str, float] | None = None,
+        backend: ratelimit.RateLimitBackend | None = None,
+    ) -> None:
+        if max_concurrency < 1 or max_route_concurrency < 1:
+            raise ValueError("Concurrency limits must be greater than 0.")
+
+        self._global = asyncio.Semaphore(max_concurrency)
+        self._route_limit = max_route_concurrency
+        self._routes: dict[str, _RouteSlot] = {}
+        self._bucket = TokenBucket(rate) if rate else None
+        self._groups: dict[str, TokenBucket] = {
+            pattern: TokenBucket(group_rate)
+            for pattern, group_rate in (route_rates or {}).items()
+        }
+        self._backend = backend
+
+    def _group_bucket(self, key: str) -> tuple[str, TokenBucket] | None:
+        for pattern, bucket in self._groups.items():
+            if fnmatch.fnmatchcase(key, pattern):
+                return pattern, bucket
+        return None
+
+    async def _spend(self, name: str, bucket: TokenBucket) -> None:
+        if self._backend is None:
+            await bucket.acquire()
+            return
+
+        await self._backend.acquire(name, bucket.rate, bucket.capacity)
+        bucket.recover()
+
+    async def throttle(self, route: str, seconds: float, /) -> bool:
+        """Throttle the bucket `route` belongs to for `seconds`.
+
+        If the route doesn't belong to any group, The application bucket will be throttled.
+
+        Returns
+        -------
+        `bool`
+            Whether a bucket was throttled, This is `False` when rate limiting is disabled.
+        """
+        if group := self._group_bucket(route_key(route)):
+            name, bucket = group
+        elif self._bucket is not None:
+            name, bucket = _APPLICATION_BUCKET, self._bucket
+        else:
+            return False
+
+        bucket.throttle(seconds)
+        if self._backend is not None:
+            await self._backend.throttle(name, seconds)
+        return True
+
+    @contextlib.asynccontextmanager
+    async def acquire(self, route: str, /) -> collections.AsyncIterator[None]:
+        """Wait until `route` is allowed to send a request and hold its slot while in context."""
+        key = route_key(route)
+        if (slot := self._routes.get(key)) is None:
+            slot = self._routes[key] = _RouteSlot(self._route_limit)
+
+        slot.users += 1
+        try:
+            async with slot.semaphore:
+                if group := self._group_bucket(key):
+                    await self._spend(*group)
+
+                if self._bucket is not None:
+                    await self._spend(_APPLICATION_BUCKET, self._bucket)
+
+                async with self._global:
+                    yield
+        finally:
+            slot.users -= 1
+            # Don't keep a semaphore around for every route we've ever seen.
+            if not slot.users:
+                del self._routes[key]
@@ -0,0 +1,555 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Generates straight-line deserializer functions from declarative field mappings.
+
+A `Spec` maps each field of a crate to a rule that says where the value is in the JSON
+payload and how to convert it, `generate` compiles it into a plain Python function that
+looks the values up and calls the crate's constructor once, With no intermediate objects.
+
+Every rule compiles to a single expression, Lookups shared by several fields are hoisted
+into locals at the top of the function.
+
+Example
+-------
+```py
+deserialize_team = codegen.generate(
+    "deserialize_team",
+    codegen.Spec(
+        activity.PostActivityTeam,
+        {
+            "id": codegen.Key("teamId"),
+            "score": codegen.Key(("score", "basic", "value"), int),
+            "name": codegen.Key("teamName"),
+        },
+    ),
+)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = (
+    "Key",
+    "Get",
+    "Maybe",
+    "Each",
+    "In",
+    "Attr",
+    "Pack",
+    "Const",
+    "Spec",
+    "Shape",
+    "generate",
+    "spec_of",
+    "shape",
+)
+
+import enum
+import linecache
+import typing
+
+import attrs
+
+from aiobungie.internal import enums
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+    Converter = collections.Callable[[typing.Any], typing.Any] | str
+    """A callable, Or the name of a method on the framework to call with the value.
+
+    Enum classes are decoded with `enums.decode`, So unknown values are tolerated.
+    """
+
+    Converters = Converter | tuple[Converter, ...]
+    """A converter or converters applied in order."""
+
+    Path = str | tuple[str, ...]
+    """A key, Or a path of nested keys."""
+
+    Rule = typing.Union["Key", "Get", "Maybe", "Each", "In", "Attr", "Pack", "Const"]
+
+_Check = typing.Literal["truthy", "present", "not_none"]
+_MISSING: typing.Any = object()
+# Defaults that are safe to write as literals, Empty containers are rebuilt on each call.
+_LITERALS = (type(None), bool, int, float, str)
+
+
+@attrs.frozen
+class Key:
+    """A required value, `convert(payload[path])`.
+
+    An empty path refers to the payload itself.
+    """
+
+    path: Path
+    convert: Converters | None = None
+
+
+@attrs.frozen
+class Get:
+    """An optional value, `convert(payload.get(key, default))`."""
+
+    path: Path
+    default: typing.Any = None
+    convert: Converters | None = None
+
+
+@attrs.frozen
+class Maybe:
+    """A value that's only converted if it passes `check`, Otherwise `default`.
+
+    * `truthy` checks that the value is truthy.
+    * `present` checks that the key exists.
+    * `not_none` checks that the value is not `None`.
+
+    `default` may be another rule.
+    """
+
+    path: Path
+    convert: Converters | None = None
+    default: typing.Any = None
+    check: _Check = "truthy"
+
+
+@attrs.frozen
+class Each:
+    """A tuple of each converted element of an array.
+
+    If `default` is set, It's returned if the array doesn't pass `check` instead of raising.
+    """
+
+    path: Path
+    convert: Converters | None = None
+    default: typing.Any = _MISSING
+    check: _Check = "present"
+
+
+@attrs.frozen
+class In:
+    """Evaluate `rule` against an optional object, `default` if it's missing or empty."""
+
+    path: Path
+    rule: Rule
+    default: typing.Any = None
+
+
+@attrs.frozen
+class Attr:
+    """An attribute of a value bound in `Spec.bindings`."""
+
+    binding: str
+    name: str
+
+
+@attrs.frozen
+class Pack:
+    """A tuple of the values of other rules."""
+
+    rules: tuple[Rule, ...]
+
+
+@attrs.frozen
+class Const:
+    """A constant value."""
+
+    value: typing.Any
+
+
+@attrs.frozen
+class Spec:
+    """The declarative mapping a deserializer is generated from.
+
+    Parameters
+    ----------
+    target : `collections.Callable[..., typing.Any]`
+        The crate to construct.
+    fields : `collections.Mapping[str, Rule]`
+        A mapping from the crate's keyword arguments to the rules producing them.
+    bindings : `collections.Mapping[str, Rule]`
+        Values computed once before the fields, Fields refer to them with `Attr`.
+    """
+
+    target: collections.Callable[..., typing.Any]
+    fields: collections.Mapping[str, Rule]
+    bindings: collections.Mapping[str, Rule] = attrs.field(factory=dict)
+
+
+def _as_path(path: Path) -> tuple[str, ...]:
+    return (path,) if isinstance(path, str) else path
+
+
+def _count_prefixes(rule: Rule, counts: dict[tuple[str, ...], int]) -> None:
+    # Counts how many unguarded lookups go through each object, Objects
+    # that are looked up more than once are hoisted into locals.
+    if isinstance(rule, (Key, Get, Maybe, Each, In)):
+        path = _as_path(rule.path)
+        for end in range(1, len(path)):
+            counts[path[:end]] = counts.get(path[:end], 0) + 1
+
+    if isinstance(rule, Maybe) and isinstance(rule.default, _RULES):
+        _count_prefixes(rule.default, counts)
+    elif isinstance(rule, Pack):
+        for inner in rule.rules:
+            _count_prefixes(inner, counts)
+
+
+class _Emitter:
+    __slots__ = ("namespace", "lines", "_names", "_hoisted", "_counts", "_counter")
+
+    def __init__(self, counts: dict[tuple[str, ...], int]) -> None:
+        self.namespace: dict[str, typing.Any] = {}
+        self.lines: list[str] = []
+        self._names: dict[int, str] = {}
+        self._hoisted: dict[tuple[str, tuple[str, ...], bool], str] = {}
+        self._counts = counts
+        self._counter = 0
+
+    def fresh(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def constant(self, value: typing.Any) -> str:
+        if (name := self._names.get(id(value))) is None:
+            name = self._names[id(value)] = self.fresh("c")
+            self.namespace[name] = value
+        return name
+
+    def literal(self, value: typing.Any) -> str:
+        if isinstance(value, _LITERALS) or (
+            isinstance(value, (tuple, list, dict)) and not value
+        ):
+            return repr(value)
+        return self.constant(value)
+
+    def hoist(self, base: str, path: tuple[str, ...], *, optional: bool = False) -> str:
+        # Hoisted lookups are emitted as statements, So they must only be
+        # used outside of conditional expressions.
+        if not path:
+            return base
+
+        key = (base, path, optional)
+        if (name := self._hoisted.get(key)) is None:
+            parent = self.parent(base, path[:-1], guarded=False)
+            name = self._hoisted[key] = self.fresh("h")
+            lookup = f".get({path[-1]!r})" if optional else f"[{path[-1]!r}]"
+            self.lines.append(f"{name} = {parent}{lookup}")
+        return name
+
+    def convert(self, converters: Converters | None, expr: str) -> str:
+        if converters is None:
+            return expr
+
+        for converter in converters if isinstance(converters, tuple) else (converters,):
+            if isinstance(converter, str):
+                expr = f"self.{converter}({expr})"
+            elif isinstance(converter, type) and issubclass(converter, enum.Enum):
+                # Enums are decoded through their lookup tables, So unknown
+                # values don't fail the whole payload.
+                expr = (
+                    f"{self.constant(enums.decode)}({self.constant(converter)}, {expr})"
+                )
+            else:
+                expr = f"{self.constant(converter)}({expr})"
+        return expr
+
+    def default(self, value: typing.Any, base: str, guarded: bool) -> str:
+        if isinstance(value, _RULES):
+            return self.emit(value, base, guarded=guarded)
+        return self.literal(value)
+
+    def parent(self, base: str, path: tuple[str, ...], guarded: bool) -> str:
+        if not guarded:
+            # Hoist the deepest object that's shared with other lookups.
+            for end in range(len(path), 0, -1):
+                if self._counts.get(path[:end], 0) > 1:
+                    base, path = self.hoist(base, path[:end]), path[end:]
+                    break
+
+        return base + "".join(f"[{key!r}]" for key in path)
+
+    def check(self, check: _Check, parent: str, key: str) -> tuple[str, str]:
+        # Returns the condition and the expression of the checked value.
+        if check == "present":
+            return f"{key!r} in {parent}", f"{parent}[{key!r}]"
+
+        temp = self.fresh("v")
+        condition = f"({temp} := {parent}.get({key!r}))"
+        if check == "not_none":
+            condition += " is not None"
+        return condition, temp
+
+    def emit(self, rule: Rule, base: str, *, guarded: bool = False) -> str:  # noqa: C901
+        if isinstance(rule, Key):
+            path = _as_path(rule.path)
+            if not path:
+                return self.convert(rule.convert, base)
+            parent = self.parent(base, path[:-1], guarded)
+            return self.convert(rule.convert, f"{parent}[{path[-1]!r}]")
+
+        if isinstance(rule, Get):
+            path = _as_path(rule.path)
+            parent = self.parent(base, path[:-1], guarded)
+            if rule.default is None:
+                expr = f"{parent}.get({path[-1]!r})"
+            else:
+                expr = f"{parent}.get({path[-1]!r}, {self.literal(rule.default)})"
+            return self.convert(rule.convert, expr)
+
+        if isinstance(rule, Maybe):
+            path = _as_path(rule.path)
+            parent = self.parent(base, path[:-1], guarded)
+            if rule.check == "truthy" and rule.convert is None and rule.default is None:
+                return f"({parent}.get({path[-1]!r}) or None)"
+
+            condition, value = self.check(rule.check, parent, path[-1])
+            default = self.default(rule.default, base, guarded)
+            return (
+                f"({self.convert(rule.convert, value)} if {condition} else {default})"
+            )
+
+        if isinstance(rule, Each):
+            path = _as_path(rule.path)
+            parent = self.parent(base, path[:-1], guarded)
+            if rule.default is _MISSING:
+                condition, array = None, f"{parent}[{path[-1]!r}]"
+            else:
+                condition, array = self.check(rule.check, parent, path[-1])
+
+            if rule.convert is None:
+                expr = f"tuple({array})"
+            else:
+                expr = f"tuple([{self.convert(rule.convert, '_e')} for _e in {array}])"
+
+            if condition is None:
+                return expr
+            return f"({expr} if {condition} else {self.literal(rule.default)})"
+
+        if isinstance(rule, In):
+            path = _as_path(rule.path)
+            if guarded:
+                parent = self.parent(base, path[:-1], guarded)
+                section = self.fresh("s")
+                condition = f"({section} := {parent}.get({path[-1]!r}))"
+            else:
+                section = condition = self.hoist(base, path, optional=True)
+
+            inner = self.emit(rule.rule, section, guarded=True)
+            return f"({inner} if {condition} else {self.literal(rule.default)})"
+
+        if isinstance(rule, Attr):
+            return f"_b_{rule.binding}.{rule.name}"
+
+        if isinstance(rule, Pack):
+            values = [self.emit(inner, base, guarded=guarded) for inner in rule.rules]
+            return f"({', '.join(values)}{',' if len(values) == 1 else ''})"
+
+        if isinstance(rule, Const):
+            return self.literal(rule.value)
+
+        raise TypeError(f"Unknown rule {rule!r}")
+
+
+_RULES = (Key, Get, Maybe, Each, In, Attr, Pack, Const)
+
+
+def generate(
+    name: str, spec: Spec
+) -> collections.Callable[[typing.Any, typing.Any], typing.Any]:
+    """Generate a deserializer method from a spec.
+
+    The returned function takes `(self, payload, /)` so it can be set on a framework class.
+    Its source is registered with `linecache`, So tracebacks point at the generated lines.
+
+    Parameters
+    ----------
+    name : `str`
+        The name of the generated function.
+    spec : `Spec`
+        The spec to generate the function from.
+
+    Returns
+    -------
+    `collections.Callable[[typing.Any, typing.Any], typing.Any]`
+        The generated function.
+    """
+    counts: dict[tuple[str, ...], int] = {}
+    for rule in (*spec.bindings.values(), *spec.fields.values()):
+        _count_prefixes(rule, counts)
+
+    emitter = _Emitter(counts)
+    for binding, rule in spec.bindings.items():
+        emitter.lines.append(f"_b_{binding} = {emitter.emit(rule, 'payload')}")
+
+    arguments = [
+        f"{field}={emitter.emit(rule, 'payload')}"
+        for field, rule in spec.fields.items()
+    ]
+    target = emitter.constant(spec.target)
+    source = "\n".join(
+        (
+            f"def {name}(self, payload, /):",
+            *(f"    {line}" for line in emitter.lines),
+            f"    return {target}(",
+            *(f"        {argument}," for argument in arguments),
+            "    )",
+            "",
+        )
+    )
+
+    filename = f"<aiobungie generated {name}>"
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    exec(compile(source, filename, "exec"), emitter.namespace)  # noqa: S102
+
+    function = emitter.namespace[name]
+    function.__qualname__ = name
+    function.__source__ = source
+    function.__codegen_spec__ = spec
+    return function
+
+
+def spec_of(function: typing.Any, /) -> Spec | None:
+    """Return the spec a deserializer was generated from, `None` if it wasn't generated."""
+    return getattr(function, "__codegen_spec__", None)
+
+
+@attrs.define
+class Shape:
+    """The keys a deserializer reads from a JSON object.
+
+    Each key maps to the shape of the value under it, Or `None` if its whole value is used.
+    """
+
+    keys: dict[str, Shape | None] = attrs.field(factory=dict)
+    many: bool = False
+    """Whether this is the shape of each object in an array."""
+    whole: bool = False
+    """Whether the whole object is used, i.e. passed to a deserializer that isn't generated."""
+
+    def merge(self, key: str, other: Shape | None, /) -> None:
+        """Merge the shape of the value under `key` into this one."""
+        if self.whole:
+            return
+
+        if key not in self.keys:
+            self.keys[key] = other
+            return
+
+        if (current := self.keys[key]) is None:
+            return
+
+        if other is None or other.whole or other.many != current.many:
+            # Used as a whole somewhere, Or read as both an object and an array.
+            self.keys[key] = None
+            return
+
+        for inner, value in other.keys.items():
+            current.merge(inner, value)
+
+    def child(self, key: str, /) -> Shape | None:
+        """Return the shape of the object under `key`, `None` if its whole value is used."""
+        if self.whole:
+            return None
+
+        if key not in self.keys:
+            self.keys[key] = Shape()
+        return self.keys[key]
+
+
+def _method_shape(
+    converters: Converters | None,
+    resolve: collections.Callable[[str], Spec | None],
+    *,
+    many: bool = False,
+) -> Shape | None:
+    # Only a value that's passed to another generated deserializer has a known shape.
+    first = converters[0] if isinstance(converters, tuple) else converters
+    if not isinstance(first, str) or (spec := resolve(first)) is None:
+        return None
+
+    result = shape(spec, resolve)
+    result.many = many
+    return result
+
+
+def _walk(
+    rule: Rule,
+    base: Shape,
+    resolve: collections.Callable[[str], Spec | None],
+) -> None:
+    if isinstance(rule, (Key, Get, Maybe, Each)):
+        path = _as_path(rule.path)
+        if not path:
+            # The payload itself is converted.
+            if (inner := _method_shape(rule.convert, resolve)) is None:
+                base.whole = True
+                base.keys.clear()
+            else:
+                for key, value in inner.keys.items():
+                    base.merge(key, value)
+            return
+
+        node: Shape | None = base
+        for key in path[:-1]:
+            if (node := node.child(key)) is None:
+                break
+        else:
+            node.merge(
+                path[-1],
+                _method_shape(rule.convert, resolve, many=isinstance(rule, Each)),
+            )
+
+        if isinstance(rule, Maybe) and isinstance(rule.default, _RULES):
+            _walk(rule.default, base, resolve)
+
+    elif isinstance(rule, In):
+        node = base
+        for key in _as_path(rule.path):
+            if (node := node.child(key)) is None:
+                return
+        _walk(rule.rule, node, resolve)
+
+    elif isinstance(rule, Pack):
+        for inner in rule.rules:
+            _walk(inner, base, resolve)
+
+
+def shape(spec: Spec, resolve: collections.Callable[[str], Spec | None], /) -> Shape:
+    """Return the keys that the deserializer generated from `spec` reads.
+
+    Parameters
+    ----------
+    spec : `Spec`
+        The spec of the deserializer.
+    resolve : `collections.Callable[[str], Spec | None]`
+        Returns the spec of the framework method a converter names, `None` if that method isn't generated.
+
+    Returns
+    -------
+    `Shape`
+        The shape of the JSON objects the deserializer reads.
+    """
+    result = Shape()
+    for rule in (*spec.bindings.values(), *spec.fields.values()):
+        _walk(rule, result, resolve)
+    return result
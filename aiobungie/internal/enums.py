@@ -27,6 +27,7 @@ from __future__ import annotations
 __all__ = (
     "Enum",
     "Flag",
+    "decode",
     "GameMode",
     "MembershipType",
     "Class",
@@ -64,8 +65,18 @@ __all__ = (
 )
 
 import enum as __enum
+import logging
 import typing
 
+_E = typing.TypeVar("_E", bound=__enum.Enum)
+_LOGGER = logging.getLogger("aiobungie.enums")
+_TABLES: dict[type[__enum.Enum], dict[typing.Any, typing.Any]] = {}
+"""Value to member lookup tables, Built for each enum the first time it's decoded."""
+_UNKNOWN_COUNTS: dict[type[__enum.Enum], int] = {}
+"""The number of unknown values cached in the table of each enum."""
+_MAX_UNKNOWN: typing.Final[int] = 64
+"""The maximum number of unknown values cached for each enum, The ones past it aren't cached or logged."""
+
 
 class Enum(__enum.Enum):
     """Builtin Python enum with extra handlings."""
@@ -87,6 +98,10 @@ class Enum(__enum.Enum):
     def __int__(self) -> int:
         return int(self.value)
 
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> tuple[typing.Any, ...]:
+        # Unknown pseudo-members aren't valid values, So members are decoded back instead of looked up.
+        return decode, (type(self), self._value_)
+
 
 class Flag(__enum.Flag):
     """Builtin Python enum flag with extra handlings."""
@@ -129,6 +144,89 @@ class Flag(__enum.Flag):
     def __contains__(self, other: Flag | int) -> bool:
         return self.value & int(other) == int(other)
 
+    def __reduce_ex__(self, protocol: typing.SupportsIndex) -> tuple[typing.Any, ...]:
+        return decode, (type(self), self._value_)
+
+
+def _unknown_member(enum: type[_E], value: typing.Any, *, log: bool = True) -> _E:
+    member_type: type[typing.Any] = enum._member_type_  # type: ignore[attr-defined]
+    if member_type is object:
+        member = object.__new__(enum)
+    else:
+        member = member_type.__new__(enum, value)
+
+    # Flags name themselves `UNKNOWN {value}` when they have no name.
+    member._name_ = None if issubclass(enum, __enum.Flag) else "UNKNOWN"
+    member._value_ = value
+    if log:
+        _LOGGER.warning(
+            "Unknown %s value %r, It may have been added in a newer version of Destiny.",
+            enum.__name__,
+            value,
+        )
+    return member
+
+
+def _decode_missing(enum: type[_E], value: typing.Any) -> _E:
+    if (table := _TABLES.get(enum)) is None:
+        table = _TABLES[enum] = dict(enum._value2member_map_)
+        if value in table:
+            return table[value]
+
+    try:
+        # Composite flags aren't in the table.
+        member = enum(value)
+    except ValueError:
+        unknown = _UNKNOWN_COUNTS.get(enum, 0)
+        if unknown >= _MAX_UNKNOWN:
+            # Don't let a stream of garbage values grow the table without bounds.
+            return _unknown_member(enum, value, log=False)
+
+        _UNKNOWN_COUNTS[enum] = unknown + 1
+        member = _unknown_member(enum, value)
+
+    table[value] = member
+    return member
+
+
+def decode(enum: type[_E], value: typing.Any, /) -> _E:
+    """Decode a value into a member of `enum`.
+
+    This is a faster alternative to `enum(value)` that doesn't raise on unknown values,
+    Bungie adds new values on game updates which shouldn't fail the whole response.
+
+    Unknown values decode into a cached pseudo-member named `UNKNOWN`,
+    Which compares and hashes like its value but isn't part of the enum's members.
+    `enum(value)` still raises for them.
+
+    Example
+    -------
+    ```py
+    from aiobungie.internal import enums
+
+    assert enums.decode(enums.GameMode, 4) is enums.GameMode.RAID
+
+    mode = enums.decode(enums.GameMode, 9999)
+    assert mode.name == "UNKNOWN" and mode == 9999
+    ```
+
+    Parameters
+    ----------
+    enum : `type[Enum]`
+        The enum to decode the value into.
+    value : `typing.Any`
+        The value to decode.
+
+    Returns
+    -------
+    `Enum`
+        The member of the value, Or a pseudo-member if it's unknown.
+    """
+    try:
+        return _TABLES[enum][value]
+    except KeyError:
+        return _decode_missing(enum, value)
+
 
 @typing.final
 class Raid(int, Enum):
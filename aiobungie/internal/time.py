@@ -32,9 +32,10 @@ __all__ = (
 )
 
 import datetime
+import functools
+import re
 import sys as _sys
 import time as _time
-import warnings
 
 _has_backport = True
 if _sys.version_info.minor == 10:
@@ -44,10 +45,17 @@ if _sys.version_info.minor == 10:
         MonkeyPatch.patch_fromisoformat()  # pyright: ignore[reportUnknownMemberType]
     except ModuleNotFoundError:
         _has_backport = False
-        warnings.warn(
-            "The backports module is required for Python 3.10 compatibility.\n"
-            "Please install it with `pip install backports-datetime-fromisoformat`"
-        )
+
+_DATE_CACHE_SIZE = 4096
+"""The maximum number of parsed timestamps `clean_date` keeps around.
+
+Activity histories and clan rosters repeat the same timestamps a lot,
+4096 entries covers a few pages of them for well under a megabyte.
+"""
+
+_BUNGIE_DATE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,7}))?(Z|[+-]\d{2}:\d{2})?"
+)
 
 
 def from_timestamp(
@@ -57,13 +65,45 @@ def from_timestamp(
     return datetime.datetime.fromtimestamp(float(timestamp), tz=tz)
 
 
+def _parse_bungie_date(iso_date: str, /) -> datetime.datetime:
+    # Parses the fixed formats Bungie sends, i.e. `2023-01-07T18:10:41.123Z`,
+    # For Python 3.10 when the backport isn't installed.
+    if (match := _BUNGIE_DATE.fullmatch(iso_date)) is None:
+        raise ValueError(f"Invalid isoformat string: {iso_date!r}")
+
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    if offset is None:
+        tz = None
+    elif offset == "Z":
+        tz = datetime.timezone.utc
+    else:
+        delta = datetime.timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+        tz = datetime.timezone(-delta if offset[0] == "-" else delta)
+
+    return datetime.datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction[:6].ljust(6, "0")) if fraction else 0,
+        tzinfo=tz,
+    )
+
+
+# Python 3.10 doesn't parse all ISO8601 formats, Need a backport for that.
+_parse_date = datetime.datetime.fromisoformat if _has_backport else _parse_bungie_date
+
+
+@functools.lru_cache(maxsize=_DATE_CACHE_SIZE)
 def clean_date(iso_date: str, /) -> datetime.datetime:
-    """Parse an `ISO8601` string datetime into a Python `datetime.datetime` object."""
-    # Python 3.10 doesn't parse all ISO8601 formats, Need a backport for that.
-    if not _has_backport:
-        return datetime.datetime.min
+    """Parse an `ISO8601` string datetime into a Python `datetime.datetime` object.
 
-    return datetime.datetime.fromisoformat(iso_date)
+    The parsed datetimes are cached, Since they're immutable the same object
+    is returned for repeated timestamps.
+    """
+    return _parse_date(iso_date)
 
 
 def parse_date_range(
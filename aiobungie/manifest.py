@@ -0,0 +1,904 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Local lookups over Destiny 2's manifest.
+
+The manifest holds the definitions of every item, objective, activity, etc. in the game,
+The readers in this module look them up locally instead of requesting them over HTTP.
+
+* `Manifest` reads a downloaded SQLite manifest.
+* `JSONManifest` downloads and parses only the JSON definitions that are actually used.
+* `MappedManifest` memory-maps a downloaded JSON manifest and decodes only the definitions that are looked up.
+
+Example
+-------
+```py
+import aiobungie
+from aiobungie import manifest
+
+rest = aiobungie.RESTClient("token")
+
+async with rest:
+    # Only downloads when Bungie publishes a new version.
+    path = await rest.download_sqlite_manifest(sync=True)
+
+with manifest.Manifest(path) as definitions:
+    item = await definitions.fetch_inventory_item(1216319404)
+    items = await definitions.fetch_inventory_items([1216319404, 3588934839])
+
+    # Or the raw JSON of any definition.
+    activity = await definitions.fetch("DestinyActivityDefinition", 2693136600)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ("BaseManifest", "Manifest", "JSONManifest", "MappedManifest")
+
+import abc
+import array
+import asyncio
+import bisect
+import functools
+import mmap
+import os
+import pathlib
+import re
+import sqlite3
+import struct
+import sys
+import threading
+import typing
+
+from aiobungie import error
+from aiobungie import framework as framework_
+from aiobungie.internal import helpers
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+    import concurrent.futures
+    import types
+
+    from aiobungie import api, typedefs
+    from aiobungie.crates import entity
+
+    _IndexTable = tuple[array.array[int], array.array[int], array.array[int]]
+
+# Each `IN (...)` size below gets its own prepared statement, Batches are padded
+# up to one of them so the same few statements are reused for every lookup.
+# The largest one stays below SQLite's default limit of 999 variables.
+_BATCH_SIZES: typing.Final[tuple[int, ...]] = (1, 8, 32, 128, 512, 900)
+
+
+def _to_signed(hash: int) -> int:
+    # The SQLite manifest stores the unsigned 32-bit hashes as signed integers.
+    return hash - (1 << 32) if hash >= (1 << 31) else hash
+
+
+def _to_unsigned(id: int) -> int:
+    return id & 0xFFFFFFFF
+
+
+# The index of a `MappedManifest` is a header followed by three arrays per definition,
+# The sorted hashes, Their byte offsets in the JSON file and their byte lengths.
+_INDEX_MAGIC: typing.Final[bytes] = b"AIOBUNGIE-INDEX\x01"
+_INDEX_HEADER: typing.Final[struct.Struct] = struct.Struct("<16sI")
+
+# Strings are matched whole so braces inside them are skipped.
+_JSON_TOKENS: typing.Final[re.Pattern[bytes]] = re.compile(
+    rb'("[^"\\]*(?:\\.[^"\\]*)*")|(\{)|(\})'
+)
+
+
+def _build_index(source: mmap.mmap) -> dict[str, _IndexTable]:
+    # The manifest is `{"<definition>": {"<hash>": {...}, ...}, ...}`, Only the
+    # objects at depth 3 are indexed.
+    tables: dict[str, _IndexTable] = {}
+    entries: list[tuple[int, int, int]] = []
+    definition: str | None = None
+    key: bytes = b""
+    hash: int | None = None
+    start = depth = 0
+
+    for match in _JSON_TOKENS.finditer(source):
+        kind = match.lastindex
+        if kind == 1:
+            if depth <= 2:
+                key = match.group(1)
+        elif kind == 2:
+            depth += 1
+            if depth == 2:
+                definition = key[1:-1].decode("utf-8")
+                entries = []
+            elif depth == 3:
+                start = match.start()
+                try:
+                    hash = int(key[1:-1])
+                except ValueError:
+                    # Some definitions aren't keyed by hashes.
+                    hash = None
+        else:
+            if depth == 3 and hash is not None:
+                entries.append((hash, start, match.end() - start))
+            elif depth == 2 and definition is not None and entries:
+                entries.sort()
+                tables[definition] = (
+                    array.array("I", (entry[0] for entry in entries)),
+                    array.array("Q", (entry[1] for entry in entries)),
+                    array.array("I", (entry[2] for entry in entries)),
+                )
+            depth -= 1
+
+    return tables
+
+
+def _write_index(
+    path: pathlib.Path, source_key: str, tables: collections.Mapping[str, _IndexTable]
+) -> None:
+    definitions: dict[str, tuple[int, int]] = {}
+    sections: list[bytes] = []
+    position = 0
+    for name, (hashes, offsets, lengths) in tables.items():
+        definitions[name] = (len(hashes), position)
+        # The 8 byte offsets go first so every section stays aligned.
+        section = offsets.tobytes() + hashes.tobytes() + lengths.tobytes()
+        sections.append(section)
+        position += len(section)
+
+    header = helpers.dumps(
+        {"source": source_key, "byteorder": sys.byteorder, "definitions": definitions}
+    )
+    header += b" " * (-(_INDEX_HEADER.size + len(header)) % 8)
+
+    # Other processes may be reading the old index, Swap it atomically.
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with tmp.open("wb") as file:
+            file.write(_INDEX_HEADER.pack(_INDEX_MAGIC, len(header)))
+            file.write(header)
+            for section in sections:
+                file.write(section)
+        os.replace(tmp, path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _source_key(path: pathlib.Path) -> str:
+    # Manifest files are replaced as a whole, A new version always changes these.
+    stat = path.stat()
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def _read_json(path: pathlib.Path, loads: typedefs.Loads) -> typedefs.JSONObject:
+    return loads(path.read_bytes())  # type: ignore[return-value]
+
+
+class BaseManifest(abc.ABC):
+    """The base class of the local manifest readers.
+
+    Implementations only need to provide `fetch_many`, The typed lookups are built on top of it.
+    """
+
+    __slots__ = ("_framework",)
+
+    def __init__(self, framework: api.Framework | None = None) -> None:
+        self._framework = framework or framework_.Global
+
+    @abc.abstractmethod
+    async def fetch_many(
+        self, definition: str, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, typedefs.JSONObject]:
+        """Fetch the raw JSON of many definitions by their hashes.
+
+        Parameters
+        ----------
+        definition : `str`
+            The name of the definition, i.e., `DestinyInventoryItemDefinition`.
+        hashes : `collections.Iterable[int]`
+            The hashes of the definitions to fetch.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.typedefs.JSONObject]`
+            A mapping of the hashes to their definitions, Hashes that weren't found are not included.
+
+        Raises
+        ------
+        `aiobungie.MissingDefinitionError`
+            If the definition doesn't exist in this manifest.
+        """
+
+    async def fetch(self, definition: str, hash: int, /) -> typedefs.JSONObject | None:
+        """Fetch the raw JSON of a definition by its hash.
+
+        Parameters
+        ----------
+        definition : `str`
+            The name of the definition, i.e., `DestinyInventoryItemDefinition`.
+        hash : `int`
+            The hash of the definition.
+
+        Returns
+        -------
+        `aiobungie.typedefs.JSONObject | None`
+            The definition if it was found, Otherwise `None`.
+
+        Raises
+        ------
+        `aiobungie.MissingDefinitionError`
+            If the definition doesn't exist in this manifest.
+        """
+        return (await self.fetch_many(definition, (hash,))).get(hash)
+
+    async def fetch_inventory_item(self, hash: int, /) -> entity.InventoryEntity | None:
+        """Fetch an inventory item definition by its hash.
+
+        Parameters
+        ----------
+        hash : `int`
+            The hash of the item.
+
+        Returns
+        -------
+        `aiobungie.crates.InventoryEntity | None`
+            The item if it was found, Otherwise `None`.
+        """
+        return (await self.fetch_inventory_items((hash,))).get(hash)
+
+    async def fetch_inventory_items(
+        self, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, entity.InventoryEntity]:
+        """Fetch many inventory item definitions by their hashes.
+
+        Parameters
+        ----------
+        hashes : `collections.Iterable[int]`
+            The hashes of the items.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.crates.InventoryEntity]`
+            A mapping of the hashes to their items, Hashes that weren't found are not included.
+        """
+        payloads = await self.fetch_many("DestinyInventoryItemDefinition", hashes)
+        return {
+            hash: self._framework.deserialize_inventory_entity(payload)
+            for hash, payload in payloads.items()
+        }
+
+    async def fetch_objective_entity(
+        self, hash: int, /
+    ) -> entity.ObjectiveEntity | None:
+        """Fetch an objective definition by its hash.
+
+        Parameters
+        ----------
+        hash : `int`
+            The hash of the objective.
+
+        Returns
+        -------
+        `aiobungie.crates.ObjectiveEntity | None`
+            The objective if it was found, Otherwise `None`.
+        """
+        return (await self.fetch_objective_entities((hash,))).get(hash)
+
+    async def fetch_objective_entities(
+        self, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, entity.ObjectiveEntity]:
+        """Fetch many objective definitions by their hashes.
+
+        Parameters
+        ----------
+        hashes : `collections.Iterable[int]`
+            The hashes of the objectives.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.crates.ObjectiveEntity]`
+            A mapping of the hashes to their objectives, Hashes that weren't found are not included.
+        """
+        payloads = await self.fetch_many("DestinyObjectiveDefinition", hashes)
+        return {
+            hash: self._framework.deserialize_objective_entity(payload)
+            for hash, payload in payloads.items()
+        }
+
+
+@typing.final
+class Manifest(BaseManifest):
+    """Query the definitions of a downloaded SQLite manifest.
+
+    Lookups are done by the definition hash, The conversion to the signed ids used by the
+    database is handled for you. Decoded definitions are kept in a bounded LRU cache.
+
+    The database is opened in read-only mode and is used from the executor's threads,
+    So the event loop is never blocked on a query.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike[str]`
+        The path to the manifest database, This is what `RESTClient.download_sqlite_manifest` returns.
+
+    Other Parameters
+    ----------------
+    framework : `aiobungie.api.Framework | None`
+        The framework used to deserialize the definitions, Defaults to `aiobungie.framework.Global`.
+    loads : `aiobungie.typedefs.Loads`
+        The function used to decode the JSON of the definitions.
+    cache_size : `int`
+        The maximum number of decoded definitions to keep in memory, `0` disables the cache. Defaults to `1024`.
+    executor : `concurrent.futures.Executor | None`
+        The executor to run the queries in, Defaults to the event loop's default executor.
+
+    Raises
+    ------
+    `sqlite3.Error`
+        If the database couldn't be opened.
+    """
+
+    __slots__ = (
+        "_path",
+        "_connection",
+        "_lock",
+        "_loads",
+        "_cache",
+        "_cache_size",
+        "_executor",
+        "_definitions",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        framework: api.Framework | None = None,
+        loads: typedefs.Loads = helpers.loads,
+        cache_size: int = 1024,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        if cache_size < 0:
+            raise ValueError("cache_size can't be negative.")
+
+        super().__init__(framework)
+        self._path = pathlib.Path(path)
+        self._loads = loads
+        self._executor = executor
+        # Dicts keep their insertion order, The first key is the least recently used.
+        self._cache: dict[tuple[str, int], typedefs.JSONObject] = {}
+        self._cache_size = cache_size
+        self._connection = sqlite3.connect(
+            f"{self._path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            check_same_thread=False,
+            cached_statements=len(_BATCH_SIZES) * 8,
+        )
+        # The connection is used from the executor's threads.
+        self._lock = threading.Lock()
+        self._definitions = frozenset(
+            row[0]
+            for row in self._connection.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        )
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path to the manifest database."""
+        return self._path
+
+    @property
+    def definitions(self) -> frozenset[str]:
+        """The names of the definitions in this manifest, i.e., `DestinyInventoryItemDefinition`."""
+        return self._definitions
+
+    def _select(
+        self, definition: str, ids: collections.Sequence[int]
+    ) -> dict[int, typedefs.JSONObject]:
+        found: dict[int, typedefs.JSONObject] = {}
+        with self._lock:
+            for start in range(0, len(ids), _BATCH_SIZES[-1]):
+                batch = list(ids[start : start + _BATCH_SIZES[-1]])
+                size = next(size for size in _BATCH_SIZES if size >= len(batch))
+                # Duplicates don't change the result of `IN`.
+                batch.extend(batch[-1:] * (size - len(batch)))
+
+                # The definition name is checked against the tables by `fetch_many`.
+                rows = self._connection.execute(
+                    f"SELECT id, json FROM {definition} "
+                    f"WHERE id IN ({', '.join('?' * size)})",
+                    batch,
+                )
+                for id, raw in rows:
+                    found[_to_unsigned(id)] = self._loads(raw)  # type: ignore[assignment]
+
+        return found
+
+    def _remember(self, key: tuple[str, int], definition: typedefs.JSONObject) -> None:
+        if not self._cache_size:
+            return
+
+        self._cache[key] = definition
+        if len(self._cache) > self._cache_size:
+            del self._cache[next(iter(self._cache))]
+
+    async def fetch_many(
+        self, definition: str, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, typedefs.JSONObject]:
+        """Fetch the raw JSON of many definitions by their hashes.
+
+        The definitions are selected in batches, Any hashes that were recently fetched are
+        served from the cache.
+
+        Parameters
+        ----------
+        definition : `str`
+            The name of the definition, i.e., `DestinyInventoryItemDefinition`.
+        hashes : `collections.Iterable[int]`
+            The hashes of the definitions to fetch.
+
+        Returns
+        -------
+        `collections.Mapping[int, aiobungie.typedefs.JSONObject]`
+            A mapping of the hashes to their definitions, Hashes that weren't found are not included.
+
+        Raises
+        ------
+        `aiobungie.MissingDefinitionError`
+            If the definition doesn't exist in this manifest.
+        """
+        if definition not in self._definitions:
+            raise error.MissingDefinitionError(definition)
+
+        found: dict[int, typedefs.JSONObject] = {}
+        missing: list[int] = []
+        for hash in dict.fromkeys(hashes):
+            if (cached := self._cache.pop((definition, hash), None)) is not None:
+                # Re-insert to mark it as the most recently used.
+                self._cache[(definition, hash)] = cached
+                found[hash] = cached
+            else:
+                missing.append(_to_signed(hash))
+
+        if missing:
+            selected = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self._select, definition, missing
+            )
+            for hash, payload in selected.items():
+                self._remember((definition, hash), payload)
+            found.update(selected)
+
+        return found
+
+    def clear(self) -> None:
+        """Clear the cache of decoded definitions."""
+        self._cache.clear()
+
+    def close(self) -> None:
+        """Close the manifest database."""
+        with self._lock:
+            self._connection.close()
+
+    def __enter__(self) -> Manifest:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        exception_traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"Manifest(path={self._path!s}, definitions={len(self._definitions)})"
+
+
+@typing.final
+class JSONManifest(BaseManifest):
+    """Lazily loads the JSON definitions of the manifest one definition at a time.
+
+    Instead of the whole manifest, Only the definitions that are looked up are downloaded
+    from Bungie's per-definition paths and parsed. Each definition is loaded on first access,
+    The downloaded files are kept on disk and only downloaded again when Bungie publishes
+    a new manifest version.
+
+    The manifest's paths and version are requested once per reader, A definition whose file is
+    already at that version is loaded from disk without any request. Call `unload()` to drop
+    everything and check for a new version on the next load.
+
+    Example
+    -------
+    ```py
+    import aiobungie
+    from aiobungie import manifest
+
+    async with aiobungie.RESTClient("token") as rest:
+        definitions = manifest.JSONManifest(rest, "./manifest")
+        # Only `DestinyInventoryItemDefinition` is downloaded and parsed.
+        item = await definitions.fetch_inventory_item(1216319404)
+    ```
+
+    Parameters
+    ----------
+    rest : `aiobungie.api.RESTClient`
+        The REST client used to download the definitions, It must be open when a definition is loaded.
+    path : `str | os.PathLike[str]`
+        The directory to keep the downloaded definitions in, Defaults to the current directory.
+        Each language is kept in a sub-directory.
+
+    Other Parameters
+    ----------------
+    language : `str`
+        The language of the definitions, Defaults to English.
+    framework : `aiobungie.api.Framework | None`
+        The framework used to deserialize the definitions, Defaults to `aiobungie.framework.Global`.
+    loads : `aiobungie.typedefs.Loads`
+        The function used to decode the JSON of the definitions.
+    executor : `concurrent.futures.Executor | None`
+        The executor to write and parse the definitions in, Defaults to the event loop's default executor.
+    """
+
+    __slots__ = (
+        "_rest",
+        "_path",
+        "_language",
+        "_loads",
+        "_executor",
+        "_tables",
+        "_locks",
+        "_manifest_path",
+        "_manifest_lock",
+    )
+
+    def __init__(
+        self,
+        rest: api.RESTClient,
+        path: str | os.PathLike[str] = ".",
+        *,
+        language: str = "en",
+        framework: api.Framework | None = None,
+        loads: typedefs.Loads = helpers.loads,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        super().__init__(framework)
+        self._rest = rest
+        self._path = pathlib.Path(path) / language
+        self._language = language
+        self._loads = loads
+        self._executor = executor
+        self._tables: dict[str, typedefs.JSONObject] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._manifest_path: typedefs.JSONObject | None = None
+        self._manifest_lock = asyncio.Lock()
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The directory the definitions of this language are kept in."""
+        return self._path
+
+    @property
+    def loaded(self) -> collections.Set[str]:
+        """The names of the definitions that are currently loaded in memory."""
+        return self._tables.keys()
+
+    async def _resolve_manifest_path(self) -> typedefs.JSONObject:
+        if self._manifest_path is None:
+            async with self._manifest_lock:
+                if self._manifest_path is None:
+                    self._manifest_path = await self._rest.fetch_manifest_path()
+
+        return self._manifest_path
+
+    async def load(self, definition: str, /) -> typedefs.JSONObject:
+        """Load a definition into memory if it's not already loaded.
+
+        This is called by the lookups, But can be used to load definitions ahead of time.
+
+        Parameters
+        ----------
+        definition : `str`
+            The name of the definition, i.e., `DestinyInventoryItemDefinition`.
+
+        Returns
+        -------
+        `aiobungie.typedefs.JSONObject`
+            The definition table, A mapping of the hashes as strings to their definitions.
+
+        Raises
+        ------
+        `aiobungie.MissingDefinitionError`
+            If the definition doesn't exist in the manifest.
+        """
+        if (table := self._tables.get(definition)) is not None:
+            return table
+
+        # Concurrent lookups of the same definition wait for a single download.
+        async with self._locks.setdefault(definition, asyncio.Lock()):
+            if (table := self._tables.get(definition)) is not None:
+                return table
+
+            self._path.mkdir(parents=True, exist_ok=True)
+            file = await self._rest.download_json_definition(
+                definition,
+                self._path,
+                language=self._language,  # type: ignore[arg-type]
+                sync=True,
+                executor=self._executor,
+                manifest_path=await self._resolve_manifest_path(),
+            )
+            table = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _read_json, file, self._loads
+            )
+            self._tables[definition] = table
+
+        return table
+
+    async def fetch_many(
+        self, definition: str, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, typedefs.JSONObject]:
+        table = await self.load(definition)
+        found: dict[int, typedefs.JSONObject] = {}
+        for hash in hashes:
+            if (payload := table.get(str(hash))) is not None:
+                found[hash] = payload
+        return found
+
+    def unload(self, definition: str | None = None, /) -> None:
+        """Drop a loaded definition from memory, Or all of them if `definition` is `None`.
+
+        The downloaded files are kept on disk. When all of them are dropped, The manifest's
+        version is requested again on the next load and outdated files are downloaded again.
+        """
+        if definition is None:
+            self._tables.clear()
+            self._manifest_path = None
+        else:
+            self._tables.pop(definition, None)
+
+    def __repr__(self) -> str:
+        return f"JSONManifest(path={self._path!s}, loaded={sorted(self._tables)})"
+
+
+@typing.final
+class MappedManifest(BaseManifest):
+    """Look up definitions in a downloaded JSON manifest without parsing the whole file.
+
+    The JSON file is memory-mapped and a compact index of where each definition is in the file
+    is built once per manifest version and stored next to it. A lookup only decodes the bytes
+    of the requested definitions.
+
+    Since the file and its index are memory-mapped, Many processes can share the same
+    page-cached manifest instead of each holding a fully parsed copy.
+
+    Note
+    ----
+    Building the index scans the whole file, Which may take a while for the full manifest.
+    It's only done when the index is missing, Corrupted or the JSON file has changed since it was built.
+    Use `MappedManifest.open` from async code so it's built in an executor instead of on the event loop.
+
+    Example
+    -------
+    ```py
+    import aiobungie
+    from aiobungie import manifest
+
+    async with aiobungie.RESTClient("token") as rest:
+        path = await rest.download_json_manifest(sync=True)
+
+    with await manifest.MappedManifest.open(path) as definitions:
+        item = await definitions.fetch_inventory_item(1216319404)
+    ```
+
+    Parameters
+    ----------
+    path : `str | os.PathLike[str]`
+        The path to the JSON manifest, This is what `RESTClient.download_json_manifest` returns.
+
+    Other Parameters
+    ----------------
+    index_path : `str | os.PathLike[str] | None`
+        Where to store the index, Defaults to `<path>.index` next to the JSON file.
+    framework : `aiobungie.api.Framework | None`
+        The framework used to deserialize the definitions, Defaults to `aiobungie.framework.Global`.
+    loads : `aiobungie.typedefs.Loads`
+        The function used to decode the JSON of the definitions.
+    """
+
+    __slots__ = (
+        "_path",
+        "_index_path",
+        "_loads",
+        "_source",
+        "_index",
+        "_views",
+        "_tables",
+    )
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        index_path: str | os.PathLike[str] | None = None,
+        framework: api.Framework | None = None,
+        loads: typedefs.Loads = helpers.loads,
+    ) -> None:
+        super().__init__(framework)
+        self._path = pathlib.Path(path)
+        self._index_path = (
+            pathlib.Path(index_path)
+            if index_path is not None
+            else self._path.with_name(self._path.name + ".index")
+        )
+        self._loads = loads
+
+        with self._path.open("rb") as file:
+            self._source = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        source_key = _source_key(self._path)
+        if not self._open_index(source_key):
+            _write_index(self._index_path, source_key, _build_index(self._source))
+            if not self._open_index(source_key):
+                raise RuntimeError(f"Couldn't open the index {self._index_path!s}.")
+
+    def _open_index(self, source_key: str) -> bool:
+        try:
+            with self._index_path.open("rb") as file:
+                index = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (FileNotFoundError, ValueError):
+            return False
+
+        # A short or corrupted index, i.e. from a crash while it was being copied,
+        # Is treated like a missing one and rebuilt.
+        try:
+            start, definitions = self._read_index_header(index, source_key)
+        except (struct.error, KeyError, ValueError, TypeError):
+            index.close()
+            return False
+
+        view = memoryview(index)
+        tables: dict[str, tuple[memoryview, memoryview, memoryview]] = {}
+        for name, (count, position) in definitions.items():
+            position += start
+            tables[name] = (
+                view[position + 8 * count : position + 12 * count].cast("I"),
+                view[position : position + 8 * count].cast("Q"),
+                view[position + 12 * count : position + 16 * count].cast("I"),
+            )
+
+        self._index = index
+        self._views = view
+        self._tables = tables
+        return True
+
+    def _read_index_header(
+        self, index: mmap.mmap, source_key: str
+    ) -> tuple[int, dict[str, tuple[int, int]]]:
+        # Returns where the tables start and each table's size and position,
+        # Raises `ValueError` if the index is stale or doesn't fit in the file.
+        magic, header_size = _INDEX_HEADER.unpack_from(index)
+        start = _INDEX_HEADER.size + header_size
+        if magic != _INDEX_MAGIC or start > len(index):
+            raise ValueError("Not an index.")
+
+        header = self._loads(index[_INDEX_HEADER.size : start])
+        if (
+            not isinstance(header, dict)
+            or header.get("source") != source_key
+            or header.get("byteorder") != sys.byteorder
+        ):
+            raise ValueError("The index is stale.")
+
+        definitions: dict[str, tuple[int, int]] = {}
+        for name, (count, position) in header["definitions"].items():
+            if start + position + 16 * count > len(index):
+                raise ValueError("The index is truncated.")
+            definitions[name] = (count, position)
+        return start, definitions
+
+    @classmethod
+    async def open(
+        cls,
+        path: str | os.PathLike[str],
+        *,
+        index_path: str | os.PathLike[str] | None = None,
+        framework: api.Framework | None = None,
+        loads: typedefs.Loads = helpers.loads,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> MappedManifest:
+        """Open a JSON manifest in an executor, Without blocking the event loop while its index is built.
+
+        This takes the same parameters as the constructor.
+
+        Other Parameters
+        ----------------
+        executor : `concurrent.futures.Executor | None`
+            The executor to open the manifest in, Defaults to the event loop's default executor.
+
+        Returns
+        -------
+        `MappedManifest`
+            The opened manifest.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            functools.partial(
+                cls, path, index_path=index_path, framework=framework, loads=loads
+            ),
+        )
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path to the JSON manifest."""
+        return self._path
+
+    @property
+    def index_path(self) -> pathlib.Path:
+        """The path to the index of the JSON manifest."""
+        return self._index_path
+
+    @property
+    def definitions(self) -> collections.Set[str]:
+        """The names of the indexed definitions, i.e., `DestinyInventoryItemDefinition`."""
+        return self._tables.keys()
+
+    async def fetch_many(
+        self, definition: str, hashes: collections.Iterable[int], /
+    ) -> collections.Mapping[int, typedefs.JSONObject]:
+        try:
+            indexed, offsets, lengths = self._tables[definition]
+        except KeyError:
+            raise error.MissingDefinitionError(definition) from None
+
+        found: dict[int, typedefs.JSONObject] = {}
+        for hash in hashes:
+            position = bisect.bisect_left(indexed, hash)  # type: ignore[arg-type]
+            if position < len(indexed) and indexed[position] == hash:
+                offset = offsets[position]
+                found[hash] = self._loads(  # type: ignore[assignment]
+                    self._source[offset : offset + lengths[position]]
+                )
+        return found
+
+    def close(self) -> None:
+        """Unmap the JSON manifest and its index."""
+        for table in self._tables.values():
+            for view in table:
+                view.release()
+        self._tables = {}
+        self._views.release()
+        self._index.close()
+        self._source.close()
+
+    def __enter__(self) -> MappedManifest:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception: BaseException | None,
+        exception_traceback: types.TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"MappedManifest(path={self._path!s}, definitions={len(self._tables)})"
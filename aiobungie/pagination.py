@@ -0,0 +1,389 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Async iteration over Bungie's paged endpoints.
+
+Paged endpoints, Such as `search_group`, `fetch_fireteams` or `search_entities`, return a single page per call.
+`paginate` wraps any `RESTClient` or `Client` method that takes a page number into a `Paginator`,
+Which requests the pages one after another and stops once there are no more results.
+
+While the current page is being processed, The next pages are already being requested,
+So a large scan doesn't wait for a full round-trip between each page.
+
+Endpoints that page with continuation tokens instead of page numbers, Such as `search_group`'s `request_token`,
+Are supported with `token_argument`. Each token comes from the page before it,
+So those pages are always requested one at a time.
+
+Example
+-------
+```py
+import aiobungie
+from aiobungie import pagination
+
+client = aiobungie.Client("token")
+
+async with client.rest:
+    # Iterate over all of the results, Page by page.
+    async for fireteam in pagination.paginate(client.fetch_fireteams, 4):
+        print(fireteam)
+
+    # Or over the raw pages of a `RESTClient` method, Clan search pages start at 1.
+    paginator = pagination.paginate(
+        client.rest.search_group, "Fate", page_argument="current_page", start=1
+    )
+    async for page in paginator.pages():
+        print(page["totalResults"])
+
+    # Or follow the continuation tokens of the clan search instead of its page numbers.
+    paginator = pagination.paginate(
+        client.rest.search_group, "Fate", token_argument="request_token"
+    )
+    async for clan in paginator:
+        print(clan["name"])
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ("Paginator", "paginate")
+
+import asyncio
+import collections as _collections
+import contextlib
+import typing
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+    from aiobungie import typedefs
+
+_PageT = typing.TypeVar("_PageT")
+_T = typing.TypeVar("_T")
+
+
+def _split(page: typing.Any, /) -> tuple[list[typing.Any], bool]:
+    # Returns the results of a page and whether there may be more pages after it.
+    if isinstance(page, dict):
+        results = page.get("results", ())
+        if isinstance(results, dict):
+            # Armory search nests the search result under `results`.
+            page = results
+            results = page.get("results", ())
+
+        items = list(results)  # pyright: ignore[reportUnknownArgumentType]
+        return items, bool(page.get("hasMore", items))  # pyright: ignore
+
+    # Deserialized pages don't know whether there's more, So only an empty page ends them.
+    # `sain.Iter` is consumed by `len`, So it's iterated over instead of passed to `list`.
+    items = [item for item in page]
+    return items, bool(items)
+
+
+def _continuation_token(page: typing.Any, /) -> str | None:
+    # The token to request the page after this one with, Bungie's search results carry it
+    # as `replacementContinuationToken`.
+    if not isinstance(page, dict):
+        return None
+
+    results = page.get("results")
+    if isinstance(results, dict):
+        page = results
+
+    return page.get("replacementContinuationToken") or None  # pyright: ignore
+
+
+@typing.final
+class Paginator(typing.Generic[_PageT, _T]):
+    """An async iterator over the results of a paged endpoint.
+
+    Iterating over this yields each result of each page, `Paginator.pages` yields the pages themselves.
+
+    Pages are requested in order starting from `start`, Iteration stops after a page that has `hasMore`
+    set to `False`, Or an empty page if the pages don't have `hasMore`.
+
+    Use `Paginator.from_tokens` for endpoints that page with continuation tokens instead of page numbers.
+
+    Parameters
+    ----------
+    fetch_page : `collections.Callable[[int], collections.Awaitable[PageT]]`
+        A callable that requests a page by its number.
+
+    Other Parameters
+    ----------------
+    start : `int`
+        The number of the first page. Defaults to `0`.
+    look_ahead : `int`
+        How many pages to request ahead of the one being processed, The extra requests are cancelled
+        once the last page is reached. `0` requests the pages one at a time. Defaults to `1`.
+    max_pages : `int | None`
+        The maximum number of pages to request. Defaults to `None`, Which requests all of them.
+    """
+
+    __slots__ = ("_fetch_page", "_start", "_look_ahead", "_max_pages", "_tokens")
+
+    def __init__(
+        self,
+        fetch_page: collections.Callable[[int], collections.Awaitable[_PageT]],
+        /,
+        *,
+        start: int = 0,
+        look_ahead: int = 1,
+        max_pages: int | None = None,
+    ) -> None:
+        if look_ahead < 0:
+            raise ValueError("look_ahead can't be negative.")
+
+        self._fetch_page = fetch_page
+        self._start = start
+        self._look_ahead = look_ahead
+        self._max_pages = max_pages
+        self._tokens = False
+
+    @classmethod
+    def from_tokens(
+        cls,
+        fetch_page: collections.Callable[[str | None], collections.Awaitable[_PageT]],
+        /,
+        *,
+        max_pages: int | None = None,
+    ) -> Paginator[_PageT, _T]:
+        """Create a paginator over an endpoint that pages with continuation tokens.
+
+        The first page is requested with `None`, Every page after it is requested with
+        the `replacementContinuationToken` of the page before it. Iteration stops after a page
+        that has `hasMore` set to `False` or has no continuation token.
+
+        Since a page's token is only known once the page before it is returned,
+        The pages are requested one at a time.
+
+        Parameters
+        ----------
+        fetch_page : `collections.Callable[[str | None], collections.Awaitable[PageT]]`
+            A callable that requests a page by the continuation token of the page before it.
+
+        Other Parameters
+        ----------------
+        max_pages : `int | None`
+            The maximum number of pages to request. Defaults to `None`, Which requests all of them.
+
+        Returns
+        -------
+        `Paginator[PageT, T]`
+            A paginator over the pages.
+        """
+        self = cls(
+            typing.cast(
+                "collections.Callable[[int], collections.Awaitable[_PageT]]", fetch_page
+            ),
+            look_ahead=0,
+            max_pages=max_pages,
+        )
+        self._tokens = True
+        return self
+
+    async def _walk_tokens(
+        self,
+    ) -> collections.AsyncGenerator[tuple[_PageT, list[_T]], None]:
+        fetch_page = typing.cast(
+            "collections.Callable[[str | None], collections.Awaitable[_PageT]]",
+            self._fetch_page,
+        )
+        token: str | None = None
+        requested = 0
+        while self._max_pages is None or requested < self._max_pages:
+            page = await fetch_page(token)
+            requested += 1
+            items, has_more = _split(page)
+            token = _continuation_token(page)
+            if not has_more or token is None:
+                if items:
+                    yield page, items
+                return
+
+            yield page, items
+
+    async def _walk(self) -> collections.AsyncGenerator[tuple[_PageT, list[_T]], None]:
+        end = None if self._max_pages is None else self._start + self._max_pages
+        next_page = self._start
+        pending: _collections.deque[asyncio.Future[_PageT]] = _collections.deque()
+
+        def fill() -> None:
+            nonlocal next_page
+            while len(pending) <= self._look_ahead and (end is None or next_page < end):
+                pending.append(asyncio.ensure_future(self._fetch_page(next_page)))
+                next_page += 1
+
+        try:
+            fill()
+            while pending:
+                page = await pending.popleft()
+                items, has_more = _split(page)
+                if not has_more:
+                    if items:
+                        yield page, items
+                    return
+
+                # Requested before the caller processes this page.
+                fill()
+                yield page, items
+
+        finally:
+            for future in pending:
+                future.cancel()
+
+            # Pages requested past the last one may have failed,
+            # Waiting for them here retrieves their errors along with the cancellations.
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def _select_walk(
+        self,
+    ) -> collections.AsyncGenerator[tuple[_PageT, list[_T]], None]:
+        return self._walk_tokens() if self._tokens else self._walk()
+
+    async def pages(self) -> collections.AsyncGenerator[_PageT, None]:
+        """Yield each page as it's returned by the paged method.
+
+        Returns
+        -------
+        `collections.AsyncGenerator[PageT, None]`
+            An async generator of the pages.
+        """
+        # Closed with this generator, So breaking out of the loop cancels the requests ahead.
+        async with contextlib.aclosing(self._select_walk()) as walk:
+            async for page, _ in walk:
+                yield page
+
+    async def collect(self) -> list[_T]:
+        """Request all of the pages and return their results in a list.
+
+        Returns
+        -------
+        `list[T]`
+            The results of all of the pages.
+        """
+        return [item async for item in self]
+
+    async def __aiter__(self) -> collections.AsyncGenerator[_T, None]:
+        async with contextlib.aclosing(self._select_walk()) as walk:
+            async for _, items in walk:
+                for item in items:
+                    yield item
+
+
+@typing.overload
+def paginate(
+    method: collections.Callable[..., collections.Awaitable[typedefs.JSONObject]],
+    /,
+    *args: typing.Any,
+    page_argument: str = ...,
+    token_argument: str | None = ...,
+    start: int = ...,
+    look_ahead: int = ...,
+    max_pages: int | None = ...,
+    **kwargs: typing.Any,
+) -> Paginator[typedefs.JSONObject, typing.Any]: ...
+
+
+@typing.overload
+def paginate(
+    method: collections.Callable[..., collections.Awaitable[collections.Iterable[_T]]],
+    /,
+    *args: typing.Any,
+    page_argument: str = ...,
+    token_argument: str | None = ...,
+    start: int = ...,
+    look_ahead: int = ...,
+    max_pages: int | None = ...,
+    **kwargs: typing.Any,
+) -> Paginator[collections.Iterable[_T], _T]: ...
+
+
+def paginate(
+    method: collections.Callable[..., collections.Awaitable[typing.Any]],
+    /,
+    *args: typing.Any,
+    page_argument: str = "page",
+    token_argument: str | None = None,
+    start: int = 0,
+    look_ahead: int = 1,
+    max_pages: int | None = None,
+    **kwargs: typing.Any,
+) -> Paginator[typing.Any, typing.Any]:
+    """Create a `Paginator` over a paged `RESTClient` or `Client` method.
+
+    The method is called with `args` and `kwargs` for each page, Along with the page number
+    passed as the `page_argument` keyword argument. If `token_argument` is set, The continuation token
+    of the previous page is passed as that keyword argument instead, See `Paginator.from_tokens`.
+
+    Example
+    -------
+    ```py
+    # Request up to 3 pages ahead while scanning all of the available fireteams.
+    fireteams = await pagination.paginate(
+        client.fetch_fireteams, 4, look_ahead=3
+    ).collect()
+    ```
+
+    Parameters
+    ----------
+    method : `collections.Callable[..., collections.Awaitable[typing.Any]]`
+        The paged method to call. It should either return Bungie's raw search result object with
+        `results` and `hasMore`, Or the deserialized results of the page.
+    *args : `typing.Any`
+        Positional arguments to call the method with.
+    **kwargs : `typing.Any`
+        Keyword arguments to call the method with.
+
+    Other Parameters
+    ----------------
+    page_argument : `str`
+        The name of the method's page number parameter, i.e. `current_page` for `search_group`. Defaults to `page`.
+    token_argument : `str | None`
+        The name of the method's continuation token parameter, i.e. `request_token` for `search_group`.
+        If set, The pages are requested one at a time by following their continuation tokens,
+        And `page_argument`, `start` and `look_ahead` are ignored. Defaults to `None`.
+    start : `int`
+        The number of the first page, Some endpoints start from `1`. Defaults to `0`.
+    look_ahead : `int`
+        How many pages to request ahead of the one being processed. Defaults to `1`.
+    max_pages : `int | None`
+        The maximum number of pages to request. Defaults to `None`, Which requests all of them.
+
+    Returns
+    -------
+    `Paginator[PageT, T]`
+        A paginator over the method's pages.
+    """
+
+    if token_argument is not None:
+
+        def fetch_token_page(token: str | None) -> collections.Awaitable[typing.Any]:
+            return method(*args, **kwargs, **{token_argument: token})
+
+        return Paginator.from_tokens(fetch_token_page, max_pages=max_pages)
+
+    def fetch_page(page: int) -> collections.Awaitable[typing.Any]:
+        return method(*args, **kwargs, **{page_argument: page})
+
+    return Paginator(
+        fetch_page, start=start, look_ahead=look_ahead, max_pages=max_pages
+    )
@@ -0,0 +1,211 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Rate limit backends used to coordinate the request rate between multiple processes.
+
+By default, Each `RESTClient` or `RESTPool` only knows about its own traffic. When running
+several worker processes with the same application key, A backend can be attached to
+`aiobungie.builders.Settings.rate_limit_backend` so that all processes spend their requests
+from the same buckets.
+
+Example
+-------
+```py
+import aiobungie
+from aiobungie import builders, ratelimit
+
+# All workers on this host point to the same file.
+backend = ratelimit.SQLiteRateLimitBackend("/tmp/aiobungie-ratelimit.sqlite3")
+pool = aiobungie.RESTPool(
+    "token",
+    settings=builders.Settings(rate_limit=20.0, rate_limit_backend=backend),
+)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ("RateLimitBackend", "SQLiteRateLimitBackend")
+
+import abc
+import asyncio
+import pathlib
+import sqlite3
+import threading
+import time
+import typing
+
+if typing.TYPE_CHECKING:
+    import os
+
+
+class RateLimitBackend(abc.ABC):
+    """An interface for a token bucket store that's shared between processes.
+
+    Buckets are identified by name and created on first use. The clients pass the rate
+    and capacity of the bucket on every call, So all processes must be configured with the same limits.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    async def acquire(self, bucket: str, rate: float, capacity: float) -> None:
+        """Wait until a token is available in the shared `bucket` and take it.
+
+        Parameters
+        ----------
+        bucket : `str`
+            The name of the bucket.
+        rate : `float`
+            How many tokens are added to the bucket per second.
+        capacity : `float`
+            The maximum number of tokens the bucket can hold.
+        """
+
+    @abc.abstractmethod
+    async def throttle(self, bucket: str, seconds: float) -> None:
+        """Stop handing out tokens from the shared `bucket` for `seconds`.
+
+        Parameters
+        ----------
+        bucket : `str`
+            The name of the bucket.
+        seconds : `float`
+            How long the bucket should be blocked for.
+        """
+
+    def close(self) -> None:
+        """Release any resources held by this backend."""
+
+
+_SCHEMA: typing.Final[str] = """
+CREATE TABLE IF NOT EXISTS buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    blocked_until REAL NOT NULL
+)
+"""
+
+
+@typing.final
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """A rate limit backend that stores its buckets in an SQLite database in WAL mode.
+
+    Every process on the same host that opens the same file shares the same buckets.
+    Each token is taken within an immediate transaction, So two processes can never take the same token.
+
+    .. note::
+        SQLite locking doesn't work reliably over network file systems,
+        The database should live on a local disk.
+
+    Parameters
+    ----------
+    path : `str | os.PathLike[str]`
+        The path to the database file, It's created if it doesn't exist.
+    timeout : `float`
+        How many seconds to wait for another process to release the database lock. Defaults to `5.0`.
+    """
+
+    __slots__ = ("_path", "_connection", "_lock")
+
+    def __init__(self, path: str | os.PathLike[str], *, timeout: float = 5.0) -> None:
+        self._path = pathlib.Path(path)
+        self._connection = sqlite3.connect(
+            self._path,
+            timeout=timeout,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(_SCHEMA)
+        # The connection is used from the executor's threads.
+        self._lock = threading.Lock()
+
+    @property
+    def path(self) -> pathlib.Path:
+        """The path to the database file."""
+        return self._path
+
+    def _take(self, bucket: str, rate: float, capacity: float) -> float:
+        # Returns how long to wait before trying again, `0` if a token was taken.
+        # Wall clock is used here since monotonic clocks aren't comparable across processes.
+        with self._lock:
+            cursor = self._connection.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = cursor.execute(
+                    "SELECT tokens, updated_at, blocked_until FROM buckets WHERE name = ?",
+                    (bucket,),
+                ).fetchone()
+                if row is None:
+                    tokens, blocked_until = capacity, 0.0
+                else:
+                    tokens = min(capacity, row[0] + max(now - row[1], 0.0) * rate)
+                    blocked_until = row[2]
+
+                if blocked_until > now:
+                    wait = blocked_until - now
+                elif tokens >= 1.0:
+                    tokens -= 1.0
+                    wait = 0.0
+                else:
+                    wait = (1.0 - tokens) / rate
+
+                cursor.execute(
+                    "INSERT OR REPLACE INTO buckets VALUES (?, ?, ?, ?)",
+                    (bucket, tokens, now, blocked_until),
+                )
+                cursor.execute("COMMIT")
+            except BaseException:
+                cursor.execute("ROLLBACK")
+                raise
+
+        return wait
+
+    def _block(self, bucket: str, seconds: float) -> None:
+        with self._lock:
+            now = time.time()
+            self._connection.execute(
+                "INSERT INTO buckets VALUES (?, 0, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "tokens = 0, updated_at = excluded.updated_at, "
+                "blocked_until = MAX(blocked_until, excluded.blocked_until)",
+                (bucket, now, now + seconds),
+            )
+
+    async def acquire(self, bucket: str, rate: float, capacity: float) -> None:
+        loop = asyncio.get_running_loop()
+        while wait := await loop.run_in_executor(
+            None, self._take, bucket, rate, capacity
+        ):
+            await asyncio.sleep(wait)
+
+    async def throttle(self, bucket: str, seconds: float) -> None:
+        await asyncio.get_running_loop().run_in_executor(
+            None, self._block, bucket, seconds
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -29,20 +29,29 @@ __all__ = ("RESTClient", "RESTPool", "TRACE")
 import asyncio
 import contextlib
 import datetime
+import fnmatch
+import functools
+import glob
+import hashlib
 import http
 import logging
 import os
 import pathlib
+import shutil
 import sys
 import typing
 import uuid
 import zipfile
 
 import aiohttp
+import attrs
 
 from aiobungie import api, builders, error, metadata, typedefs, url
 from aiobungie.crates import clans, fireteams
 from aiobungie.internal import _backoff as backoff
+from aiobungie.internal import _bodies as response_bodies
+from aiobungie.internal import _images as image_sessions
+from aiobungie.internal import _ratelimit as ratelimit
 from aiobungie.internal import enums, helpers, time
 
 if typing.TYPE_CHECKING:
@@ -97,6 +106,19 @@ _USER_AGENT: str = (
 # Possible internal error codes.
 _RETRY_5XX: set[int] = {500, 502, 503, 504}
 
+# How many times a request is retried after being ratelimited.
+_MAX_RATELIMIT_RETRIES: typing.Final[int] = 10
+
+# How many bytes are held in memory at once when downloading the manifest.
+_DOWNLOAD_CHUNK_SIZE: typing.Final[int] = 1024 * 1024
+
+# Errors that may interrupt a manifest download after the response has started.
+_INTERRUPTED_DOWNLOAD_ERRORS: typing.Final = (
+    aiohttp.ClientPayloadError,
+    aiohttp.ClientConnectionError,
+    asyncio.TimeoutError,
+)
+
 # HTTP methods.
 _GET: typing.Final[str] = "GET"
 _POST: typing.Final[str] = "POST"
@@ -162,33 +184,199 @@ def _get_path(
     return pathlib.Path(path).joinpath(file_name + ".json")
 
 
-def _write_json_bytes(
-    data: bytes,
-    file_name: str = "manifest",
-    path: pathlib.Path | str = "./",
-) -> None:
-    with _get_path(file_name, path).open("wb") as p:
-        p.write(helpers.dumps(helpers.loads(data)))
-
-
-def _write_sqlite_bytes(
-    data: bytes,
-    path: pathlib.Path | str = "./",
-    file_name: str = "manifest",
-) -> None:
-    with open(f"{_uuid()}.zip", "wb") as tmp:
-        tmp.write(data)
+def _extract_sqlite(archive: pathlib.Path, destination: pathlib.Path) -> None:
+    # The archive holds a single database file, Copy it out in chunks next to
+    # the destination so the final swap is an atomic rename on the same filesystem.
+    tmp = destination.with_name(f".{_uuid()}.sqlite3")
+    try:
+        with zipfile.ZipFile(archive) as zipped:
+            names = zipped.namelist()
+            if not names:
+                raise zipfile.BadZipFile(f"Manifest archive {archive!s} is empty.")
+
+            with zipped.open(names[0]) as source, tmp.open("wb") as target:
+                shutil.copyfileobj(source, target, _DOWNLOAD_CHUNK_SIZE)
+
+        os.replace(tmp, destination)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _version_path(manifest: pathlib.Path) -> pathlib.Path:
+    return manifest.with_name(manifest.name + ".version")
+
+
+def _is_synced(manifest: pathlib.Path, version: str) -> bool:
+    try:
+        return (
+            manifest.exists()
+            and _version_path(manifest).read_text(encoding="utf-8").strip() == version
+        )
+    except FileNotFoundError:
+        return False
+
+
+def _write_version(manifest: pathlib.Path, version: str) -> None:
+    # Written after the manifest itself, If we crash in between the next sync
+    # sees the old version and downloads again.
+    tmp = manifest.with_name(f".{_uuid()}.version")
+    try:
+        tmp.write_text(version, encoding="utf-8")
+        os.replace(tmp, _version_path(manifest))
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def _parse_content_range(value: str | None) -> tuple[int, int | None] | None:
+    # `bytes <start>-<end>/<total>`, The total may be `*` when it's unknown.
+    if not value or not value.startswith("bytes "):
+        return None
+
+    try:
+        span, _, total = value[6:].partition("/")
+        start = int(span.partition("-")[0])
+        return start, None if total in ("", "*") else int(total)
+    except ValueError:
+        return None
+
+
+def _partial_path(destination: pathlib.Path, route: str) -> pathlib.Path:
+    # Content paths change with each manifest version, So a partial file of an
+    # older version is never resumed into a newer one.
+    digest = hashlib.sha1(route.encode()).hexdigest()[:16]
+    return destination.with_name(f".{destination.name}.{digest}.part")
+
+
+def _remove_stale_partials(destination: pathlib.Path, partial: pathlib.Path) -> None:
+    # A partial file of an older version can't be resumed anymore, Without this
+    # one would be left behind for each version whose download was interrupted.
+    pattern = f".{glob.escape(destination.name)}.{'[0-9a-f]' * 16}.part"
+    for stale in destination.parent.glob(pattern):
+        if stale != partial:
+            stale.unlink(missing_ok=True)
+
+
+def _partial_size(path: pathlib.Path) -> int:
+    try:
+        return path.stat().st_size
+    except FileNotFoundError:
+        return 0
+
+
+async def _stream_to_file(
+    response: aiohttp.ClientResponse,
+    path: pathlib.Path,
+    offset: int = 0,
+    executor: concurrent.futures.Executor | None = None,
+) -> int | None:
+    """Write the response body to `path` and return the expected size of the file if known."""
+    expected: int | None = None
+    mode = "wb"
+    if response.status == http.HTTPStatus.PARTIAL_CONTENT:
+        content_range = _parse_content_range(response.headers.get("Content-Range"))
+        if content_range is None or content_range[0] != offset:
+            raise error.HTTPError(
+                f"Got an unexpected Content-Range {response.headers.get('Content-Range')!r} "
+                f"while resuming from {offset} bytes.",
+                http.HTTPStatus.PARTIAL_CONTENT,
+            )
+        mode = "ab"
+        expected = content_range[1]
+
+    elif response.content_length is not None:
+        expected = response.content_length
+
+    loop = asyncio.get_running_loop()
+    file = await loop.run_in_executor(executor, path.open, mode)
+    try:
+        # Network chunks are usually small, Buffer them up so the executor
+        # is only hit once per `_DOWNLOAD_CHUNK_SIZE` bytes.
+        buffer = bytearray()
         try:
-            with zipfile.ZipFile(tmp.name) as zipped:
-                file = zipped.namelist()
-
-                if file:
-                    zipped.extractall(".")
+            # `iter_any` hands over whatever was received before a dropped connection.
+            async for chunk in response.content.iter_any():
+                buffer += chunk
+                if len(buffer) >= _DOWNLOAD_CHUNK_SIZE:
+                    data, buffer = buffer, bytearray()
+                    await loop.run_in_executor(executor, file.write, data)
+        except BaseException:
+            response.close()
+            raise
+        finally:
+            # Keep whatever we received so far, The next attempt resumes from it.
+            if buffer:
+                await loop.run_in_executor(executor, file.write, buffer)
+    finally:
+        await loop.run_in_executor(executor, file.close)
+
+    return expected
+
+
+def _make_limiter(settings: builders.Settings) -> ratelimit.Limiter:
+    return ratelimit.Limiter(
+        settings.max_concurrent_requests,
+        settings.max_concurrent_route_requests,
+        settings.rate_limit,
+        settings.route_rate_limits,
+        settings.rate_limit_backend,
+    )
 
-                    os.rename(file[0], _get_path(file_name, path, sql=True))
 
-        finally:
-            pathlib.Path(tmp.name).unlink(missing_ok=True)
+def _frozen(value: typing.Any, /) -> collections.Hashable:
+    # Query parameters can hold lists and mappings, Which can't be part of a key as is.
+    if isinstance(value, dict):
+        return tuple(
+            sorted(
+                ((str(key), _frozen(inner)) for key, inner in value.items()),  # pyright: ignore
+                key=lambda item: item[0],
+            )
+        )
+    if isinstance(value, (list, tuple)):
+        return tuple(_frozen(inner) for inner in value)  # pyright: ignore
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_frozen(inner) for inner in value)  # pyright: ignore
+    return value
+
+
+def _request_key(
+    route: str,
+    base: bool,
+    auth: str | None,
+    params: collections.Mapping[str, typing.Any] | None,
+) -> collections.Hashable | None:
+    """The key of a request, `None` if its parameters can't be hashed."""
+    key = (route, base, auth, _frozen(dict(params)) if params else None)
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+@typing.final
+class _RequestState:
+    """State that is shared between the clients acquired from the same `RESTPool`."""
+
+    __slots__ = ("inflight", "validators")
+
+    def __init__(self) -> None:
+        self.inflight: dict[
+            collections.Hashable,
+            asyncio.Task[tuple[typedefs.JSONIsh, response_bodies.Body]],
+        ] = {}
+        """`GET` requests that are in flight, By their `_request_key`."""
+        # Dicts keep their insertion order, The first key is the least recently used.
+        self.validators: dict[collections.Hashable, _Validators] = {}
+        """The validators of conditionally requested routes, By their `_request_key`."""
+
+
+@attrs.frozen
+class _Validators:
+    etag: str | None
+    last_modified: str | None
+    body: typedefs.JSONIsh
+    size: int
+    """The size of the response body `body` was decoded from."""
 
 
 class _JSONPayload(aiohttp.BytesPayload):
@@ -203,6 +391,9 @@ class RESTPool:
 
     This allows you to acquire instances of `RESTClient`s from single settings and credentials.
 
+    All clients acquired from the same pool share the concurrency limits
+    set in `aiobungie.builders.Settings`.
+
     Example
     -------
     ```py
@@ -261,6 +452,8 @@ class RESTPool:
         "_loads",
         "_dumps",
         "_settings",
+        "_limiter",
+        "_state",
     )
 
     # Looks like mypy doesn't like this.
@@ -290,6 +483,8 @@ class RESTPool:
         self._loads = loads
         self._dumps = dumps
         self._settings = settings or builders.Settings()
+        self._limiter = _make_limiter(self._settings)
+        self._state = _RequestState()
 
     @property
     def client_id(self) -> int | None:
@@ -423,6 +618,8 @@ class RESTPool:
             client_session=self._client_session,
             owned_client=False,
             settings=self._settings,
+            limiter=self._limiter,
+            state=self._state,
         )
 
 
@@ -470,6 +667,17 @@ class RESTClient(api.RESTClient):
         The max retries number to retry if the request hit a `5xx` status code.
     debug : `bool | str`
         Whether to enable logging responses or not.
+    limiter : `aiobungie.internal._ratelimit.Limiter | None`
+        The limiter that bounds how many requests this client can have in flight.
+        This is passed by `RESTPool` to share the limits between its clients,
+        If `None`, A new one will be created from `settings`.
+    state : `aiobungie.rest._RequestState | None`
+        The in-flight requests and conditional request validators this client shares with other clients.
+        This is passed by `RESTPool` so that its clients coalesce and revalidate requests together,
+        If `None`, This client won't share them with any other client.
+    images : `aiobungie.internal._images.Source | None`
+        Where this client attaches its session while it's open, So the images built with it reuse its connections.
+        This is passed by `Client` and shared with its framework, If `None`, A new one will be created from `settings`.
 
     Logging Levels
     --------------
@@ -481,7 +689,8 @@ class RESTClient(api.RESTClient):
     __slots__ = (
         "_token",
         "_session",
-        "_lock",
+        "_limiter",
+        "_state",
         "_max_retries",
         "_client_secret",
         "_client_id",
@@ -490,6 +699,7 @@ class RESTClient(api.RESTClient):
         "_loads",
         "_owned_client",
         "_settings",
+        "_images",
     )
 
     def __init__(
@@ -506,6 +716,9 @@ class RESTClient(api.RESTClient):
         loads: typedefs.Loads = helpers.loads,
         max_retries: int = 4,
         debug: typing.Literal["TRACE"] | bool | int = False,
+        limiter: ratelimit.Limiter | None = None,
+        state: _RequestState | None = None,
+        images: image_sessions.Source | None = None,
     ) -> None:
         if owned_client is False and client_session is None:
             raise ValueError(
@@ -515,7 +728,15 @@ class RESTClient(api.RESTClient):
         self._settings = settings or builders.Settings()
         self._session = client_session
         self._owned_client = owned_client
-        self._lock: asyncio.Lock | None = None
+        self._limiter = limiter or _make_limiter(self._settings)
+        self._state = state or _RequestState()
+        self._images = (
+            images
+            if images is not None
+            else image_sessions.Source(self._settings.image_cache)
+        )
+        if client_session is not None:
+            self._images.attach(client_session)
         self._client_secret = client_secret
         self._client_id = client_id
         self._token: str = token
@@ -546,6 +767,7 @@ class RESTClient(api.RESTClient):
             raise RuntimeError("REST client is not running.")
 
         if self._owned_client:
+            self._images.detach()
             await self._session.close()
             self._session = None
 
@@ -568,6 +790,7 @@ class RESTClient(api.RESTClient):
                 trust_env=self._settings.trust_env,
                 headers=self._settings.headers,
             )
+            self._images.attach(self._session)
 
     @typing.final
     async def static_request(
@@ -610,6 +833,135 @@ class RESTClient(api.RESTClient):
         json: collections.Mapping[str, typing.Any] | None = None,
         data: collections.Mapping[str, typing.Any] | None = None,
         params: collections.Mapping[str, typing.Any] | None = None,
+        decode: typedefs.Loads | None = None,
+    ) -> typedefs.JSONIsh:
+        # Bodies decoded by a typed decoder aren't plain JSON, So they skip the shared caches.
+        if (
+            method != _GET
+            or oauth2
+            or unwrap_bytes
+            or json
+            or data
+            or decode is not None
+        ):
+            return await self._send(
+                method,
+                route,
+                base=base,
+                oauth2=oauth2,
+                auth=auth,
+                unwrap_bytes=unwrap_bytes,
+                json=json,
+                data=data,
+                params=params,
+                decode=decode,
+            )
+
+        cache = self._settings.response_cache
+        if (
+            cache is not None
+            and (cached := await cache.get(route, params=params, auth=auth, base=base))
+            is not None
+        ):
+            # Empty responses are cached too, Only a missing entry is `None`.
+            return cached
+
+        key = (
+            _request_key(route, base, auth, params)
+            if self._settings.coalesce_requests
+            else None
+        )
+        if key is None:
+            response, body = await self._send_cached(route, base, auth, params)
+        else:
+            # Identical GET requests that are already in flight share the same response.
+            inflight = self._state.inflight
+            if (task := inflight.get(key)) is None:
+                task = asyncio.create_task(self._send_cached(route, base, auth, params))
+                inflight[key] = task
+                task.add_done_callback(functools.partial(self._forget_inflight, key))
+
+            # Shielded so a cancelled caller doesn't cancel the request for everyone else.
+            response, body = await asyncio.shield(task)
+
+        # The request may have been sent from another task, So its body is recorded for each caller.
+        response_bodies.record(body.raw, size=body.size)
+        return response
+
+    async def _send_cached(
+        self,
+        route: str,
+        base: bool,
+        auth: str | None,
+        params: collections.Mapping[str, typing.Any] | None,
+    ) -> tuple[typedefs.JSONIsh, response_bodies.Body]:
+        with response_bodies.measure() as body:
+            response = await self._send(
+                _GET, route, base=base, auth=auth, params=params
+            )
+
+        if (
+            cache := self._settings.response_cache
+        ) is not None and response is not None:
+            await cache.set(route, response, params=params, auth=auth, base=base)
+        return response, body
+
+    def _is_conditional(self, route: str) -> bool:
+        if self._settings.conditional_cache_size < 1:
+            return False
+
+        key = ratelimit.route_key(route)
+        return any(
+            fnmatch.fnmatchcase(key, pattern)
+            for pattern in self._settings.conditional_routes
+        )
+
+    def _remember_validators(
+        self,
+        key: collections.Hashable,
+        response: aiohttp.ClientResponse,
+        body: typedefs.JSONIsh,
+        size: int,
+    ) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (etag or last_modified):
+            return
+
+        cached = self._state.validators
+        cached.pop(key, None)
+        cached[key] = _Validators(
+            etag=etag, last_modified=last_modified, body=body, size=size
+        )
+        while len(cached) > self._settings.conditional_cache_size:
+            del cached[next(iter(cached))]
+
+    def _forget_inflight(
+        self,
+        key: collections.Hashable,
+        task: asyncio.Task[tuple[typedefs.JSONIsh, response_bodies.Body]],
+    ) -> None:
+        self._state.inflight.pop(key, None)
+        # Mark the exception as retrieved in case all callers were cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    @typing.final
+    async def _send(
+        self,
+        method: _HTTP_METHOD,
+        route: str,
+        *,
+        base: bool = False,
+        oauth2: bool = False,
+        auth: str | None = None,
+        unwrap_bytes: bool = False,
+        json: collections.Mapping[str, typing.Any] | None = None,
+        data: collections.Mapping[str, typing.Any] | None = None,
+        params: collections.Mapping[str, typing.Any] | None = None,
+        stream_to: pathlib.Path | None = None,
+        executor: concurrent.futures.Executor | None = None,
+        decode: typedefs.Loads | None = None,
     ) -> typedefs.JSONIsh:
         # This is not None when opening the client.
         assert self._session is not None, (
@@ -618,6 +970,7 @@ class RESTClient(api.RESTClient):
         )
 
         retries: int = 0
+        ratelimited: int = 0
         headers: collections.MutableMapping[str, typing.Any] = {}
 
         headers[_USER_AGENT_HEADERS] = _USER_AGENT
@@ -642,16 +995,47 @@ class RESTClient(api.RESTClient):
             headers["Content-Type"] = "application/x-www-form-urlencoded"
             endpoint = endpoint + url.TOKEN_EP
 
-        if self._lock is None:
-            self._lock = asyncio.Lock()
-
         if json:
             headers["Content-Type"] = _APP_JSON
 
+        # Large and slowly changing routes are requested conditionally, A `304`
+        # means we can reuse the body we decoded last time.
+        conditional_key: collections.Hashable | None = None
+        validators: _Validators | None = None
+        if (
+            method == _GET
+            and not unwrap_bytes
+            and decode is None
+            and self._is_conditional(route)
+            and (conditional_key := _request_key(route, base, auth, params)) is not None
+        ):
+            cached = self._state.validators
+            if (validators := cached.pop(conditional_key, None)) is not None:
+                # Re-insert to mark it as the most recently used.
+                cached[conditional_key] = validators
+                if validators.etag:
+                    headers["If-None-Match"] = validators.etag
+                if validators.last_modified:
+                    headers["If-Modified-Since"] = validators.last_modified
+
+        offset = 0
+        if stream_to is not None:
+            # Ask for the raw bytes so the sizes we resume from and verify against match what's on disk.
+            headers["Accept-Encoding"] = "identity"
+            if offset := _partial_size(stream_to):
+                headers["Range"] = f"bytes={offset}-"
+
         stack = contextlib.AsyncExitStack()
+        # How long to wait before the next attempt, It's slept at the top of the loop
+        # after the limiter slots of the failed attempt were released.
+        delay = 0.0
         while True:
+            if delay:
+                await asyncio.sleep(delay)
+                delay = 0.0
+
             try:
-                await stack.enter_async_context(self._lock)
+                await stack.enter_async_context(self._limiter.acquire(route))
 
                 # We make the request here.
                 taken_time = time.monotonic()
@@ -672,7 +1056,12 @@ class RESTClient(api.RESTClient):
                     response_time,
                 )
 
-                await self._handle_ratelimit(response, method, route)
+                if response.status == http.HTTPStatus.TOO_MANY_REQUESTS:
+                    ratelimited += 1
+                    delay = await self._handle_ratelimit(
+                        response, method, route, ratelimited
+                    )
+                    continue
 
             except aiohttp.ClientConnectionError as exc:
                 if retries >= self._max_retries:
@@ -690,7 +1079,7 @@ class RESTClient(api.RESTClient):
                     self._max_retries - retries,
                 )
                 retries += 1
-                await asyncio.sleep(timer)
+                delay = timer
                 continue
 
             finally:
@@ -699,8 +1088,31 @@ class RESTClient(api.RESTClient):
             if response.status == http.HTTPStatus.NO_CONTENT:
                 return None
 
+            if (
+                stream_to is not None
+                and response.status == http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE
+            ):
+                # The partial file doesn't belong to this body anymore, Start over.
+                _LOGGER.debug(
+                    "ROUTE: %s Can't resume the download, Starting over.", route
+                )
+                response.release()
+                stream_to.unlink(missing_ok=True)
+                headers.pop("Range", None)
+                offset = 0
+                continue
+
+            if response.status == http.HTTPStatus.NOT_MODIFIED and validators:
+                _LOGGER.debug("ROUTE: %s Not modified, Using the stored body.", route)
+                response_bodies.record(None, size=validators.size)
+                return validators.body
+
             # Handle the successful response.
             if 300 > response.status >= 200:
+                if stream_to is not None:
+                    # Large downloads go straight to disk chunk by chunk.
+                    return await _stream_to_file(response, stream_to, offset, executor)
+
                 if unwrap_bytes:
                     # We need to read the bytes for the manifest response.
                     return await response.read()
@@ -715,7 +1127,9 @@ class RESTClient(api.RESTClient):
                         http_status=http.HTTPStatus(response.status),
                     )
 
-                json_data = self._loads(await response.read())
+                raw = await response.read()
+                json_data = (self._loads if decode is None else decode)(raw)
+                response_bodies.record(raw)
 
                 if _LOGGER.isEnabledFor(TRACE):
                     _LOGGER.log(
@@ -742,6 +1156,18 @@ class RESTClient(api.RESTClient):
                 if oauth2:
                     return json_data
 
+                # Bungie tells us to slow down on successful responses too.
+                if throttle_seconds := json_data.get("ThrottleSeconds"):  # type: ignore
+                    await self._limiter.throttle(route, float(throttle_seconds))  # type: ignore
+
+                if conditional_key is not None:
+                    self._remember_validators(
+                        conditional_key,
+                        response,
+                        json_data["Response"],  # type: ignore
+                        len(raw),
+                    )
+
                 # The reason we have a type ignore is because the actual response type
                 # is within this `Response` key.
                 return json_data["Response"]  # type: ignore
@@ -777,16 +1203,14 @@ class RESTClient(api.RESTClient):
     ) -> None:
         await self.close()
 
-    # We don't want this to be super complicated.
     async def _handle_ratelimit(
         self,
         response: aiohttp.ClientResponse,
         method: str,
         route: str,
-    ) -> None:
-        if response.status != http.HTTPStatus.TOO_MANY_REQUESTS:
-            return
-
+        attempts: int,
+    ) -> float:
+        # Returns how long to sleep before retrying, The caller sleeps once the limiter slots are released.
         if response.content_type != _APP_JSON:
             raise error.HTTPError(
                 f"Being ratelimited on non JSON request, {response.content_type}.",
@@ -796,27 +1220,26 @@ class RESTClient(api.RESTClient):
         # The reason we have a type ignore here is that we guaranteed the content type is JSON above.
         json: typedefs.JSONObject = self._loads(await response.read())  # type: ignore
         retry_after = float(json.get("ThrottleSeconds", 15.0)) + 0.1
-        max_calls: int = 0
 
-        while True:
-            if max_calls == 10:
-                # Max retries by default. We raise an error here.
-                raise error.RateLimitedError(
-                    body=json,
-                    url=str(response.real_url),
-                    retry_after=retry_after,
-                )
-
-            # We sleep for a little bit to avoid funky behavior.
-            _LOGGER.warning(
-                "We're being ratelimited, Method %s Route %s. Sleeping for %.2fs.",
-                method,
-                route,
-                retry_after,
+        if attempts > _MAX_RATELIMIT_RETRIES:
+            raise error.RateLimitedError(
+                body=json,
+                url=str(response.real_url),
+                retry_after=retry_after,
             )
-            await asyncio.sleep(retry_after)
-            max_calls += 1
-            continue
+
+        _LOGGER.warning(
+            "We're being ratelimited, Method %s Route %s. Retrying in %.2fs.",
+            method,
+            route,
+            retry_after,
+        )
+
+        # The next attempt waits on the throttled bucket, Unless rate limiting
+        # is disabled, In that case it has to be slept off.
+        if await self._limiter.throttle(route, retry_after):
+            return 0.0
+        return retry_after
 
     async def fetch_oauth2_tokens(self, code: str, /) -> builders.OAuth2Response:
         data = {
@@ -1003,15 +1426,18 @@ class RESTClient(api.RESTClient):
         *,
         page: int = 0,
         limit: int = 1,
+        decode: typedefs.Loads | None = None,
     ) -> typedefs.JSONObject:
+        # `decode` replaces `loads` for this response only, `Client` passes its typed decoder here.
         resp = await self._request(
             _GET,
             f"Destiny2/{int(membership_type)}/Account/"
             f"{member_id}/Character/{character_id}/Stats/Activities"
             f"/?mode={int(mode)}&count={limit}&page={page}",
+            decode=decode,
         )
-        assert isinstance(resp, dict)
-        return resp
+        assert decode is not None or isinstance(resp, dict)
+        return resp  # type: ignore
 
     async def fetch_vendor_sales(self) -> typedefs.JSONObject:
         resp = await self._request(
@@ -1091,10 +1517,13 @@ class RESTClient(api.RESTClient):
         *,
         name: str | None = None,
         type: enums.MembershipType | int = enums.MembershipType.NONE,
+        page: int = 1,
+        decode: typedefs.Loads | None = None,
     ) -> typedefs.JSONObject:
         resp = await self._request(
             _GET,
-            f"/GroupV2/{clan_id}/Members/?memberType={int(type)}&nameSearch={name if name else ''}&currentpage=1",
+            f"GroupV2/{clan_id}/Members/?memberType={int(type)}&nameSearch={name if name else ''}&currentpage={page}",
+            decode=decode,
         )
         assert isinstance(resp, dict)
         return resp
@@ -1249,34 +1678,36 @@ class RESTClient(api.RESTClient):
         path: pathlib.Path | str = ".",
         *,
         force: bool = False,
+        sync: bool = False,
         executor: concurrent.futures.Executor | None = None,
     ) -> pathlib.Path:
+        _ensure_manifest_language(language)
         complete_path = _get_path(name, path, sql=True)
 
-        if complete_path.exists():
-            if force:
-                _LOGGER.info(
-                    f"Found manifest in {complete_path!s}. Forcing to Re-Download."
-                )
-                complete_path.unlink(missing_ok=True)
-
-                return await self.download_sqlite_manifest(
-                    language, name, path, force=force
-                )
+        if complete_path.exists() and not (force or sync):
+            raise FileExistsError(
+                "Manifest file already exists, "
+                "To force download, set the `force` parameter to `True`."
+            )
 
-            else:
-                raise FileExistsError(
-                    "Manifest file already exists, "
-                    "To force download, set the `force` parameter to `True`."
-                )
+        content = await self.fetch_manifest_path()
+        if sync and not force and _is_synced(complete_path, content["version"]):
+            _LOGGER.info(
+                f"Manifest in {complete_path!s} is up to date. Version: {content['version']}"
+            )
+            return complete_path
 
+        # The old file is only replaced once the new one is fully downloaded.
         _LOGGER.info(f"Downloading manifest. Location: {complete_path!s}")
-        data_bytes = await self.read_manifest_bytes(language)
-        await asyncio.get_running_loop().run_in_executor(
-            executor, _write_sqlite_bytes, data_bytes, path, name
+        await self._download_manifest(
+            content["mobileWorldContentPaths"][language],
+            complete_path,
+            executor=executor,
+            archived=True,
         )
+        _write_version(complete_path, content["version"])
         _LOGGER.info("Finished downloading manifest.")
-        return _get_path(name, path, sql=True)
+        return complete_path
 
     async def download_json_manifest(
         self,
@@ -1284,27 +1715,134 @@ class RESTClient(api.RESTClient):
         path: str | pathlib.Path = ".",
         *,
         language: _ALLOWED_LANGS = "en",
+        sync: bool = False,
         executor: concurrent.futures.Executor | None = None,
     ) -> pathlib.Path:
         _ensure_manifest_language(language)
         full_path = _get_path(file_name, path)
-        _LOGGER.info(f"Downloading manifest JSON to {full_path!r}...")
 
         content = await self.fetch_manifest_path()
-        json_bytes = await self._request(
-            _GET,
+        if sync and _is_synced(full_path, content["version"]):
+            _LOGGER.info(
+                f"Manifest JSON in {full_path!s} is up to date. Version: {content['version']}"
+            )
+            return full_path
+
+        _LOGGER.info(f"Downloading manifest JSON to {full_path!r}...")
+        await self._download_manifest(
             content["jsonWorldContentPaths"][language],
-            unwrap_bytes=True,
-            base=True,
+            full_path,
+            executor=executor,
         )
+        _write_version(full_path, content["version"])
+        _LOGGER.info("Finished downloading manifest JSON.")
+        return full_path
+
+    async def download_json_definition(
+        self,
+        definition: str,
+        path: str | pathlib.Path = ".",
+        *,
+        language: _ALLOWED_LANGS = "en",
+        sync: bool = False,
+        executor: concurrent.futures.Executor | None = None,
+        manifest_path: typedefs.JSONObject | None = None,
+    ) -> pathlib.Path:
+        _ensure_manifest_language(language)
+        full_path = _get_path(definition, path)
 
-        assert isinstance(json_bytes, bytes)
-        await asyncio.get_running_loop().run_in_executor(
-            executor, _write_json_bytes, json_bytes, file_name, path
+        content = (
+            manifest_path
+            if manifest_path is not None
+            else await self.fetch_manifest_path()
         )
-        _LOGGER.info("Finished downloading manifest JSON.")
+        try:
+            route = content["jsonWorldComponentContentPaths"][language][definition]
+        except KeyError:
+            raise error.MissingDefinitionError(definition) from None
+
+        if sync and _is_synced(full_path, content["version"]):
+            return full_path
+
+        _LOGGER.info(f"Downloading {definition} to {full_path!r}...")
+        await self._download_manifest(route, full_path, executor=executor)
+        _write_version(full_path, content["version"])
         return full_path
 
+    async def _download_manifest(
+        self,
+        route: str,
+        destination: pathlib.Path,
+        *,
+        executor: concurrent.futures.Executor | None = None,
+        archived: bool = False,
+    ) -> None:
+        # The body is streamed to a partial file in the destination directory,
+        # Readers of the old file never see a partially written manifest.
+        partial = _partial_path(destination, route)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            executor, _remove_stale_partials, destination, partial
+        )
+        await self._download_resumable(route, partial, executor)
+
+        try:
+            if archived:
+                await loop.run_in_executor(
+                    executor, _extract_sqlite, partial, destination
+                )
+            else:
+                await loop.run_in_executor(executor, os.replace, partial, destination)
+        finally:
+            partial.unlink(missing_ok=True)
+
+    async def _download_resumable(
+        self,
+        route: str,
+        partial: pathlib.Path,
+        executor: concurrent.futures.Executor | None = None,
+    ) -> None:
+        backoff_ = backoff.ExponentialBackOff(maximum=8)
+        retries = 0
+        while True:
+            try:
+                # Content paths are absolute, e.g. `/common/destiny2_content/...`.
+                expected = await self._send(
+                    _GET,
+                    route.lstrip("/"),
+                    base=True,
+                    stream_to=partial,
+                    executor=executor,
+                )
+            except _INTERRUPTED_DOWNLOAD_ERRORS as exc:
+                reason = f"<{type(exc).__qualname__}>"
+            else:
+                size = _partial_size(partial)
+                if expected is None or size == expected:
+                    return
+
+                reason = f"Expected {expected} bytes, Got {size}"
+                if size > expected:
+                    # Nothing to resume from, The file is corrupted.
+                    partial.unlink(missing_ok=True)
+
+            if retries >= self._max_retries:
+                raise error.HTTPError(
+                    f"Couldn't download {route}, {reason}.",
+                    http.HTTPStatus.SERVICE_UNAVAILABLE,
+                )
+
+            timer = next(backoff_)
+            _LOGGER.warning(
+                "Manifest download was interrupted %s, Resuming from %i bytes in %.2fs. Remaining retries: %s",
+                reason,
+                _partial_size(partial),
+                timer,
+                self._max_retries - retries,
+            )
+            retries += 1
+            await asyncio.sleep(timer)
+
     async def fetch_manifest_version(self) -> str:
         # This is guaranteed str.
         return (await self.fetch_manifest_path())["version"]
@@ -1819,12 +2357,14 @@ class RESTClient(api.RESTClient):
         assert isinstance(resp, int)
         return resp
 
-    async def fetch_post_activity(self, instance_id: int, /) -> typedefs.JSONObject:
+    async def fetch_post_activity(
+        self, instance_id: int, /, *, decode: typedefs.Loads | None = None
+    ) -> typedefs.JSONObject:
         resp = await self._request(
-            _GET, f"Destiny2/Stats/PostGameCarnageReport/{instance_id}"
+            _GET, f"Destiny2/Stats/PostGameCarnageReport/{instance_id}", decode=decode
         )
-        assert isinstance(resp, dict)
-        return resp
+        assert decode is not None or isinstance(resp, dict)
+        return resp  # type: ignore
 
     @helpers.unstable
     async def search_entities(
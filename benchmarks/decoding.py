@@ -0,0 +1,96 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compares the default `Framework` deserialization against `aiobungie.decoding.TypedDecoder`.
+
+Both paths start from the raw response bytes, The default one decodes them with
+`aiobungie.internal.helpers.loads` first.
+
+Run with `python -m benchmarks.decoding` from the repository root, This requires `msgspec` to be installed.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+from aiobungie import decoding, framework
+from aiobungie.internal import helpers
+from benchmarks import payloads
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+_ROUNDS = 5
+
+
+def _best(function: collections.Callable[[], typing.Any], number: int) -> float:
+    return min(timeit.repeat(function, number=number, repeat=_ROUNDS)) / number
+
+
+def main() -> None:
+    decoder = decoding.TypedDecoder()
+    default = framework.Global
+
+    cases: tuple[tuple[str, bytes, typing.Any, typing.Any, int], ...] = (
+        (
+            "clan members (100)",
+            payloads.body(payloads.clan_members()),
+            lambda raw: default.deserialize_clan_members(
+                helpers.loads(raw)["Response"]  # type: ignore
+            ).collect(),
+            decoder.decode_clan_members,
+            200,
+        ),
+        (
+            "activities (250)",
+            payloads.body(payloads.activities()),
+            lambda raw: default.deserialize_activities(
+                helpers.loads(raw)["Response"]  # type: ignore
+            ).collect(),
+            decoder.decode_activities,
+            100,
+        ),
+        (
+            "post activity (12 players)",
+            payloads.body(payloads.post_activity()),
+            lambda raw: default.deserialize_post_activity(
+                helpers.loads(raw)["Response"]  # type: ignore
+            ),
+            decoder.decode_post_activity,
+            1000,
+        ),
+    )
+
+    print(f"{'payload':<28}{'size':>10}{'framework':>14}{'typed':>14}{'speedup':>10}")
+    for name, raw, slow, fast, number in cases:
+        slow_time = _best(lambda: slow(raw), number)
+        fast_time = _best(lambda: fast(raw), number)
+        print(
+            f"{name:<28}{len(raw) // 1024:>8}KB"
+            f"{slow_time * 1e6:>12.1f}us{fast_time * 1e6:>12.1f}us"
+            f"{slow_time / fast_time:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
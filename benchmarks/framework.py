@@ -0,0 +1,86 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Compares the hand-written `Framework` deserializers against `GeneratedFramework`.
+
+Both deserialize the same already decoded payloads.
+
+Run with `python -m benchmarks.framework` from the repository root.
+"""
+
+from __future__ import annotations
+
+import timeit
+import typing
+
+from aiobungie import framework
+from benchmarks import payloads
+
+_ROUNDS = 5
+
+
+def main() -> None:
+    default = framework.Framework()
+    generated = framework.GeneratedFramework()
+
+    clan_members = payloads.clan_members()
+    activities = payloads.activities()
+    post_activity = payloads.post_activity()
+    items = [payloads.inventory_item(hash) for hash in range(100)]
+
+    cases: tuple[tuple[str, typing.Any, int], ...] = (
+        (
+            "clan members (100)",
+            lambda f: f.deserialize_clan_members(clan_members).collect(),
+            200,
+        ),
+        (
+            "activities (250)",
+            lambda f: f.deserialize_activities(activities).collect(),
+            100,
+        ),
+        (
+            "post activity (12 players)",
+            lambda f: f.deserialize_post_activity(post_activity),
+            1000,
+        ),
+        (
+            "inventory entities (100)",
+            lambda f: [f.deserialize_inventory_entity(item) for item in items],
+            200,
+        ),
+    )
+
+    print(f"{'payload':<28}{'framework':>14}{'generated':>14}{'speedup':>10}")
+    for name, run, number in cases:
+        times = [
+            min(timeit.repeat(lambda: run(f), number=number, repeat=_ROUNDS)) / number
+            for f in (default, generated)
+        ]
+        print(
+            f"{name:<28}{times[0] * 1e6:>12.1f}us{times[1] * 1e6:>12.1f}us"
+            f"{times[0] / times[1]:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
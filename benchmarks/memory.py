@@ -0,0 +1,86 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Measures the memory kept alive by deserialized inventory entities with and without interning.
+
+A large inventory is decoded from JSON, So every string is its own object like in a real response,
+Then deserialized and kept around as a long-lived cache of entities would.
+
+Run with `python -m benchmarks.memory` from the repository root.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import tracemalloc
+import typing
+
+from aiobungie import framework
+from benchmarks import payloads
+
+_ITEMS = 5000
+_ICONS = 50
+"""The number of distinct icons, Inventories share a few icons between many items."""
+
+
+def _inventory() -> bytes:
+    items: list[dict[str, typing.Any]] = []
+    for hash in range(_ITEMS):
+        item = payloads.inventory_item(hash)
+        item["displayProperties"]["icon"] = (
+            f"/common/destiny2_content/icons/{hash % _ICONS}.jpg"
+        )
+        items.append(item)
+    return json.dumps(items).encode()
+
+
+def _retained(deserializer: framework.Framework, raw: bytes) -> tuple[int, int]:
+    gc.collect()
+    tracemalloc.start()
+    items = json.loads(raw)
+    entities = [deserializer.deserialize_inventory_entity(item) for item in items]
+    # Only the entities are kept, Like a cache of deserialized entities would.
+    del items
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    paths = {id(entity.icon.path) for entity in entities}
+    del entities
+    return retained, len(paths)
+
+
+def main() -> None:
+    raw = _inventory()
+
+    print(f"{'framework':<16}{'retained':>12}{'paths':>10}")
+    for name, deserializer in (
+        ("intern_size=0", framework.Framework(intern_size=0)),
+        ("default", framework.Framework()),
+    ):
+        retained, paths = _retained(deserializer, raw)
+        print(f"{name:<16}{retained / 1024:>10.0f}KB{paths:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Synthetic payloads shaped like Bungie's responses, Shared between the benchmarks."""
+
+from __future__ import annotations
+
+import typing
+
+from aiobungie.internal import helpers
+
+
+def stat(value: float, display: str = "") -> dict[str, typing.Any]:
+    return {"basic": {"value": value, "displayValue": display or str(value)}}
+
+
+def membership(id: int) -> dict[str, typing.Any]:
+    return {
+        "membershipId": str(4611686018484639825 + id),
+        "membershipType": 3,
+        "isPublic": True,
+        "crossSaveOverride": 3,
+        "LastSeenDisplayName": f"Guardian{id}",
+        "LastSeenDisplayNameType": 3,
+        "displayName": f"Guardian{id}",
+        "bungieGlobalDisplayName": f"Guardian{id}",
+        "bungieGlobalDisplayNameCode": 1234,
+        "iconPath": "/img/theme/bungienet/icons/steamLogo.png",
+        "applicableMembershipTypes": [3, 1],
+    }
+
+
+def values() -> dict[str, typing.Any]:
+    # Bungie sends a few more stats than the ones the crates hold.
+    names = (
+        "assists score kills averageScorePerKill deaths averageScorePerLife completed "
+        "opponentsDefeated efficiency killsDeathsRatio killsDeathsAssists "
+        "activityDurationSeconds completionReason fireteamId startSeconds "
+        "timePlayedSeconds playerCount teamScore"
+    ).split()
+    return {name: stat(float(index)) for index, name in enumerate(names)}
+
+
+def activity(id: int) -> dict[str, typing.Any]:
+    return {
+        "period": "2023-01-07T18:10:41Z",
+        "activityDetails": {
+            "referenceId": 2693136600,
+            "directorActivityHash": 2693136605,
+            "instanceId": str(14745213405 + id),
+            "mode": 4,
+            "modes": [7, 4],
+            "isPrivate": False,
+            "membershipType": 3,
+        },
+        "values": values(),
+    }
+
+
+def clan_members() -> dict[str, typing.Any]:
+    return {
+        "results": [
+            {
+                "memberType": 2,
+                "isOnline": False,
+                "lastOnlineStatusChange": "1700000000",
+                "groupId": "4389205",
+                "destinyUserInfo": membership(id),
+                "bungieNetUserInfo": membership(id),
+                "joinDate": "2021-05-04T17:50:21Z",
+            }
+            for id in range(100)
+        ],
+        "totalResults": 100,
+        "hasMore": False,
+    }
+
+
+def activities() -> dict[str, typing.Any]:
+    return {"activities": [activity(id) for id in range(250)]}
+
+
+def post_activity() -> dict[str, typing.Any]:
+    weapon_values = {
+        "uniqueWeaponKills": stat(5.0),
+        "uniqueWeaponPrecisionKills": stat(2.0),
+        "uniqueWeaponKillsPrecisionKills": stat(0.4),
+    }
+    return {
+        **activity(0),
+        "startingPhaseIndex": 0,
+        "entries": [
+            {
+                "standing": 0,
+                "score": stat(120.0),
+                "characterId": "2305843009299499863",
+                "player": {
+                    "destinyUserInfo": membership(id),
+                    "characterClass": "Warlock",
+                    "classHash": 2271682572,
+                    "raceHash": 898834093,
+                    "genderHash": 3111576190,
+                    "characterLevel": 50,
+                    "lightLevel": 1810,
+                    "emblemHash": 4132147344,
+                },
+                "values": values(),
+                "extended": {
+                    "weapons": [
+                        {"referenceId": hash, "values": weapon_values}
+                        for hash in range(4)
+                    ],
+                    "values": {
+                        name: stat(1.0)
+                        for name in (
+                            "precisionKills",
+                            "weaponKillsGrenade",
+                            "weaponKillsMelee",
+                            "weaponKillsSuper",
+                            "weaponKillsAbility",
+                        )
+                    },
+                },
+            }
+            for id in range(12)
+        ],
+        "teams": [
+            {
+                "teamId": id,
+                "standing": stat(0.0),
+                "score": stat(75.0),
+                "teamName": "Alpha",
+            }
+            for id in range(2)
+        ],
+    }
+
+
+def body(response: typing.Any) -> bytes:
+    return helpers.dumps({"Response": response, "ErrorCode": 1, "ThrottleSeconds": 0})
+
+
+def inventory_item(hash: int) -> dict[str, typing.Any]:
+    return {
+        "hash": hash,
+        "index": 1,
+        "displayProperties": {
+            "name": f"item {hash}",
+            "description": "A weapon",
+            "hasIcon": True,
+            "icon": "/common/destiny2_content/icons/icon.jpg",
+        },
+        "collectibleHash": 3810740723,
+        "flavorText": "Flavor text",
+        "itemTypeDisplayName": "Auto Rifle",
+        "itemTypeAndTierDisplayName": "Exotic Auto Rifle",
+        "uiItemDisplayStyle": "ui_display_style_weapon",
+        "displaySource": "",
+        "screenshot": "/common/destiny2_content/screenshots/screenshot.jpg",
+        "iconWatermark": "/common/destiny2_content/icons/watermark.png",
+        "iconWatermarkShelved": "/common/destiny2_content/icons/shelved.png",
+        "loreHash": 1,
+        "summaryItemHash": 3520001075,
+        "breakerType": 0,
+        "defaultDamageType": 1,
+        "defaultDamageTypeHash": 3373582085,
+        "damageTypes": [1],
+        "damageTypeHashes": [3373582085],
+        "itemType": 3,
+        "itemSubType": 6,
+        "classType": 3,
+        "itemCategoryHashes": [2, 1, 5],
+        "tooltipNotifications": [],
+        "nonTransferrable": False,
+        "allowActions": True,
+        "equippable": True,
+        "doesPostmasterPullHaveSideEffects": False,
+        "traitHashes": [1, 2, 3],
+        "traitIds": ["item_type.weapon", "weapon_type.auto_rifle"],
+        "backgroundColor": {"red": 0, "green": 0, "blue": 0, "alpha": 0},
+        "seasonHash": 2809059425,
+        "inventory": {
+            "tierType": 6,
+            "tierTypeHash": 4008398120,
+            "tierTypeName": "Exotic",
+            "bucketTypeHash": 1498876634,
+            "recoveryBucketTypeHash": 215593132,
+            "isInstanceItem": True,
+            "suppressExpirationWhenObjectivesComplete": True,
+            "maxStackSize": 1,
+            "stackUniqueLabel": "",
+        },
+        "stats": {"stats": {}},
+        "sockets": {"socketEntries": []},
+    }
@@ -1,43 +1,38 @@
-"""A basic example on how to cache objects in memory to avoid making HTTP requests."""
+"""A basic example on how to cache responses to avoid making HTTP requests."""
 
 import aiobungie
 import asyncio
 
-client = aiobungie.Client("TOKEN")
+from aiobungie import builders, cache
 
+# The definition endpoints are cached by default, You can add your own route
+# patterns with how many seconds the responses of matching routes should be cached for.
+policies = dict(cache.DEFAULT_POLICIES)
+policies["Destiny2/{}/Profile/{}"] = 30.0
 
-# Setup some global map locations in the client metadata.
-# This function usually will run once at the start of your program.
-def setup_cache():
-    client.metadata["items"] = {}
-
-
-async def get_item(item_id: int) -> aiobungie.crates.InventoryEntity:
-    items: dict[int, aiobungie.crates.InventoryEntity] = client.metadata["items"]
-
-    # Check if the item is cached in our client metadata.
-    # Returns the item if it was cached otherwise perform an HTTP request fetching it.
-    if (item := items.get(item_id)) is not None:
-        return item
-
-    # fetch and store the item for later access
-    item = await client.fetch_inventory_item(item_id)
-    items[item_id] = item
-    return item
+# `MemoryCache` keeps the responses in memory, `SQLiteCache` keeps them on disk
+# which survives restarts and can be shared between processes.
+response_cache = cache.ResponseCache(cache.MemoryCache(max_size=4096), policies)
+client = aiobungie.Client(
+    "TOKEN", settings=builders.Settings(response_cache=response_cache)
+)
 
 
 async def main() -> None:
-    setup_cache()
-
-    # We call this `get_item` 5 times concurrently, The first call will be an HTTP request,
-    # The rest will be retrieved from the cache.
-    item_tasks = (asyncio.create_task(get_item(item_id)) for item_id in range(5))
-    items = await asyncio.gather(*item_tasks)
-    for item in items:
-        ...
-
-    for item_id, item in client.metadata["items"].items():
-        print(item_id, item)
+    async with client.rest:
+        # We fetch the same 5 items twice, The first round will be HTTP requests,
+        # The second round will be retrieved from the cache.
+        for _ in range(2):
+            items = await asyncio.gather(
+                *(client.fetch_inventory_item(item_id) for item_id in range(5))
+            )
+            for item in items:
+                print(item)
+
+        # Drop a single item from the cache, The next call will be an HTTP request again.
+        await response_cache.invalidate(
+            "Destiny2/Manifest/DestinyInventoryItemDefinition/0"
+        )
 
 
 if __name__ == "__main__":
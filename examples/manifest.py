@@ -16,13 +16,15 @@
 # * download_json_manifest
 # Same as download_manifest but it will download the JSON manifest instead of SQLite.
 #
+# * download_json_definition
+# Downloads a single definition of the JSON manifest, i.e., `DestinyInventoryItemDefinition`.
+#
 # * fetch_manifest_version
 # Performs an HTTP request fetching the latest version of the manifest.
 
 import asyncio
 import json
 import random
-import sqlite3
 import concurrent.futures as concurrent
 
 import aiobungie
@@ -58,25 +60,25 @@ async def sqlite_manifest() -> None:
     manifest_version = await client.fetch_manifest_version()
     print(manifest_version)
 
-    # Connect to the manifest database.
+    # Query the manifest database.
     # `download_sqlite_manifest` returns a Python `Path` object
-    # of the manifest, so we can safely directly pass it to the connection constructor.
-    manifest = sqlite3.connect(manifest_path)
-    manifest.row_factory = sqlite3.Row
-
-    # Select an inventory item from the manifest and return the object if it matches the given id.
-    levante_prize_json = (
-        manifest.cursor()
-        .execute(
-            "SELECT json FROM DestinyInventoryItemDefinition WHERE id = -757221402"
-        )
-        .fetchone()
-    )
-    print(levante_prize_json[0])
+    # of the manifest, so we can safely directly pass it to `Manifest`.
+    with aiobungie.manifest.Manifest(manifest_path) as manifest:
+        # Select an inventory item from the manifest by its hash, The conversion
+        # to the signed ids the database uses is done for us.
+        levante_prize = await manifest.fetch_inventory_item(3537745894)
+        print(levante_prize)
+
+        # Many items are selected in batches.
+        items = await manifest.fetch_inventory_items([3537745894, 1216319404])
+        print(items)
+
+        # Or the raw JSON of any definition.
+        print(await manifest.fetch("DestinyInventoryItemDefinition", 3537745894))
 
 
 async def json_manifest() -> None:
-    # Download the JSON manifest.
+    # Download the whole JSON manifest.
     manifest = await client.download_json_manifest()
 
     with manifest.open("r") as file:
@@ -87,9 +89,18 @@ async def json_manifest() -> None:
         print(random_item)
 
 
+async def json_definitions() -> None:
+    # Or only download and parse the definitions that are actually used.
+    # Each definition is downloaded on first access and kept on disk until Bungie publishes a new version.
+    definitions = aiobungie.manifest.JSONManifest(client, "./manifest", language="en")
+    item = await definitions.fetch_inventory_item(3537745894)
+    print(item)
+
+
 async def main():
     async with client:
         await json_manifest()
+        # await json_definitions()
         # await sqlite_manifest()
 
 
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Synthetic Bungie payloads shared between tests."""
+
+from __future__ import annotations
+
+import typing
+
+from aiobungie.internal import helpers
+
+
+def stat(value: typing.Any, display: str = "") -> dict[str, typing.Any]:
+    return {"basic": {"value": value, "displayValue": display or str(value)}}
+
+
+def membership(id: int, **kwargs: typing.Any) -> dict[str, typing.Any]:
+    return {
+        "membershipId": str(id),
+        "membershipType": 3,
+        "isPublic": True,
+        "crossSaveOverride": 3,
+        "displayName": f"Guardian{id}",
+        "bungieGlobalDisplayName": f"Guardian{id}",
+        "bungieGlobalDisplayNameCode": 1234,
+        "iconPath": "/img/theme/bungienet/icons/steamLogo.png",
+        "applicableMembershipTypes": [3, 1],
+        **kwargs,
+    }
+
+
+def clan_member(id: int) -> dict[str, typing.Any]:
+    return {
+        "memberType": 2,
+        "isOnline": bool(id % 2),
+        "lastOnlineStatusChange": "1700000000",
+        "groupId": "4389205",
+        "destinyUserInfo": membership(id, LastSeenDisplayName=f"Last{id}"),
+        "bungieNetUserInfo": membership(id + 1),
+        "joinDate": "2021-05-04T17:50:21Z",
+    }
+
+
+def activity_values(**extra: typing.Any) -> dict[str, typing.Any]:
+    return {
+        "assists": stat(3.0),
+        "score": stat(0.0),
+        "kills": stat(12.0),
+        "averageScorePerKill": stat(0.0),
+        "deaths": stat(2.0),
+        "averageScorePerLife": stat(0.0),
+        "completed": stat(1.0, "Yes"),
+        "opponentsDefeated": stat(15.0),
+        "efficiency": stat(7.5),
+        "killsDeathsRatio": stat(6.0),
+        "killsDeathsAssists": stat(6.75),
+        "activityDurationSeconds": stat(1200.0, "20m 0s"),
+        "completionReason": stat(0.0, "Objective Completed"),
+        "fireteamId": stat(1.0e18),
+        "startSeconds": stat(0.0),
+        "timePlayedSeconds": stat(1200.0, "20m 0s"),
+        "playerCount": stat(3.0),
+        "teamScore": stat(0.0),
+        **extra,
+    }
+
+
+def activity(instance_id: int) -> dict[str, typing.Any]:
+    return {
+        "period": "2023-01-07T18:10:41Z",
+        "activityDetails": {
+            "referenceId": 2693136600,
+            "directorActivityHash": 2693136605,
+            "instanceId": str(instance_id),
+            "mode": 4,
+            "modes": [7, 4],
+            "isPrivate": False,
+            "membershipType": 3,
+        },
+        "values": activity_values(),
+    }
+
+
+def post_activity() -> dict[str, typing.Any]:
+    weapon = {
+        "referenceId": 1216319404,
+        "values": {
+            "uniqueWeaponKills": stat(5.0),
+            "uniqueWeaponPrecisionKills": stat(2.0),
+            "uniqueWeaponKillsPrecisionKills": stat(0.4, "40%"),
+        },
+    }
+    extended = {
+        "weapons": [weapon],
+        "values": {
+            "precisionKills": stat(2.0),
+            "weaponKillsGrenade": stat(1.0),
+            "weaponKillsMelee": stat(0.0),
+            "weaponKillsSuper": stat(3.0),
+            "weaponKillsAbility": stat(1.0),
+        },
+    }
+    return {
+        **activity(14745213405),
+        "startingPhaseIndex": 0,
+        "entries": [
+            {
+                "standing": 0,
+                "score": stat(120.0),
+                "characterId": "2305843009299499863",
+                "player": {
+                    "destinyUserInfo": membership(player),
+                    "characterClass": "Warlock",
+                    "classHash": 2271682572,
+                    "raceHash": 898834093,
+                    "genderHash": 3111576190,
+                    "characterLevel": 50,
+                    "lightLevel": 1810,
+                    "emblemHash": 4132147344,
+                },
+                "values": activity_values(team=stat(17.0)),
+                "extended": extended,
+            }
+            for player in range(3)
+        ],
+        "teams": [
+            {
+                "teamId": 17,
+                "standing": stat(0.0, "Victory"),
+                "score": stat(75.0),
+                "teamName": "Alpha",
+            }
+        ],
+    }
+
+
+def objective(hash: int) -> dict[str, typing.Any]:
+    return {
+        "hash": hash,
+        "index": 1,
+        "displayProperties": {"name": "", "description": "Kills", "hasIcon": False},
+        "unlockValueHash": 0,
+        "completionValue": 100,
+        "scope": 0,
+        "locationHash": 0,
+        "allowNegativeValue": False,
+        "allowValueChangeWhenCompleted": False,
+        "isCountingDownward": False,
+        "valueStyle": 0,
+        "progressDescription": "Kills",
+        "perks": {},
+        "stats": {},
+        "minimumVisibilityThreshold": 0,
+        "allowOvercompletion": True,
+        "showValueOnComplete": True,
+        "isDisplayOnlyObjective": False,
+        "completedValueStyle": 0,
+        "inProgressValueStyle": 0,
+        "uiLabel": "",
+        "uiStyle": 0,
+    }
+
+
+def body(response: typing.Any) -> bytes:
+    return helpers.dumps(
+        {
+            "Response": response,
+            "ErrorCode": 1,
+            "ThrottleSeconds": 0,
+            "ErrorStatus": "Success",
+            "Message": "Ok",
+            "MessageData": {},
+        }
+    )
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import pathlib
+
+import pytest
+
+from aiobungie import cache
+
+
+class TestMemoryCache:
+    @pytest.mark.asyncio()
+    async def test_get_set(self):
+        backend = cache.MemoryCache()
+        await backend.set("key", {"value": 1}, ttl=10)
+        assert await backend.get("key") == {"value": 1}
+        assert await backend.get("missing") is None
+
+    @pytest.mark.asyncio()
+    async def test_expired(self):
+        backend = cache.MemoryCache()
+        await backend.set("key", {"value": 1}, ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await backend.get("key") is None
+        assert len(backend) == 0
+
+    @pytest.mark.asyncio()
+    async def test_lru_eviction(self):
+        backend = cache.MemoryCache(max_size=2)
+        await backend.set("a", 1, ttl=10)
+        await backend.set("b", 2, ttl=10)
+        # Touch `a` so `b` becomes the least recently used.
+        await backend.get("a")
+        await backend.set("c", 3, ttl=10)
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+        assert await backend.get("c") == 3
+
+
+class TestSQLiteCache:
+    @pytest.fixture()
+    def backend(self, tmp_path: pathlib.Path):
+        backend = cache.SQLiteCache(tmp_path / "cache.sqlite3", max_size=2)
+        yield backend
+        backend.close()
+
+    @pytest.mark.asyncio()
+    async def test_get_set(self, backend: cache.SQLiteCache):
+        await backend.set("key", {"value": 1}, ttl=10)
+        assert await backend.get("key") == {"value": 1}
+
+        await backend.delete("key")
+        assert await backend.get("key") is None
+
+    @pytest.mark.asyncio()
+    async def test_expired(self, backend: cache.SQLiteCache):
+        await backend.set("key", {"value": 1}, ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await backend.get("key") is None
+
+    @pytest.mark.asyncio()
+    async def test_eviction(self, backend: cache.SQLiteCache):
+        for key in ("a", "b", "c"):
+            await backend.set(key, {"key": key}, ttl=10)
+            await asyncio.sleep(0.001)
+
+        assert await backend.get("a") is None
+        assert await backend.get("c") == {"key": "c"}
+
+
+class TestImageCache:
+    @pytest.mark.asyncio()
+    async def test_get_set(self, tmp_path: pathlib.Path):
+        backend = cache.ImageCache(tmp_path)
+        await backend.set("/icon.png", b"icon")
+        assert await backend.get("/icon.png") == b"icon"
+        assert await backend.get("/missing.png") is None
+        assert backend.size == 4
+
+        await backend.delete("/icon.png")
+        assert await backend.get("/icon.png") is None
+        assert not any(tmp_path.iterdir())
+
+    @pytest.mark.asyncio()
+    async def test_size_eviction(self, tmp_path: pathlib.Path):
+        backend = cache.ImageCache(tmp_path, max_size=8)
+        await backend.set("a", b"aaa")
+        await backend.set("b", b"bbb")
+        # Touch `a` so `b` becomes the least recently used.
+        await backend.get("a")
+        await backend.set("c", b"ccc")
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == b"aaa"
+        assert backend.size == 6
+        assert len(backend) == len(list(tmp_path.iterdir())) == 2
+
+    @pytest.mark.asyncio()
+    async def test_too_large(self, tmp_path: pathlib.Path):
+        backend = cache.ImageCache(tmp_path, max_size=2)
+        await backend.set("a", b"aaa")
+        assert await backend.get("a") is None
+
+    @pytest.mark.asyncio()
+    async def test_persists(self, tmp_path: pathlib.Path):
+        await cache.ImageCache(tmp_path).set("a", b"aaa")
+        partial = tmp_path / f"{'0' * 64}.1234.5678.partial"
+        partial.write_bytes(b"a")
+
+        backend = cache.ImageCache(tmp_path)
+        assert await backend.get("a") == b"aaa"
+        assert backend.size == 3
+        assert not partial.exists()
+
+        await backend.clear()
+        assert not any(tmp_path.iterdir())
+
+    @pytest.mark.asyncio()
+    async def test_leaves_other_files(self, tmp_path: pathlib.Path):
+        (tmp_path / "icon.png").write_bytes(b"png")
+        (tmp_path / "notes").write_bytes(b"notes")
+
+        backend = cache.ImageCache(tmp_path, max_size=4)
+        assert len(backend) == 0
+        await backend.set("a", b"aaa")
+        await backend.set("b", b"bbb")
+        await backend.clear()
+
+        assert sorted(file.name for file in tmp_path.iterdir()) == ["icon.png", "notes"]
+
+
+class TestResponseCache:
+    def test_ttl_for(self):
+        response_cache = cache.ResponseCache()
+        assert response_cache.ttl_for(
+            "Destiny2/Manifest/DestinyInventoryItemDefinition/1216319404"
+        )
+        assert response_cache.ttl_for("Destiny2/Clan/ClanBannerDictionary/")
+        assert not response_cache.ttl_for("Destiny2/3/Profile/4611686018484639825/")
+
+    def test_keys_are_scoped_by_auth(self):
+        route = "Destiny2/3/Profile/4611686018484639825/"
+        public = cache.ResponseCache.make_key(route)
+        first = cache.ResponseCache.make_key(route, auth="first")
+        second = cache.ResponseCache.make_key(route, auth="second")
+
+        assert len({public, first, second}) == 3
+        assert "first" not in first
+
+    def test_keys_are_scoped_by_base(self):
+        route = "Destiny2/Manifest/DestinyInventoryItemDefinition/1"
+        assert cache.ResponseCache.make_key(route) != cache.ResponseCache.make_key(
+            route, base=True
+        )
+
+    @pytest.mark.asyncio()
+    async def test_uncached_route(self):
+        response_cache = cache.ResponseCache()
+        await response_cache.set("User/GetBungieNetUserById/1/", {"id": 1})
+        assert await response_cache.get("User/GetBungieNetUserById/1/") is None
+
+    @pytest.mark.asyncio()
+    async def test_invalidate(self):
+        response_cache = cache.ResponseCache()
+        route = "Destiny2/Manifest/DestinyInventoryItemDefinition/1"
+        await response_cache.set(route, {"hash": 1})
+        assert await response_cache.get(route) == {"hash": 1}
+
+        await response_cache.invalidate(route)
+        assert await response_cache.get(route) is None
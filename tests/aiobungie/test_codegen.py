@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import linecache
+import traceback
+import typing
+
+import attrs
+import pytest
+
+from aiobungie.internal import codegen
+
+
+@attrs.frozen(kw_only=True)
+class Point:
+    x: typing.Any
+    y: typing.Any = None
+
+
+def build(**fields: codegen.Rule) -> typing.Any:
+    function = codegen.generate("build_point", codegen.Spec(Point, fields))
+    return lambda payload: function(None, payload)
+
+
+class TestGenerate:
+    def test_key(self):
+        build_point = build(x=codegen.Key(("a", "b"), int), y=codegen.Key("c"))
+        assert build_point({"a": {"b": "1"}, "c": 2}) == Point(x=1, y=2)
+
+        with pytest.raises(KeyError):
+            build_point({"c": 2})
+
+    def test_converters_in_order(self):
+        build_point = build(x=codegen.Key("a", (int, str)))
+        assert build_point({"a": 1.5}) == Point(x="1")
+
+    @pytest.mark.parametrize(
+        ("check", "value", "expected"),
+        [
+            ("truthy", 0, -1),
+            ("truthy", 2, 4),
+            ("not_none", 0, 0),
+            ("not_none", None, -1),
+            ("present", None, -1),
+        ],
+    )
+    def test_maybe(self, check: typing.Any, value: typing.Any, expected: int):
+        double = lambda v: v * 2  # noqa: E731
+        build_point = build(x=codegen.Maybe("a", double, default=-1, check=check))
+
+        payload = {} if check == "present" else {"a": value}
+        assert build_point(payload).x == expected
+
+    def test_maybe_rule_default(self):
+        build_point = build(x=codegen.Maybe("a", default=codegen.Get("b", "")))
+        assert build_point({"a": "", "b": "b"}).x == "b"
+        assert build_point({}).x == ""
+
+    def test_each(self):
+        build_point = build(
+            x=codegen.Each("a", int),
+            y=codegen.Each("b", default=None, check="truthy"),
+        )
+        assert build_point({"a": ["1", "2"], "b": []}) == Point(x=(1, 2), y=None)
+
+    def test_in(self):
+        build_point = build(
+            x=codegen.In("a", codegen.Key("b"), default=0),
+            y=codegen.In("a", codegen.In("c", codegen.Key("d"))),
+        )
+        assert build_point({"a": {"b": 1, "c": {"d": 2}}}) == Point(x=1, y=2)
+        assert build_point({"a": {}}) == Point(x=0, y=None)
+        assert build_point({"a": {"b": 1}}) == Point(x=1, y=None)
+
+    def test_bindings(self):
+        function = codegen.generate(
+            "build_point",
+            codegen.Spec(
+                Point,
+                {
+                    "x": codegen.Attr("inner", "x"),
+                    "y": codegen.Pack((codegen.Const(1),)),
+                },
+                bindings={"inner": codegen.Key("a", "build")},
+            ),
+        )
+
+        class Framework:
+            def build(self, payload: typing.Any) -> Point:
+                return Point(x=payload)
+
+        assert function(Framework(), {"a": 5}) == Point(x=5, y=(1,))
+
+    def test_defaults_are_not_shared(self):
+        build_point = build(x=codegen.Get("a", {}))
+        assert build_point({}).x is not build_point({}).x
+
+    def test_shared_lookups_are_hoisted(self):
+        function = codegen.generate(
+            "build_point",
+            codegen.Spec(
+                Point, {"x": codegen.Key(("a", "b")), "y": codegen.Key(("a", "c"))}
+            ),
+        )
+        assert "= payload['a']" in function.__source__
+
+    def test_tracebacks_show_source(self):
+        build_point = build(x=codegen.Key("missing"))
+        with pytest.raises(KeyError) as exc:
+            build_point({})
+
+        frame = traceback.extract_tb(exc.value.__traceback__)[-1]
+        assert "'missing'" in linecache.getline(frame.filename, frame.lineno)
+
+
+class TestShape:
+    def test_keys(self):
+        spec = codegen.Spec(
+            Point,
+            {
+                "x": codegen.In("a", codegen.Key("b"), default=0),
+                "y": codegen.Each("c", "deserialize_point"),
+            },
+        )
+        inner = codegen.Spec(
+            Point,
+            {
+                "x": codegen.Key(("d", "e")),
+                "y": codegen.Maybe("f", default=codegen.Get("g", "")),
+            },
+        )
+
+        shape = codegen.shape(
+            spec, lambda name: inner if name == "deserialize_point" else None
+        )
+        assert shape.keys["a"] == codegen.Shape({"b": None})
+        assert shape.keys["c"] == codegen.Shape(
+            {"d": codegen.Shape({"e": None}), "f": None, "g": None}, many=True
+        )
+
+    def test_unknown_converters_use_the_whole_value(self):
+        spec = codegen.Spec(Point, {"x": codegen.Each("c", "deserialize_point")})
+        assert codegen.shape(spec, lambda _: None).keys == {"c": None}
+
+    def test_spec_of(self):
+        spec = codegen.Spec(Point, {"x": codegen.Key("a")})
+        assert codegen.spec_of(codegen.generate("build_point", spec)) is spec
+        assert codegen.spec_of(build) is None
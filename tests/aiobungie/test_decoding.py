@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import typing
+
+import mock
+import pytest
+
+import aiobungie
+from aiobungie.internal import helpers
+
+msgspec = pytest.importorskip("msgspec")
+
+from aiobungie import decoding  # noqa: E402
+
+from tests.aiobungie.payloads import activity, body, clan_member, post_activity  # noqa: E402
+
+
+class TestTypedDecoder:
+    @pytest.fixture()
+    def decoder(self) -> decoding.TypedDecoder:
+        return decoding.TypedDecoder()
+
+    def test_clan_members(self, decoder: decoding.TypedDecoder):
+        payload = {"results": [clan_member(id) for id in range(5)], "hasMore": False}
+        decoded = decoder.decode_clan_members(body(payload))["Response"]
+
+        assert list(decoded["results"]) == (
+            aiobungie.framework.Global.deserialize_clan_members(payload).collect()
+        )
+        assert decoded["hasMore"] is False
+
+    def test_clan_member_without_bungie_user(self, decoder: decoding.TypedDecoder):
+        member = clan_member(1)
+        del member["bungieNetUserInfo"]
+        (decoded,) = decoder.decode_clan_members(body({"results": [member]}))[
+            "Response"
+        ]["results"]
+
+        assert decoded.bungie_user is None
+
+    def test_activities(self, decoder: decoding.TypedDecoder):
+        payload = {"activities": [activity(id) for id in range(5)]}
+        decoded = decoder.decode_activities(body(payload))["Response"]
+
+        assert list(decoded) == (
+            aiobungie.framework.Global.deserialize_activities(payload).collect()
+        )
+
+    def test_no_activities(self, decoder: decoding.TypedDecoder):
+        assert decoder.decode_activities(body({}))["Response"] == ()
+
+    def test_post_activity(self, decoder: decoding.TypedDecoder):
+        payload = post_activity()
+        decoded = decoder.decode_post_activity(body(payload))["Response"]
+
+        assert decoded == aiobungie.framework.Global.deserialize_post_activity(payload)
+
+    def test_throttle_seconds(self, decoder: decoding.TypedDecoder):
+        raw = body({"activities": []}).replace(
+            b'"ThrottleSeconds":0', b'"ThrottleSeconds":5'
+        )
+        assert decoder.decode_activities(raw)["ThrottleSeconds"] == 5
+
+    def test_invalid_body(self, decoder: decoding.TypedDecoder):
+        with pytest.raises(msgspec.ValidationError):
+            decoder.decode_clan_members(body({"results": 5}))
+
+        # Missing keys fail the same way they do in the framework.
+        with pytest.raises(KeyError):
+            decoder.decode_clan_members(body({"results": [{"memberType": 2}]}))
+
+    def test_interns_strings(self, decoder: decoding.TypedDecoder):
+        first, second = (
+            decoder.decode_clan_members(body({"results": [clan_member(id)]}))[
+                "Response"
+            ]["results"][0]
+            for id in (1, 2)
+        )
+        assert first.icon.path is second.icon.path
+
+    def test_only_read_keys_are_decoded(self, decoder: decoding.TypedDecoder):
+        member = clan_member(1)
+        member["destinyUserInfo"]["unused"] = {"nested": [1, 2, 3]}
+        envelope = decoder._clan_members.decode(body({"results": [member]}))
+        (wire,) = envelope.Response["results"]
+
+        assert "unused" not in wire["destinyUserInfo"]
+        assert wire["destinyUserInfo"]["membershipId"] == "1"
+
+    def test_other_framework(self):
+        class Generated(aiobungie.framework.GeneratedFramework):
+            def deserialize_post_activity(self, payload: typing.Any) -> typing.Any:
+                return payload["period"]
+
+        payload = post_activity()
+        decoder = decoding.TypedDecoder(Generated())
+        # Overridden methods get the whole value since their keys aren't known.
+        assert (
+            decoder.decode_post_activity(body(payload))["Response"]
+            == (payload["period"])
+        )
+
+
+class TestClient:
+    @pytest.mark.asyncio()
+    async def test_clan_members_use_decoder(self):
+        payload = {"results": [clan_member(id) for id in range(3)]}
+        calls: list[typing.Any] = []
+
+        async def fetch_clan_members(
+            _: typing.Any,
+            clan_id: int,
+            decode: typing.Any = None,
+            **__: typing.Any,
+        ) -> typing.Any:
+            # Stands in for the REST client reading a response body.
+            calls.append(decode)
+            return (helpers.loads if decode is None else decode)(body(payload))[
+                "Response"
+            ]
+
+        with mock.patch.object(
+            aiobungie.RESTClient, "fetch_clan_members", fetch_clan_members
+        ):
+            typed = await aiobungie.Client(
+                "token", decoder=decoding.TypedDecoder()
+            ).fetch_clan_members(4389205)
+            default = await aiobungie.Client("token").fetch_clan_members(4389205)
+
+        assert calls[0] is not None and calls[1] is None
+        assert typed.collect() == default.collect()
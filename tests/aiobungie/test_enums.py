@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+import pickle
+
+import pytest
+
+from aiobungie.internal import enums
+
+
+class TestDecode:
+    def test_known_value(self):
+        assert enums.decode(enums.GameMode, 4) is enums.GameMode.RAID
+
+    def test_unknown_value(self):
+        mode = enums.decode(enums.GameMode, 99999)
+        assert isinstance(mode, enums.GameMode)
+        assert mode.name == "UNKNOWN"
+        assert mode == 99999
+        assert int(mode) == 99999
+
+    def test_unknown_value_is_cached(self, caplog: pytest.LogCaptureFixture):
+        with caplog.at_level(logging.WARNING, "aiobungie.enums"):
+            first = enums.decode(enums.Race, 1234)
+            second = enums.decode(enums.Race, 1234)
+
+        assert first is second
+        assert len(caplog.records) == 1
+
+    def test_unknown_value_is_not_a_member(self):
+        enums.decode(enums.Class, 4321)
+        with pytest.raises(ValueError):
+            enums.Class(4321)
+
+        assert 4321 not in {member.value for member in enums.Class}
+
+    def test_flag_composite(self):
+        state = enums.decode(enums.ItemState, 3)
+        assert state == enums.ItemState.LOCKED | enums.ItemState.TRACKED
+        assert enums.ItemState.LOCKED in state
+
+    def test_flag_unknown(self):
+        state = enums.decode(enums.ItemState, 1 << 30)
+        assert isinstance(state, enums.ItemState)
+        assert int(state) == 1 << 30
+
+    @pytest.mark.parametrize(
+        ("enum", "value"),
+        [(enums.GameMode, 4), (enums.GameMode, 77777), (enums.ItemState, 1 << 29)],
+    )
+    def test_pickle(self, enum: type[enums.Enum | enums.Flag], value: int):
+        member = enums.decode(enum, value)
+        assert pickle.loads(pickle.dumps(member)) is member
+
+    def test_unknown_values_are_bounded(
+        self, monkeypatch: pytest.MonkeyPatch, caplog: pytest.LogCaptureFixture
+    ):
+        monkeypatch.setattr(enums, "_MAX_UNKNOWN", 2)
+        monkeypatch.setattr(enums, "_UNKNOWN_COUNTS", {})
+        monkeypatch.setattr(enums, "_TABLES", {})
+        with caplog.at_level(logging.WARNING, "aiobungie.enums"):
+            modes = [enums.decode(enums.GameMode, 50000 + value) for value in range(5)]
+
+        assert [int(mode) for mode in modes] == list(range(50000, 50005))
+        assert all(mode.name == "UNKNOWN" for mode in modes)
+        assert len(enums._TABLES[enums.GameMode]) == len(enums.GameMode) + 2
+        assert len(caplog.records) == 2
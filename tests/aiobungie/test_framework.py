@@ -0,0 +1,411 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import pickle
+import typing
+
+import attrs
+import mock
+import pytest
+import sain
+
+import aiobungie
+from aiobungie import framework
+from aiobungie.internal import _bodies as response_bodies
+from aiobungie.internal import enums
+from tests.aiobungie import payloads
+
+
+def inventory_item(hash: int) -> dict[str, typing.Any]:
+    return {
+        "hash": hash,
+        "index": 1,
+        "displayProperties": {
+            "name": f"item {hash}",
+            "description": "",
+            "hasIcon": True,
+            "icon": "/icon.png",
+        },
+        "itemType": 3,
+        "itemCategoryHashes": [1],
+        "classType": 3,
+        "itemSubType": 31,
+        "breakerType": 0,
+        "defaultDamageType": 1,
+        "tooltipNotifications": [],
+        "nonTransferrable": False,
+        "allowActions": True,
+        "equippable": True,
+        "doesPostmasterPullHaveSideEffects": False,
+    }
+
+
+def profile_components() -> dict[str, typing.Any]:
+    return {
+        "profileStringVariables": {"data": {"integerValuesByHash": {1: 10}}},
+        "characterStringVariables": {
+            "data": {"2305843009299499863": {"integerValuesByHash": {2: 20}}}
+        },
+        "metrics": {
+            "data": {
+                "metricsRootNodeHash": 1024,
+                "metrics": {"3": {"invisible": True}},
+            }
+        },
+    }
+
+
+def search_results(count: int) -> dict[str, typing.Any]:
+    return {
+        "suggestedWords": [],
+        "results": {
+            "results": [
+                {
+                    "hash": hash,
+                    "entityType": "DestinyInventoryItemDefinition",
+                    "weight": 1.0,
+                    "displayProperties": {
+                        "name": f"item {hash}",
+                        "description": "",
+                        "hasIcon": False,
+                        "icon": None,
+                    },
+                }
+                for hash in range(count)
+            ]
+        },
+    }
+
+
+def measured(size: int) -> response_bodies.Body:
+    body = response_bodies.Body()
+    body.size = size
+    return body
+
+
+def renaming_loads(raw: str | bytes) -> typing.Any:
+    # Picklable by reference, So process pool workers can load with it.
+    data = json.loads(raw)
+    data["Response"]["displayProperties"]["name"] = "loaded"
+    return data
+
+
+class CountingFramework(framework.Framework):
+    __slots__ = ()
+    pickled: typing.ClassVar[int] = 0
+
+    def __getstate__(self) -> dict[str, int]:
+        type(self).pickled += 1
+        return super().__getstate__()
+
+
+class RejectingExecutor(concurrent.futures.Executor):
+    def submit(self, *args: typing.Any, **kwargs: typing.Any) -> typing.NoReturn:
+        raise AssertionError("The payload should've been deserialized inline.")
+
+
+class TestOffloading:
+    @pytest.fixture(autouse=True)
+    def rest(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        async def fetch_inventory_item(self: typing.Any, hash: int) -> typing.Any:
+            payload = inventory_item(hash)
+            # Recorded like the REST client does when it reads a response.
+            response_bodies.record(json.dumps({"Response": payload}).encode())
+            return payload
+
+        monkeypatch.setattr(
+            aiobungie.RESTClient, "fetch_inventory_item", fetch_inventory_item
+        )
+
+    @pytest.mark.asyncio()
+    async def test_process_pool(self):
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            client = aiobungie.Client("token", executor=executor, offload_threshold=0)
+            offloaded = await client.fetch_inventory_items(range(5))
+            item = await client.fetch_inventory_item(10)
+
+        inline = await aiobungie.Client("token").fetch_inventory_items(range(5))
+        assert offloaded == inline
+        assert list(offloaded) == [0, 1, 2, 3, 4]
+        assert item.name == "item 10"
+
+    @pytest.mark.asyncio()
+    async def test_lazy_iterators(self):
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            client = aiobungie.Client("token", executor=executor, offload_threshold=0)
+            results = await client._deserialize(
+                "deserialize_inventory_results", search_results(3), body=measured(1)
+            )
+
+        assert isinstance(results, sain.Iter)
+        assert [result.hash for result in results] == [0, 1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_worker_framework(self):
+        CountingFramework.pickled = 0
+        client = aiobungie.Client(
+            "token", framework=CountingFramework(), offload_threshold=0
+        )
+        with client.process_pool(1):
+            for hash in range(3):
+                assert (await client.fetch_inventory_item(hash)).name == f"item {hash}"
+
+        # Sent to the worker when it started at most, Not with each payload.
+        assert CountingFramework.pickled <= 1
+
+        CountingFramework.pickled = 0
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            client = aiobungie.Client(
+                "token",
+                framework=CountingFramework(),
+                executor=executor,
+                offload_threshold=0,
+            )
+            for hash in range(3):
+                await client.fetch_inventory_item(hash)
+
+        assert CountingFramework.pickled == 3
+
+    @pytest.mark.asyncio()
+    async def test_worker_loads(self):
+        client = aiobungie.Client("token", loads=renaming_loads, offload_threshold=0)
+        with client.process_pool(1):
+            assert (await client.fetch_inventory_item(1)).name == "loaded"
+
+        with concurrent.futures.ProcessPoolExecutor(1) as executor:
+            client = aiobungie.Client(
+                "token", loads=renaming_loads, executor=executor, offload_threshold=0
+            )
+            assert (await client.fetch_inventory_item(1)).name == "loaded"
+
+    @pytest.mark.asyncio()
+    async def test_small_payloads_stay_inline(self):
+        client = aiobungie.Client("token", executor=RejectingExecutor())
+        assert (await client.fetch_inventory_item(1)).name == "item 1"
+
+    @pytest.mark.asyncio()
+    async def test_unmeasured_payloads_stay_inline(self):
+        client = aiobungie.Client(
+            "token", executor=RejectingExecutor(), offload_threshold=0
+        )
+        results = await client._deserialize(
+            "deserialize_inventory_results", search_results(3)
+        )
+        assert [result.hash for result in results] == [0, 1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_thread_pool(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            client = aiobungie.Client("token", executor=executor, offload_threshold=1)
+            results = await client._deserialize(
+                "deserialize_inventory_results", search_results(3), body=measured(1)
+            )
+
+        assert [result.hash for result in results] == [0, 1, 2]
+
+
+class TestInterning:
+    @pytest.mark.parametrize(
+        "deserializer", [framework.Framework, framework.GeneratedFramework]
+    )
+    def test_shares_images_and_strings(self, deserializer: type[framework.Framework]):
+        # Decoded separately, So the strings are different objects like in real responses.
+        first, second = (
+            deserializer().deserialize_inventory_entity(
+                json.loads(json.dumps(inventory_item(hash)))
+            )
+            for hash in (1, 2)
+        )
+        assert first.icon.path is not second.icon.path
+
+        shared = deserializer()
+        items = [json.loads(json.dumps(full_inventory_item(hash))) for hash in (1, 2)]
+        first, second = (shared.deserialize_inventory_entity(item) for item in items)
+        assert first.icon is second.icon
+        assert first.screenshot is second.screenshot
+        assert first.type_name is second.type_name
+
+    def test_images_are_shared(self):
+        deserializer = framework.Framework()
+        first, second = deserializer._image("/a.png"), deserializer._image("/b.png")
+        assert deserializer._image("/a.png") is first
+        assert deserializer._image("".join(["/b", ".png"])) is second
+
+    def test_disabled(self):
+        deserializer = framework.Framework(intern_size=0)
+        path = "".join(["/a", ".png"])
+        assert deserializer._image(path).path is path
+        assert deserializer._string(path) is path
+        assert not deserializer._strings
+        assert not deserializer._images
+
+    def test_missing_image(self):
+        assert framework.Framework()._image("") is aiobungie.builders.Image.default()
+
+    def test_bounded(self):
+        deserializer = framework.Framework(intern_size=2)
+        for path in ("/a.png", "/b.png", "/c.png"):
+            deserializer._image(path)
+            deserializer._string(path)
+
+        assert len(deserializer._images) <= 2
+        assert len(deserializer._strings) <= 2
+
+    def test_pickle_drops_tables(self):
+        deserializer = framework.GeneratedFramework(intern_size=10)
+        deserializer._image("/a.png")
+
+        restored = pickle.loads(pickle.dumps(deserializer))
+        assert isinstance(restored, framework.GeneratedFramework)
+        assert restored._intern_size == 10
+        assert not restored._strings
+        assert not restored._images
+
+
+class TestLazyComponent:
+    def test_deserializes_on_access(self):
+        component = aiobungie.framework.Global.deserialize_lazy_components(
+            profile_components()
+        )
+        assert not component.resolved
+
+        assert component.root_node_hash == 1024
+        assert component.characters is None
+        assert set(component.resolved) == {"root_node_hash", "characters"}
+
+    def test_memoized(self):
+        resolver = mock.Mock(return_value={1: 10})
+        component = aiobungie.crates.LazyComponent(
+            {}, {"profile_string_variables": resolver}
+        )
+
+        assert component.profile_string_variables == {1: 10}
+        assert component.profile_string_variables == {1: 10}
+        resolver.assert_called_once_with({})
+
+    def test_into_component(self):
+        payload = profile_components()
+        lazy = aiobungie.framework.Global.deserialize_lazy_components(payload)
+        assert lazy.metrics == ({3: (True, None)},)
+
+        assert lazy.into_component() == (
+            aiobungie.framework.Global.deserialize_components(payload)
+        )
+
+    def test_frozen(self):
+        component = aiobungie.framework.Global.deserialize_lazy_components({})
+        with pytest.raises(attrs.exceptions.FrozenInstanceError):
+            component.characters = {}  # pyright: ignore
+
+
+def full_inventory_item(hash: int) -> dict[str, typing.Any]:
+    return {
+        **inventory_item(hash),
+        "collectibleHash": 1,
+        "flavorText": "",
+        "itemTypeDisplayName": "Auto Rifle",
+        "screenshot": "/screenshot.jpg",
+        "iconWatermark": "/watermark.png",
+        "damageTypes": [1, 3],
+        "damageTypeHashes": [],
+        "traitHashes": [1, 2],
+        "traitIds": ["weapon"],
+        "backgroundColor": {"red": 1},
+        "seasonHash": 2,
+        "inventory": {
+            "tierType": 6,
+            "tierTypeHash": 4008398120,
+            "bucketTypeHash": 1498876634,
+            "recoveryBucketTypeHash": 215593132,
+            "tierTypeName": "Exotic",
+            "isInstanceItem": True,
+            "suppressExpirationWhenObjectivesComplete": False,
+            "maxStackSize": 1,
+        },
+    }
+
+
+class TestGeneratedFramework:
+    @pytest.fixture()
+    def generated(self) -> framework.GeneratedFramework:
+        return framework.GeneratedFramework()
+
+    @pytest.mark.parametrize(
+        ("method", "payload"),
+        [
+            ("deserialize_inventory_entity", inventory_item(1)),
+            ("deserialize_inventory_entity", full_inventory_item(1)),
+            ("deserialize_objective_entity", payloads.objective(1)),
+            ("deserialize_clan_member", payloads.clan_member(1)),
+            ("deserialize_activity", payloads.activity(1)),
+            ("deserialize_post_activity", payloads.post_activity()),
+            (
+                "deserialize_plug_item_state",
+                {
+                    "plugItemHash": "1",
+                    "insertFailIndexes": [0],
+                    "enabled": True,
+                    "canInsert": False,
+                },
+            ),
+        ],
+    )
+    def test_matches_framework(
+        self,
+        generated: framework.GeneratedFramework,
+        method: str,
+        payload: typing.Any,
+    ):
+        assert getattr(generated, method)(payload) == getattr(framework.Global, method)(
+            payload
+        )
+
+    def test_membership_fallbacks(self, generated: framework.GeneratedFramework):
+        payload = payloads.membership(1, bungieGlobalDisplayName="")
+        del payload["displayName"], payload["applicableMembershipTypes"]
+
+        membership = generated.deserialize_destiny_membership(payload)
+        assert membership.name is None
+        assert membership.last_seen_name == ""
+        assert membership.types == ()
+        assert membership == framework.Global.deserialize_destiny_membership(payload)
+
+    def test_unknown_enum_values(self, generated: framework.GeneratedFramework):
+        payload = payloads.activity(1)
+        payload["activityDetails"]["mode"] = 9000
+        payload["activityDetails"]["modes"] = [9000, 4]
+
+        for deserializer in (generated, framework.Global):
+            activity = deserializer.deserialize_activity(payload)
+            assert activity.mode == 9000
+            assert activity.mode.name == "UNKNOWN"
+            assert activity.modes[1] is enums.GameMode.RAID
+
+    def test_inherits_framework(self, generated: framework.GeneratedFramework):
+        items = generated.deserialize_inventory_results(search_results(2))
+        assert [item.hash for item in items] == [0, 1]
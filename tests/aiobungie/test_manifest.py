@@ -0,0 +1,496 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import json
+import pathlib
+import sqlite3
+import threading
+import typing
+
+import pytest
+
+import aiobungie
+from aiobungie import manifest
+from aiobungie.crates import entity
+from tests.aiobungie import payloads
+
+# Bigger than a signed 32-bit integer, Stored as a negative id in the database.
+LE_MONARQUE = 3588934839
+
+
+def item(hash: int, name: str) -> dict[str, typing.Any]:
+    return {
+        "hash": hash,
+        "index": 1,
+        "displayProperties": {
+            "name": name,
+            "description": "",
+            "hasIcon": True,
+            "icon": "/icon.png",
+        },
+        "itemType": 3,
+        "itemCategoryHashes": [1],
+        "classType": 3,
+        "itemSubType": 31,
+        "breakerType": 0,
+        "defaultDamageType": 1,
+        "tooltipNotifications": [],
+        "nonTransferrable": False,
+        "allowActions": True,
+        "equippable": True,
+        "doesPostmasterPullHaveSideEffects": False,
+    }
+
+
+@pytest.fixture()
+def database(tmp_path: pathlib.Path) -> pathlib.Path:
+    path = tmp_path / "manifest.sqlite3"
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE DestinyInventoryItemDefinition (id INTEGER PRIMARY KEY, json BLOB)"
+        )
+        connection.execute(
+            "CREATE TABLE DestinyObjectiveDefinition (id INTEGER PRIMARY KEY, json BLOB)"
+        )
+        rows = [(LE_MONARQUE, "Le Monarque")] + [
+            (hash, f"item {hash}") for hash in range(1, 1001)
+        ]
+        connection.executemany(
+            "INSERT INTO DestinyInventoryItemDefinition VALUES (?, ?)",
+            [
+                (manifest._to_signed(hash), json.dumps(item(hash, name)))
+                for hash, name in rows
+            ],
+        )
+    connection.close()
+    return path
+
+
+class TestManifest:
+    @pytest.mark.asyncio()
+    async def test_fetch_unsigned_hash(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            payload = await definitions.fetch(
+                "DestinyInventoryItemDefinition", LE_MONARQUE
+            )
+
+        assert payload is not None
+        assert payload["hash"] == LE_MONARQUE
+
+    @pytest.mark.asyncio()
+    async def test_fetch_missing(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            assert await definitions.fetch("DestinyObjectiveDefinition", 1) is None
+            assert await definitions.fetch_inventory_item(2000) is None
+
+    @pytest.mark.asyncio()
+    async def test_unknown_definition(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            with pytest.raises(ValueError):
+                await definitions.fetch("DestinyInventoryItemDefinition; --", 1)
+
+    @pytest.mark.asyncio()
+    async def test_fetch_many_batches(self, database: pathlib.Path):
+        hashes = [*range(1, 1001), LE_MONARQUE, 5000, 1]
+        with manifest.Manifest(database) as definitions:
+            payloads = await definitions.fetch_many(
+                "DestinyInventoryItemDefinition", hashes
+            )
+
+        assert len(payloads) == 1001
+        assert all(payloads[hash]["hash"] == hash for hash in payloads)
+        assert 5000 not in payloads
+
+    @pytest.mark.asyncio()
+    async def test_cache_is_bounded(self, database: pathlib.Path):
+        with manifest.Manifest(database, cache_size=2) as definitions:
+            await definitions.fetch_many("DestinyInventoryItemDefinition", (1, 2))
+            await definitions.fetch("DestinyInventoryItemDefinition", 1)
+            await definitions.fetch("DestinyInventoryItemDefinition", 3)
+
+            assert list(definitions._cache) == [
+                ("DestinyInventoryItemDefinition", 1),
+                ("DestinyInventoryItemDefinition", 3),
+            ]
+
+    @pytest.mark.asyncio()
+    async def test_cache_is_used(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            first = await definitions.fetch("DestinyInventoryItemDefinition", 1)
+            definitions.close()
+            # The connection is closed, So this can only come from the cache.
+            assert await definitions.fetch("DestinyInventoryItemDefinition", 1) is first
+
+    @pytest.mark.asyncio()
+    async def test_fetch_inventory_items(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            items = await definitions.fetch_inventory_items([LE_MONARQUE, 10])
+
+        assert all(isinstance(item, entity.InventoryEntity) for item in items.values())
+        assert items[LE_MONARQUE].name == "Le Monarque"
+        assert items[10].name == "item 10"
+
+    def test_read_only(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            with pytest.raises(sqlite3.OperationalError):
+                definitions._connection.execute(
+                    "DELETE FROM DestinyInventoryItemDefinition"
+                )
+
+    def test_definitions(self, database: pathlib.Path):
+        with manifest.Manifest(database) as definitions:
+            assert definitions.definitions == {
+                "DestinyInventoryItemDefinition",
+                "DestinyObjectiveDefinition",
+            }
+
+
+class FakeREST:
+    def __init__(self, tables: dict[str, dict[str, typing.Any]]) -> None:
+        self.tables = tables
+        self.downloads: list[str] = []
+        self.resolved = 0
+
+    async def fetch_manifest_path(self) -> typing.Any:
+        self.resolved += 1
+        await asyncio.sleep(0)
+        return {"version": "1"}
+
+    async def download_json_definition(
+        self,
+        definition: str,
+        path: pathlib.Path,
+        *,
+        manifest_path: typing.Any,
+        **_: typing.Any,
+    ) -> pathlib.Path:
+        assert manifest_path == {"version": "1"}
+        if definition not in self.tables:
+            raise aiobungie.MissingDefinitionError(definition)
+
+        await asyncio.sleep(0)
+        self.downloads.append(definition)
+        file = path / f"{definition}.json"
+        file.write_text(json.dumps(self.tables[definition]))
+        return file
+
+
+class TestJSONManifest:
+    @pytest.fixture()
+    def rest(self) -> FakeREST:
+        return FakeREST(
+            {
+                "DestinyInventoryItemDefinition": {
+                    str(LE_MONARQUE): item(LE_MONARQUE, "Le Monarque"),
+                    "1": item(1, "item 1"),
+                },
+                "DestinyObjectiveDefinition": {},
+            }
+        )
+
+    @pytest.mark.asyncio()
+    async def test_loads_used_definitions_only(
+        self, rest: FakeREST, tmp_path: pathlib.Path
+    ):
+        definitions = manifest.JSONManifest(rest, tmp_path)  # type: ignore[arg-type]
+        items = await definitions.fetch_inventory_items([LE_MONARQUE, 1, 2])
+
+        assert items[LE_MONARQUE].name == "Le Monarque"
+        assert set(items) == {LE_MONARQUE, 1}
+        assert rest.downloads == ["DestinyInventoryItemDefinition"]
+        assert set(definitions.loaded) == {"DestinyInventoryItemDefinition"}
+        assert (tmp_path / "en" / "DestinyInventoryItemDefinition.json").exists()
+
+    @pytest.mark.asyncio()
+    async def test_concurrent_loads_download_once(
+        self, rest: FakeREST, tmp_path: pathlib.Path
+    ):
+        definitions = manifest.JSONManifest(rest, tmp_path)  # type: ignore[arg-type]
+        await asyncio.gather(*(definitions.fetch_inventory_item(1) for _ in range(10)))
+
+        assert rest.downloads == ["DestinyInventoryItemDefinition"]
+
+    @pytest.mark.asyncio()
+    async def test_manifest_path_resolved_once(
+        self, rest: FakeREST, tmp_path: pathlib.Path
+    ):
+        definitions = manifest.JSONManifest(rest, tmp_path)  # type: ignore[arg-type]
+        await asyncio.gather(
+            definitions.load("DestinyInventoryItemDefinition"),
+            definitions.load("DestinyObjectiveDefinition"),
+        )
+        assert rest.resolved == 1
+
+        # Dropping everything checks for a new version on the next load.
+        definitions.unload()
+        await definitions.load("DestinyObjectiveDefinition")
+        assert rest.resolved == 2
+
+    @pytest.mark.asyncio()
+    async def test_unload(self, rest: FakeREST, tmp_path: pathlib.Path):
+        definitions = manifest.JSONManifest(rest, tmp_path)  # type: ignore[arg-type]
+        await definitions.load("DestinyInventoryItemDefinition")
+        definitions.unload("DestinyInventoryItemDefinition")
+        assert not definitions.loaded
+
+        await definitions.fetch("DestinyInventoryItemDefinition", 1)
+        assert len(rest.downloads) == 2
+
+    @pytest.mark.asyncio()
+    async def test_unknown_definition(self, rest: FakeREST, tmp_path: pathlib.Path):
+        definitions = manifest.JSONManifest(rest, tmp_path)  # type: ignore[arg-type]
+        with pytest.raises(ValueError):
+            await definitions.fetch("Nope", 1)
+
+
+class TestMappedManifest:
+    @pytest.fixture()
+    def source(self, tmp_path: pathlib.Path) -> pathlib.Path:
+        path = tmp_path / "manifest.json"
+        tricky = item(2, 'Braces } { and "quotes" \\ in a name ✓')
+        tricky["nested"] = {"list": [{"a": "}"}, [1, 2]], "empty": {}}
+        payload = {
+            "DestinyInventoryItemDefinition": {
+                str(LE_MONARQUE): item(LE_MONARQUE, "Le Monarque"),
+                "2": tricky,
+                "1": item(1, "item 1"),
+            },
+            "DestinyHistoricalStatsDefinition": {"kills": {"statId": "kills"}},
+            "DestinyObjectiveDefinition": {},
+        }
+        path.write_text(json.dumps(payload, indent=2, ensure_ascii=False))
+        return path
+
+    @pytest.mark.asyncio()
+    async def test_lookups(self, source: pathlib.Path):
+        with manifest.MappedManifest(source) as definitions:
+            payloads = await definitions.fetch_many(
+                "DestinyInventoryItemDefinition", [1, 2, 3, LE_MONARQUE]
+            )
+            item_ = await definitions.fetch_inventory_item(LE_MONARQUE)
+
+        assert set(payloads) == {1, 2, LE_MONARQUE}
+        assert payloads[2]["displayProperties"]["name"] == (
+            'Braces } { and "quotes" \\ in a name ✓'
+        )
+        assert payloads[2]["nested"] == {"list": [{"a": "}"}, [1, 2]], "empty": {}}
+        assert item_ is not None
+        assert item_.name == "Le Monarque"
+
+    @pytest.mark.asyncio()
+    async def test_unknown_definition(self, source: pathlib.Path):
+        with manifest.MappedManifest(source) as definitions:
+            assert "DestinyHistoricalStatsDefinition" not in definitions.definitions
+            with pytest.raises(ValueError):
+                await definitions.fetch("DestinyHistoricalStatsDefinition", 1)
+
+    def test_index_is_reused(
+        self, source: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        manifest.MappedManifest(source).close()
+        assert source.with_name("manifest.json.index").exists()
+
+        def fail(_: typing.Any) -> typing.NoReturn:
+            raise AssertionError("The index was built again.")
+
+        monkeypatch.setattr(manifest, "_build_index", fail)
+        manifest.MappedManifest(source).close()
+
+    @pytest.mark.asyncio()
+    async def test_index_is_rebuilt_for_new_files(self, source: pathlib.Path):
+        manifest.MappedManifest(source).close()
+        source.write_text(
+            json.dumps({"DestinyInventoryItemDefinition": {"5": {"hash": 5}}})
+        )
+
+        with manifest.MappedManifest(source) as definitions:
+            assert await definitions.fetch("DestinyInventoryItemDefinition", 5) == {
+                "hash": 5
+            }
+            assert await definitions.fetch("DestinyInventoryItemDefinition", 1) is None
+
+    @pytest.mark.parametrize("size", [0, 4, 40, -8])
+    @pytest.mark.asyncio()
+    async def test_truncated_index_is_rebuilt(self, source: pathlib.Path, size: int):
+        manifest.MappedManifest(source).close()
+        index = source.with_name("manifest.json.index")
+        index.write_bytes(index.read_bytes()[:size])
+
+        with manifest.MappedManifest(source) as definitions:
+            assert await definitions.fetch("DestinyInventoryItemDefinition", 1)
+
+    @pytest.mark.asyncio()
+    async def test_open_in_executor(
+        self, source: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        threads: list[int] = []
+        build_index = manifest._build_index
+
+        def build(source: typing.Any) -> typing.Any:
+            threads.append(threading.get_ident())
+            return build_index(source)
+
+        monkeypatch.setattr(manifest, "_build_index", build)
+        with await manifest.MappedManifest.open(source) as definitions:
+            assert await definitions.fetch("DestinyInventoryItemDefinition", 1)
+
+        assert threads and threads[0] != threading.get_ident()
+
+
+class TestClientResolution:
+    @pytest.fixture()
+    def requested(self, monkeypatch: pytest.MonkeyPatch) -> list[int]:
+        requested: list[int] = []
+
+        async def fetch_inventory_item(self: typing.Any, hash: int) -> typing.Any:
+            requested.append(hash)
+            if hash == 4040:
+                raise aiobungie.NotFound(
+                    error_code=18,
+                    throttle_seconds=0,
+                    url="",
+                    body={},
+                    headers={},  # type: ignore[arg-type]
+                    message="",
+                    error_status="",
+                    message_data={},
+                )
+            return item(hash, "from http")
+
+        monkeypatch.setattr(
+            aiobungie.RESTClient, "fetch_inventory_item", fetch_inventory_item
+        )
+        return requested
+
+    @pytest.mark.asyncio()
+    async def test_without_manifest(self, requested: list[int]):
+        client = aiobungie.Client("token")
+        assert (await client.fetch_inventory_item(1)).name == "from http"
+        assert requested == [1]
+
+    @pytest.mark.asyncio()
+    async def test_manifest_first(self, database: pathlib.Path, requested: list[int]):
+        with manifest.Manifest(database) as definitions:
+            client = aiobungie.Client("token", manifest=definitions)
+            found = await client.fetch_inventory_item(LE_MONARQUE)
+            missing = await client.fetch_inventory_item(5000)
+
+        assert found.name == "Le Monarque"
+        assert missing.name == "from http"
+        assert requested == [5000]
+
+    @pytest.mark.asyncio()
+    async def test_missing_definition_falls_back(self, requested: list[int]):
+        class Partial(manifest.BaseManifest):
+            async def fetch_many(
+                self, definition: str, hashes: typing.Any
+            ) -> typing.Any:
+                raise aiobungie.MissingDefinitionError(definition)
+
+        client = aiobungie.Client("token", manifest=Partial())
+        assert (await client.fetch_inventory_item(1)).name == "from http"
+        assert list(await client.fetch_inventory_items([2, 3])) == [2, 3]
+        assert requested == [1, 2, 3]
+
+    @pytest.mark.asyncio()
+    async def test_manifest_errors_propagate(self, requested: list[int]):
+        class Corrupt(manifest.BaseManifest):
+            async def fetch_many(
+                self, definition: str, hashes: typing.Any
+            ) -> typing.Any:
+                return json.loads("{")
+
+        client = aiobungie.Client("token", manifest=Corrupt())
+        with pytest.raises(json.JSONDecodeError):
+            await client.fetch_inventory_item(1)
+
+        assert requested == []
+
+    @pytest.mark.asyncio()
+    async def test_bulk_error_cancels_pending(self, monkeypatch: pytest.MonkeyPatch):
+        cancelled: list[int] = []
+
+        async def fetch_inventory_item(self: typing.Any, hash: int) -> typing.Any:
+            if hash == 1:
+                raise RuntimeError("boom")
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(hash)
+                raise
+
+        monkeypatch.setattr(
+            aiobungie.RESTClient, "fetch_inventory_item", fetch_inventory_item
+        )
+        with pytest.raises(RuntimeError):
+            await aiobungie.Client("token").fetch_inventory_items([2, 1, 3])
+
+        # Cancelled and awaited before the error is raised.
+        assert sorted(cancelled) == [2, 3]
+
+    @pytest.mark.asyncio()
+    async def test_objective_entities(
+        self, database: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        requested: list[int] = []
+
+        async def fetch_objective_entity(self: typing.Any, hash: int) -> typing.Any:
+            requested.append(hash)
+            return payloads.objective(hash)
+
+        monkeypatch.setattr(
+            aiobungie.RESTClient, "fetch_objective_entity", fetch_objective_entity
+        )
+        connection = sqlite3.connect(database)
+        with connection:
+            connection.execute(
+                "INSERT INTO DestinyObjectiveDefinition VALUES (?, ?)",
+                (1, json.dumps(payloads.objective(1))),
+            )
+        connection.close()
+
+        with manifest.Manifest(database) as definitions:
+            client = aiobungie.Client("token", manifest=definitions)
+            objectives = await client.fetch_objective_entities([3, 1, 3])
+
+        assert list(objectives) == [3, 1]
+        assert objectives[1].completion_value == 100
+        assert requested == [3]
+
+    @pytest.mark.asyncio()
+    async def test_bulk_falls_back_for_misses(
+        self, database: pathlib.Path, requested: list[int]
+    ):
+        client = aiobungie.Client("token")
+        with manifest.Manifest(database) as definitions:
+            client.manifest = definitions
+            items = await client.fetch_inventory_items([1, 2, 5000, 4040, 1])
+
+        assert list(items) == [1, 2, 5000]
+        assert items[1].name == "item 1"
+        assert items[5000].name == "from http"
+        assert sorted(requested) == [4040, 5000]
@@ -0,0 +1,226 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import typing
+
+import pytest
+import sain
+
+from aiobungie import pagination
+
+
+def search_result(page: int, *, last: int) -> dict[str, typing.Any]:
+    return {
+        "results": [page * 10, page * 10 + 1],
+        "totalResults": (last + 1) * 2,
+        "hasMore": page < last,
+        "query": {"itemsPerPage": 2, "currentPage": page},
+    }
+
+
+class Pages:
+    def __init__(self, last: int = 2) -> None:
+        self.last = last
+        self.requested: list[int] = []
+        self.cancelled: list[int] = []
+
+    async def __call__(self, page: int) -> dict[str, typing.Any]:
+        self.requested.append(page)
+        try:
+            # Later pages take longer, So they're still in flight when the last page arrives.
+            await asyncio.sleep(0.005 * (page + 1))
+        except asyncio.CancelledError:
+            self.cancelled.append(page)
+            raise
+        return search_result(page, last=self.last)
+
+
+class TestPaginator:
+    @pytest.mark.asyncio()
+    async def test_stops_on_has_more(self):
+        pages = Pages(last=2)
+        assert await pagination.Paginator(pages).collect() == [0, 1, 10, 11, 20, 21]
+
+    @pytest.mark.asyncio()
+    async def test_prefetches_next_page(self):
+        pages = Pages(last=2)
+        async for page in pagination.Paginator(pages).pages():
+            current = page["query"]["currentPage"]
+            # Processing this page.
+            await asyncio.sleep(0)
+            if current < 2:
+                # The next page is already being requested.
+                assert current + 1 in pages.requested
+
+    @pytest.mark.asyncio()
+    async def test_look_ahead(self):
+        pages = Pages(last=1)
+        paginator = pagination.Paginator(pages, look_ahead=3)
+        assert await paginator.collect() == [0, 1, 10, 11]
+
+        # Pages past the last one were requested ahead and then cancelled.
+        assert pages.requested[:4] == [0, 1, 2, 3]
+        assert pages.cancelled == pages.requested[2:]
+
+    @pytest.mark.asyncio()
+    async def test_break_cancels_requests(self):
+        pages = Pages(last=10)
+        paginator = pagination.Paginator(pages, look_ahead=2)
+        async with contextlib.aclosing(paginator.pages()) as iterator:
+            async for _ in iterator:
+                break
+
+        assert pages.cancelled == pages.requested[1:]
+        assert len(pages.cancelled) >= 1
+
+    @pytest.mark.asyncio()
+    async def test_no_look_ahead(self):
+        pages = Pages(last=2)
+        assert len(await pagination.Paginator(pages, look_ahead=0).collect()) == 6
+        assert pages.requested == [0, 1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_max_pages(self):
+        pages = Pages(last=10)
+        paginator = pagination.Paginator(pages, start=1, max_pages=2, look_ahead=5)
+        assert await paginator.collect() == [10, 11, 20, 21]
+        assert pages.requested == [1, 2]
+
+    @pytest.mark.asyncio()
+    async def test_failed_pages_past_the_end(self):
+        async def fetch_page(page: int) -> dict[str, typing.Any]:
+            if page > 1:
+                raise RuntimeError("Out of range.")
+            return search_result(page, last=1)
+
+        paginator = pagination.Paginator(fetch_page, look_ahead=2)
+        assert await paginator.collect() == [0, 1, 10, 11]
+
+    @pytest.mark.asyncio()
+    async def test_deserialized_pages(self):
+        async def fetch_page(page: int) -> sain.Iter[int]:
+            return sain.Iter([page] * 2 if page < 3 else [])
+
+        assert await pagination.Paginator(fetch_page).collect() == [0, 0, 1, 1, 2, 2]
+
+    @pytest.mark.asyncio()
+    async def test_nested_results(self):
+        async def fetch_page(page: int) -> dict[str, typing.Any]:
+            return {"suggestedWords": [], "results": search_result(page, last=1)}
+
+        assert await pagination.Paginator(fetch_page).collect() == [0, 1, 10, 11]
+
+    def test_negative_look_ahead(self):
+        with pytest.raises(ValueError):
+            pagination.Paginator(Pages(), look_ahead=-1)
+
+
+class TestTokens:
+    @staticmethod
+    def token_page(token: str | None, *, last: int) -> dict[str, typing.Any]:
+        page = 0 if token is None else int(token)
+        result = search_result(page, last=last)
+        result["replacementContinuationToken"] = str(page + 1)
+        return result
+
+    @pytest.mark.asyncio()
+    async def test_follows_tokens(self):
+        tokens: list[str | None] = []
+
+        async def fetch_page(token: str | None) -> dict[str, typing.Any]:
+            tokens.append(token)
+            return self.token_page(token, last=2)
+
+        paginator = pagination.Paginator.from_tokens(fetch_page)
+        assert await paginator.collect() == [0, 1, 10, 11, 20, 21]
+        assert tokens == [None, "1", "2"]
+
+    @pytest.mark.asyncio()
+    async def test_stops_without_token(self):
+        tokens: list[str | None] = []
+
+        async def fetch_page(token: str | None) -> dict[str, typing.Any]:
+            tokens.append(token)
+            result = self.token_page(token, last=10)
+            if token == "1":
+                del result["replacementContinuationToken"]
+            return result
+
+        paginator = pagination.Paginator.from_tokens(fetch_page)
+        assert await paginator.collect() == [0, 1, 10, 11]
+        assert tokens == [None, "1"]
+
+    @pytest.mark.asyncio()
+    async def test_max_pages(self):
+        async def fetch_page(token: str | None) -> dict[str, typing.Any]:
+            return self.token_page(token, last=10)
+
+        paginator = pagination.Paginator.from_tokens(fetch_page, max_pages=2)
+        assert await paginator.collect() == [0, 1, 10, 11]
+
+    @pytest.mark.asyncio()
+    async def test_paginate_token_argument(self):
+        calls: list[tuple[typing.Any, ...]] = []
+
+        async def search_group(
+            name: str, *, request_token: str | None
+        ) -> dict[str, typing.Any]:
+            calls.append((name, request_token))
+            return self.token_page(request_token, last=1)
+
+        paginator = pagination.paginate(
+            search_group, "Fate", token_argument="request_token"
+        )
+        assert await paginator.collect() == [0, 1, 10, 11]
+        assert calls == [("Fate", None), ("Fate", "1")]
+
+
+class TestPaginate:
+    @pytest.mark.asyncio()
+    async def test_passes_arguments(self):
+        calls: list[tuple[typing.Any, ...]] = []
+
+        async def search_group(
+            name: str, *, current_page: int, items_per_page: int
+        ) -> dict[str, typing.Any]:
+            calls.append((name, current_page, items_per_page))
+            return search_result(current_page, last=2)
+
+        paginator = pagination.paginate(
+            search_group,
+            "Fate",
+            page_argument="current_page",
+            start=1,
+            look_ahead=0,
+            items_per_page=2,
+        )
+        assert [page["query"]["currentPage"] async for page in paginator.pages()] == [
+            1,
+            2,
+        ]
+        assert calls == [("Fate", 1, 2), ("Fate", 2, 2)]
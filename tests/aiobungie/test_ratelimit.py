@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+import multiprocessing
+import pathlib
+import sys
+import time
+
+import pytest
+
+from aiobungie import builders
+from aiobungie.internal import _ratelimit as ratelimit
+from aiobungie.ratelimit import SQLiteRateLimitBackend
+
+
+class TestRouteKey:
+    def test_numeric_segments_are_collapsed(self):
+        assert ratelimit.route_key(
+            "Destiny2/3/Profile/4611686018484639825/?components=100"
+        ) == ratelimit.route_key("Destiny2/1/Profile/4611686018467284386/")
+
+    def test_named_segments_are_kept(self):
+        assert (
+            ratelimit.route_key("GroupV2/Name/dealloc/1") == "GroupV2/Name/dealloc/{}"
+        )
+
+
+class TestLimiter:
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            ratelimit.Limiter(0, 1)
+
+    @pytest.mark.asyncio()
+    async def test_global_limit(self):
+        # The route limit is high enough that only the global limit can hold requests back.
+        limiter = ratelimit.Limiter(2, 10)
+        in_flight = peak = 0
+
+        async def request(route: str) -> None:
+            nonlocal in_flight, peak
+            async with limiter.acquire(route):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        routes = [f"Destiny2/Route{n}/" for n in range(3)]
+        assert len({ratelimit.route_key(route) for route in routes}) == 3
+
+        await asyncio.gather(*(request(route) for route in routes for _ in range(3)))
+        assert peak == 2
+
+    @pytest.mark.asyncio()
+    async def test_route_limit(self):
+        limiter = ratelimit.Limiter(10, 1)
+        in_flight = peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with limiter.acquire("Destiny2/Manifest/"):
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.01)
+                in_flight -= 1
+
+        await asyncio.gather(*(request() for _ in range(4)))
+        assert peak == 1
+
+    @pytest.mark.parametrize(
+        "route",
+        [
+            "Destiny2/3/Account/1/Character/2/Stats/",
+            "Destiny2/3/Account/1/Stats/",
+            "Destiny2/Stats/PostGameCarnageReport/1",
+            "Destiny2/3/Account/1/Character/2/Stats/Activities/?mode=4",
+        ],
+    )
+    def test_suggested_stats_group(self, route: str):
+        limiter = ratelimit.Limiter(1, 1, route_rates=builders.ROUTE_RATE_LIMITS)
+        group = limiter._group_bucket(ratelimit.route_key(route))
+        assert group is not None and group[0] == "*/Stats*"
+
+    def test_opt_in(self):
+        settings = builders.Settings()
+        assert settings.rate_limit is None
+        assert settings.route_rate_limits == {}
+
+    @pytest.mark.asyncio()
+    async def test_routes_are_released(self):
+        limiter = ratelimit.Limiter(1, 1)
+        async with limiter.acquire("User/GetBungieNetUserById/1/"):
+            pass
+        assert not limiter._routes
+
+
+class TestTokenBucket:
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            ratelimit.TokenBucket(0)
+
+    @pytest.mark.asyncio()
+    async def test_spends_tokens_at_rate(self):
+        bucket = ratelimit.TokenBucket(100.0, capacity=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(5):
+            await bucket.acquire()
+        # The first token is already in the bucket.
+        assert loop.time() - started >= 0.035
+
+    @pytest.mark.asyncio()
+    async def test_throttle(self):
+        bucket = ratelimit.TokenBucket(1000.0)
+        bucket.throttle(0.05)
+        assert bucket.rate == 500.0
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await bucket.acquire()
+        assert loop.time() - started >= 0.045
+
+
+class TestLimiterBuckets:
+    @pytest.mark.asyncio()
+    async def test_throttle_without_buckets(self):
+        limiter = ratelimit.Limiter(1, 1)
+        assert await limiter.throttle("Destiny2/Manifest/", 1.0) is False
+
+    @pytest.mark.asyncio()
+    async def test_throttle_route_group(self):
+        limiter = ratelimit.Limiter(
+            1, 1, rate=100.0, route_rates={"Destiny2/{}/Profile/*": 10.0}
+        )
+        assert await limiter.throttle("Destiny2/3/Profile/4611686018484639825/", 1.0)
+        assert limiter._groups["Destiny2/{}/Profile/*"].rate == 5.0
+        assert limiter._bucket is not None and limiter._bucket.rate == 100.0
+
+    @pytest.mark.asyncio()
+    async def test_throttle_application_bucket(self):
+        limiter = ratelimit.Limiter(1, 1, rate=100.0)
+        assert await limiter.throttle("User/GetBungieNetUserById/1/", 1.0)
+        assert limiter._bucket is not None and limiter._bucket.rate == 50.0
+
+
+def _spend_shared_tokens(path: str, count: int) -> None:
+    async def spend() -> None:
+        backend = SQLiteRateLimitBackend(path)
+        limiter = ratelimit.Limiter(8, 8, rate=40.0, backend=backend)
+        try:
+            for _ in range(count):
+                async with limiter.acquire("Destiny2/Manifest/"):
+                    pass
+        finally:
+            backend.close()
+
+    asyncio.run(spend())
+
+
+class TestSQLiteRateLimitBackend:
+    @pytest.fixture()
+    def backend(self, tmp_path: pathlib.Path):
+        backend = SQLiteRateLimitBackend(tmp_path / "ratelimit.sqlite3")
+        yield backend
+        backend.close()
+
+    @pytest.mark.asyncio()
+    async def test_acquire(self, backend: SQLiteRateLimitBackend):
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(4):
+            await backend.acquire("application", 100.0, 1.0)
+        assert loop.time() - started >= 0.025
+
+    @pytest.mark.asyncio()
+    async def test_throttle(self, backend: SQLiteRateLimitBackend):
+        await backend.throttle("application", 0.1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await backend.acquire("application", 1000.0, 1000.0)
+        assert loop.time() - started >= 0.09
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="Requires fork.")
+    def test_shared_between_processes(self, tmp_path: pathlib.Path):
+        path = str(tmp_path / "ratelimit.sqlite3")
+        # Create the database before forking.
+        SQLiteRateLimitBackend(path).close()
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_spend_shared_tokens, args=(path, 20))
+            for _ in range(3)
+        ]
+        started = time.monotonic()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        assert all(worker.exitcode == 0 for worker in workers)
+        # 60 tokens at 40 per second, With the first 40 already in the bucket.
+        assert time.monotonic() - started >= 0.45
@@ -0,0 +1,1148 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import io
+import pathlib
+import typing
+import zipfile
+from unittest import mock
+
+import pytest
+import pytest_asyncio
+from aiohttp import test_utils, web
+
+import aiobungie
+from aiobungie import builders, cache, framework, rest, url
+from aiobungie.internal import _bodies as response_bodies
+from aiobungie.internal import _images as image_sessions
+from tests.aiobungie import payloads
+
+if typing.TYPE_CHECKING:
+    import collections.abc as collections
+
+    _Handler = collections.Callable[
+        [web.Request], collections.Awaitable[web.StreamResponse]
+    ]
+
+
+def envelope(response: typing.Any, **kwargs: typing.Any) -> web.Response:
+    return web.json_response(
+        {
+            "Response": response,
+            "ErrorCode": 1,
+            "ThrottleSeconds": 0,
+            "ErrorStatus": "Success",
+            "Message": "Ok",
+            "MessageData": {},
+        },
+        **kwargs,
+    )
+
+
+@pytest_asyncio.fixture()
+async def serve(monkeypatch: pytest.MonkeyPatch):
+    servers: list[test_utils.TestServer] = []
+
+    async def start(routes: collections.Mapping[str, _Handler]) -> None:
+        app = web.Application()
+        for path, handler in routes.items():
+            app.router.add_route("*", path, handler)
+
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        servers.append(server)
+        monkeypatch.setattr(url, "BASE", str(server.make_url("")).rstrip("/"))
+
+    yield start
+
+    for server in servers:
+        await server.close()
+
+
+class TestCoalescing:
+    @pytest.mark.asyncio()
+    async def test_identical_gets_share_one_call(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return envelope({"hash": 1})
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        async with aiobungie.RESTClient("token") as client:
+            responses = await asyncio.gather(
+                *(client.fetch_inventory_item(1) for _ in range(20))
+            )
+
+        assert calls == 1
+        assert all(response == {"hash": 1} for response in responses)
+
+    @pytest.mark.asyncio()
+    async def test_pool_clients_share_one_call(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return envelope({"hash": 1})
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        pool = aiobungie.RESTPool("token")
+        await pool.start()
+        try:
+            responses = await asyncio.gather(
+                *(pool.acquire().fetch_inventory_item(1) for _ in range(5))
+            )
+        finally:
+            await pool.stop()
+
+        assert calls == 1
+        assert all(response == {"hash": 1} for response in responses)
+
+    @pytest.mark.asyncio()
+    async def test_unhashable_params(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return envelope(request.query.getall("hashes"))
+
+        await serve({"/Platform/Destiny2/Manifest/": handler})
+        async with aiobungie.RESTClient("token") as client:
+            responses = await asyncio.gather(
+                *(
+                    client._request(
+                        "GET", "Destiny2/Manifest/", params={"hashes": ["1", "2"]}
+                    )
+                    for _ in range(3)
+                )
+            )
+
+        assert calls == 1
+        assert all(response == ["1", "2"] for response in responses)
+
+    @pytest.mark.asyncio()
+    async def test_body_is_measured_for_each_caller(self, serve: typing.Any):
+        async def handler(_: web.Request) -> web.Response:
+            await asyncio.sleep(0.05)
+            return envelope({"hash": 1})
+
+        async def fetch(client: aiobungie.RESTClient) -> response_bodies.Body:
+            with response_bodies.measure() as body:
+                await client.fetch_inventory_item(1)
+            return body
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        async with aiobungie.RESTClient("token") as client:
+            bodies = await asyncio.gather(*(fetch(client) for _ in range(3)))
+
+        assert all(body.raw and b'"hash"' in body.raw for body in bodies)
+        assert all(body.size == len(bodies[0].raw or b"") for body in bodies)
+
+    @pytest.mark.asyncio()
+    async def test_different_auth_is_not_shared(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(request: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.05)
+            return envelope({"auth": request.headers.get("Authorization")})
+
+        await serve({"/Platform/Destiny2/{type}/Profile/{id}/": handler})
+        async with aiobungie.RESTClient("token") as client:
+            first, second = await asyncio.gather(
+                client.fetch_profile(1, 3, [], auth="a"),
+                client.fetch_profile(1, 3, [], auth="b"),
+            )
+
+        assert calls == 2
+        assert first["auth"] == "Bearer a" and second["auth"] == "Bearer b"
+
+    @pytest.mark.asyncio()
+    async def test_cancelled_caller_does_not_cancel_others(self, serve: typing.Any):
+        async def handler(_: web.Request) -> web.Response:
+            await asyncio.sleep(0.05)
+            return envelope({"hash": 1})
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        async with aiobungie.RESTClient("token") as client:
+            first = asyncio.create_task(client.fetch_inventory_item(1))
+            second = asyncio.create_task(client.fetch_inventory_item(1))
+            await asyncio.sleep(0.01)
+            first.cancel()
+
+            assert await second == {"hash": 1}
+
+    @pytest.mark.asyncio()
+    async def test_disabled(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return envelope({"hash": 1})
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        settings = builders.Settings(coalesce_requests=False)
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            await asyncio.gather(*(client.fetch_inventory_item(1) for _ in range(3)))
+
+        assert calls == 3
+
+
+class TestResponseCache:
+    @pytest.mark.asyncio()
+    async def test_cached_route(self, serve: typing.Any):
+        calls = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return envelope({"hash": 1})
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        settings = builders.Settings(response_cache=cache.ResponseCache())
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            for _ in range(3):
+                assert await client.fetch_inventory_item(1) == {"hash": 1}
+
+        assert calls == 1
+
+    @pytest.mark.parametrize("response", [[], {}])
+    @pytest.mark.asyncio()
+    async def test_caches_empty_response(self, serve: typing.Any, response: typing.Any):
+        calls = 0
+
+        async def handler(_: web.Request) -> web.Response:
+            nonlocal calls
+            calls += 1
+            return envelope(response)
+
+        await serve({"/Platform/Destiny2/Manifest/{type}/{hash}": handler})
+        settings = builders.Settings(response_cache=cache.ResponseCache())
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            for _ in range(3):
+                assert await client.static_request("GET", "Destiny2/Manifest/X/1") == (
+                    response
+                )
+
+        assert calls == 1
+
+    @pytest.mark.asyncio()
+    async def test_cache_is_scoped_by_auth(self, serve: typing.Any):
+        async def handler(request: web.Request) -> web.Response:
+            return envelope({"auth": request.headers.get("Authorization")})
+
+        await serve({"/Platform/Destiny2/{type}/Profile/{id}/": handler})
+        settings = builders.Settings(
+            response_cache=cache.ResponseCache(policies={"Destiny2/{}/Profile/*": 60})
+        )
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            first = await client.fetch_profile(1, 3, [], auth="a")
+            second = await client.fetch_profile(1, 3, [], auth="b")
+
+        assert first["auth"] == "Bearer a"
+        assert second["auth"] == "Bearer b"
+
+
+class TestConditionalRequests:
+    @pytest.mark.asyncio()
+    async def test_not_modified_reuses_body(self, serve: typing.Any):
+        sent: list[str | None] = []
+
+        async def handler(request: web.Request) -> web.StreamResponse:
+            sent.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return envelope({"version": "v1"}, headers={"ETag": '"v1"'})
+
+        await serve({"/Platform/Destiny2/Manifest": handler})
+        async with aiobungie.RESTClient("token") as client:
+            with response_bodies.measure() as first_body:
+                first = await client.fetch_manifest_path()
+            with response_bodies.measure() as second_body:
+                second = await client.fetch_manifest_path()
+
+        assert sent == [None, '"v1"']
+        assert first == second == {"version": "v1"}
+        # The stored body's size is kept, Its raw bytes aren't.
+        assert second_body.raw is None
+        assert second_body.size == first_body.size and first_body.size
+
+    @pytest.mark.asyncio()
+    async def test_pool_clients_share_validators(self, serve: typing.Any):
+        sent: list[str | None] = []
+
+        async def handler(request: web.Request) -> web.StreamResponse:
+            sent.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304)
+            return envelope({"version": "v1"}, headers={"ETag": '"v1"'})
+
+        await serve({"/Platform/Destiny2/Manifest": handler})
+        pool = aiobungie.RESTPool("token")
+        await pool.start()
+        try:
+            first = await pool.acquire().fetch_manifest_path()
+            second = await pool.acquire().fetch_manifest_path()
+        finally:
+            await pool.stop()
+
+        assert sent == [None, '"v1"']
+        assert first == second == {"version": "v1"}
+
+    @pytest.mark.asyncio()
+    async def test_validators_are_scoped_by_base(self, serve: typing.Any):
+        sent: list[tuple[str, str | None]] = []
+
+        def handler(version: str) -> _Handler:
+            async def handle(request: web.Request) -> web.StreamResponse:
+                sent.append((request.path, request.headers.get("If-None-Match")))
+                if request.headers.get("If-None-Match") == version:
+                    return web.Response(status=304)
+                return envelope({"version": version}, headers={"ETag": version})
+
+            return handle
+
+        await serve(
+            {
+                "/Platform/Destiny2/Manifest": handler('"platform"'),
+                "/Destiny2/Manifest": handler('"base"'),
+            }
+        )
+        async with aiobungie.RESTClient("token") as client:
+            platform = await client._request("GET", "Destiny2/Manifest")
+            base = await client._request("GET", "Destiny2/Manifest", base=True)
+
+        assert platform == {"version": '"platform"'}
+        assert base == {"version": '"base"'}
+        assert sent == [
+            ("/Platform/Destiny2/Manifest", None),
+            ("/Destiny2/Manifest", None),
+        ]
+
+    @pytest.mark.asyncio()
+    async def test_unmatched_route(self, serve: typing.Any):
+        sent: list[str | None] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            sent.append(request.headers.get("If-None-Match"))
+            return envelope({"id": 1}, headers={"ETag": '"v1"'})
+
+        await serve({"/Platform/User/GetBungieNetUserById/{id}/": handler})
+        async with aiobungie.RESTClient("token") as client:
+            await client.fetch_bungie_user(1)
+            await client.fetch_bungie_user(1)
+
+        assert sent == [None, None]
+
+    @pytest.mark.asyncio()
+    async def test_disabled(self, serve: typing.Any):
+        sent: list[str | None] = []
+
+        async def handler(request: web.Request) -> web.Response:
+            sent.append(request.headers.get("If-None-Match"))
+            return envelope({"version": "v1"}, headers={"ETag": '"v1"'})
+
+        await serve({"/Platform/Destiny2/Manifest": handler})
+        settings = builders.Settings(conditional_cache_size=0)
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            await client.fetch_manifest_path()
+            await client.fetch_manifest_path()
+
+        assert sent == [None, None]
+
+
+def manifest_routes(
+    sqlite: bytes = b"SQLite format 3\x00",
+    json: bytes = b'{"a": 1}',
+    version: collections.Callable[[], str] = lambda: "v1",
+) -> dict[str, _Handler]:
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zipped:
+        zipped.writestr("world_sql_content.content", sqlite)
+
+    async def paths(_: web.Request) -> web.Response:
+        return envelope(
+            {
+                "version": version(),
+                "mobileWorldContentPaths": {"en": "/content/world.content"},
+                "jsonWorldContentPaths": {"en": "/content/world.json"},
+                "jsonWorldComponentContentPaths": {
+                    "en": {"DestinyInventoryItemDefinition": "/content/items.json"}
+                },
+            }
+        )
+
+    async def content(_: web.Request) -> web.Response:
+        return web.Response(body=archive.getvalue())
+
+    async def world(_: web.Request) -> web.Response:
+        return web.Response(body=json, content_type="application/json")
+
+    return {
+        "/Platform/Destiny2/Manifest": paths,
+        "/content/world.content": content,
+        "/content/world.json": world,
+        "/content/items.json": world,
+    }
+
+
+class TestRetries:
+    @pytest.mark.asyncio()
+    async def test_ratelimit_sleep_releases_slots(self, serve: typing.Any):
+        order: list[str] = []
+
+        async def throttled(_: web.Request) -> web.Response:
+            if not order:
+                order.append("throttled")
+                return web.json_response(
+                    {"ErrorCode": 51, "ThrottleSeconds": 0.5, "Response": {}},
+                    status=429,
+                )
+            order.append("retried")
+            return envelope({})
+
+        async def other(_: web.Request) -> web.Response:
+            order.append("other")
+            return envelope({})
+
+        await serve({"/Platform/Throttled/": throttled, "/Platform/Other/": other})
+        settings = builders.Settings(max_concurrent_requests=1)
+        async with aiobungie.RESTClient("token", settings=settings) as client:
+            first = asyncio.create_task(client.static_request("GET", "Throttled/"))
+            while not order:
+                await asyncio.sleep(0)
+            # Sent while the throttled request sleeps, It doesn't wait for the sleep to end.
+            await asyncio.wait_for(client.static_request("GET", "Other/"), 0.3)
+            await first
+
+        assert order == ["throttled", "other", "retried"]
+
+
+class TestImageFetching:
+    @pytest_asyncio.fixture()
+    async def peers(self, serve: typing.Any) -> list[typing.Any]:
+        peers: list[typing.Any] = []
+
+        async def icon(request: web.Request) -> web.Response:
+            assert request.transport is not None
+            peers.append(request.transport.get_extra_info("peername"))
+            return web.Response(body=b"icon")
+
+        await serve({"/icon.png": icon})
+        return peers
+
+    @pytest.mark.asyncio()
+    async def test_reuses_client_session(self, peers: list[typing.Any]):
+        client = aiobungie.Client("token")
+        image = client.framework._image("icon.png")  # type: ignore
+        async with client.rest:
+            assert await image.read() == b"icon"
+            assert await image == b"icon"
+
+        # One connection for both reads.
+        assert len(peers) == 2
+        assert peers[0] == peers[1]
+
+    @pytest.mark.asyncio()
+    async def test_framework_per_client(self, peers: list[typing.Any]):
+        generated = framework.GeneratedFramework()
+        decoder = mock.Mock(framework=generated)
+        client = aiobungie.Client("token", decoder=decoder)
+        other = aiobungie.Client("token")
+        image = generated._image("icon.png")
+        async with client.rest, other.rest:
+            assert image._source is client.rest._images  # type: ignore
+            assert other.framework._image("icon.png")._source is other.rest._images  # type: ignore
+            assert image._source.session is client.rest._session  # type: ignore
+
+        assert image._source.session is None  # type: ignore
+
+    @pytest.mark.asyncio()
+    async def test_sessions_are_per_loop(self):
+        source = image_sessions.Source()
+
+        async def current() -> typing.Any:
+            return source.session
+
+        async with aiobungie.RESTClient("token", images=source):
+            assert await current() is not None
+            # A session is never handed to an image fetched in another event loop.
+            assert await asyncio.to_thread(asyncio.run, current()) is None
+
+        assert await current() is None
+
+    @pytest.mark.asyncio()
+    async def test_without_client(self, peers: list[typing.Any]):
+        async with aiobungie.RESTClient("token"):
+            # Images that don't belong to a client open their own session.
+            assert await builders.Image("icon.png").read() == b"icon"
+            assert await builders.Image("icon.png").read() == b"icon"
+
+        assert len(peers) == 2
+        assert peers[0] != peers[1]
+
+    @pytest.mark.asyncio()
+    async def test_image_cache(self, peers: list[typing.Any], tmp_path: pathlib.Path):
+        settings = builders.Settings(image_cache=cache.ImageCache(tmp_path / "cache"))
+        client = aiobungie.Client("token", settings=settings)
+        image = client.framework._image("icon.png")  # type: ignore
+        async with client.rest:
+            assert await image.read() == b"icon"
+            assert await image.read() == b"icon"
+            await image.save("icon", tmp_path)
+
+        assert len(peers) == 1
+        assert (tmp_path / "icon.png").read_bytes() == b"icon"
+
+    @pytest.mark.asyncio()
+    async def test_streaming(self, peers: list[typing.Any]):
+        source = image_sessions.Source()
+        image = builders.Image("icon.png", source=source)
+        async with aiobungie.RESTClient("token", images=source):
+            chunks = [chunk async for chunk in image.iter()]
+            # The same image streamed twice at once, Each stream owns its own response.
+            first, second = await image.stream(), await image.chunks(2)
+            async with first, second:
+                assert b"".join([chunk async for chunk in second]) == b"icon"
+                assert b"".join([chunk async for chunk in first]) == b"icon"
+
+        assert b"".join(chunks) == b"icon"
+        assert len(peers) == 3
+
+
+class TestImageDownloads:
+    @pytest.mark.asyncio()
+    async def test_save_many(self, serve: typing.Any, tmp_path: pathlib.Path):
+        active = peak = 0
+
+        async def icon(request: web.Request) -> web.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            if request.match_info["name"] == "missing.png":
+                return web.Response(status=404)
+            return web.Response(body=request.match_info["name"].encode())
+
+        await serve({"/icons/{name}": icon})
+        (tmp_path / "existing.png").write_bytes(b"old")
+        names = [f"{n}.png" for n in range(6)] + ["existing.png", "missing.png"]
+
+        async with aiobungie.RESTClient("token"):
+            downloads = [
+                download
+                async for download in builders.Image.save_many(
+                    # Duplicates are only downloaded once.
+                    [builders.Image(f"icons/{name}") for name in names]
+                    + [builders.Image(f"/icons/{name}") for name in names],
+                    tmp_path,
+                    concurrency=2,
+                )
+            ]
+
+        assert peak == 2
+        assert [download.completed for download in downloads] == list(range(1, 9))
+        assert {download.total for download in downloads} == {8}
+
+        results = {download.path.name: download for download in downloads}
+        assert results["existing.png"].skipped
+        assert (tmp_path / "existing.png").read_bytes() == b"old"
+        assert not results["missing.png"].ok
+        assert not (tmp_path / "missing.png").exists()
+        for name in names[:6]:
+            assert results[name].ok and not results[name].skipped
+            assert (tmp_path / name).read_bytes() == name.encode()
+
+        # No partial files are left behind.
+        assert len(list(tmp_path.iterdir())) == 7
+
+    @pytest.mark.asyncio()
+    async def test_save_many_conflicting_names(self, tmp_path: pathlib.Path):
+        images = [builders.Image("a/icon.png"), builders.Image("b/icon.png")]
+        with pytest.raises(ValueError, match="icon.png"):
+            async for _ in builders.Image.save_many(images, tmp_path):
+                pass
+
+        assert not list(tmp_path.iterdir())
+
+    @pytest.mark.asyncio()
+    async def test_save(self, serve: typing.Any, tmp_path: pathlib.Path):
+        async def icon(_: web.Request) -> web.Response:
+            return web.Response(body=b"icon")
+
+        await serve({"/icon.png": icon})
+        await builders.Image("icon.png").save("icon", tmp_path, mime_type="jpg")
+        assert (tmp_path / "icon.jpg").read_bytes() == b"icon"
+
+    @pytest.mark.asyncio()
+    async def test_save_http_error(self, serve: typing.Any, tmp_path: pathlib.Path):
+        async def icon(_: web.Request) -> web.Response:
+            return web.Response(status=404)
+
+        await serve({"/icon.png": icon})
+        with pytest.raises(RuntimeError) as exc:
+            await builders.Image("icon.png").save("icon", tmp_path)
+
+        assert isinstance(exc.value.__cause__, aiobungie.HTTPError)
+        assert not (tmp_path / "icon.png").exists()
+
+    @pytest.mark.asyncio()
+    async def test_save_many_stopped_early(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        async def icon(request: web.Request) -> web.Response:
+            if request.match_info["name"] != "0.png":
+                await asyncio.sleep(10)
+            return web.Response(body=b"icon")
+
+        await serve({"/icons/{name}": icon})
+        images = [builders.Image(f"icons/{n}.png") for n in range(4)]
+        async with aiobungie.RESTClient("token"):
+            downloads = builders.Image.save_many(images, tmp_path)
+            async for _ in downloads:
+                break
+            await downloads.aclose()
+
+            # The other downloads were awaited, Not just cancelled.
+            pending = [
+                task
+                for task in asyncio.all_tasks()
+                if task is not asyncio.current_task()
+                and getattr(task.get_coro(), "__name__", "") == "download"
+            ]
+            assert not pending
+
+
+class TestClanMemberPages:
+    @pytest_asyncio.fixture()
+    async def roster(self, serve: typing.Any) -> dict[str, typing.Any]:
+        state: dict[str, typing.Any] = {
+            "size": 250,
+            "reported": 250,
+            "pages": [],
+            "active": 0,
+            "peak": 0,
+        }
+
+        async def members(request: web.Request) -> web.Response:
+            page = int(request.query["currentpage"])
+            state["pages"].append(page)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+            ids = range((page - 1) * 100, min(page * 100, state["size"]))
+            return envelope(
+                {
+                    "results": [payloads.clan_member(id) for id in ids],
+                    "totalResults": state["reported"],
+                    "hasMore": page * 100 < state["size"],
+                }
+            )
+
+        await serve({"/Platform/GroupV2/{clan_id}/Members/": members})
+        return state
+
+    @pytest.mark.asyncio()
+    async def test_fetches_all_pages(self, roster: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            members = await client.fetch_clan_members(4389205)
+
+        assert [member.id for member in members] == list(range(250))
+        assert sorted(roster["pages"]) == [1, 2, 3]
+        # The pages after the first one were fetched concurrently.
+        assert roster["peak"] == 2
+
+    @pytest.mark.asyncio()
+    async def test_stream(self, roster: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            ids = [member.id async for member in client.stream_clan_members(4389205)]
+
+        assert ids[:100] == list(range(100))
+        assert sorted(ids) == list(range(250))
+
+    @pytest.mark.asyncio()
+    async def test_generated_framework(
+        self, roster: dict[str, typing.Any], monkeypatch: pytest.MonkeyPatch
+    ):
+        calls: list[int] = []
+        generated_member = framework.GeneratedFramework.deserialize_clan_member
+
+        def deserialize_clan_member(self: typing.Any, payload: typing.Any):
+            calls.append(1)
+            return generated_member(self, payload)
+
+        monkeypatch.setattr(
+            framework.GeneratedFramework,
+            "deserialize_clan_member",
+            deserialize_clan_member,
+        )
+        generated = framework.GeneratedFramework()
+        client = aiobungie.Client("token", framework=generated)
+        assert client.framework is generated
+
+        async with client.rest:
+            members = [member async for member in client.stream_clan_members(4389205)]
+
+        default = aiobungie.Client("token")
+        async with default.rest:
+            expected = [member async for member in default.stream_clan_members(4389205)]
+
+        assert len(calls) == 250
+        assert sorted(members, key=lambda m: m.id) == sorted(
+            expected, key=lambda m: m.id
+        )
+
+    @pytest.mark.asyncio()
+    async def test_total_results_behind(self, roster: dict[str, typing.Any]):
+        roster["size"] = 420
+        client = aiobungie.Client("token")
+        async with client.rest:
+            members = await client.fetch_clan_members(4389205)
+
+        assert [member.id for member in members] == list(range(420))
+        assert sorted(roster["pages"]) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio()
+    async def test_single_page(self, roster: dict[str, typing.Any]):
+        roster["size"] = roster["reported"] = 3
+        client = aiobungie.Client("token")
+        async with client.rest:
+            members = await client.fetch_clan_members(4389205)
+
+        assert len(members.collect()) == 3
+        assert roster["pages"] == [1]
+
+    @pytest.mark.asyncio()
+    async def test_typed_decoder(self, roster: dict[str, typing.Any]):
+        pytest.importorskip("msgspec")
+        from aiobungie import decoding
+
+        client = aiobungie.Client("token", decoder=decoding.TypedDecoder())
+        async with client.rest:
+            members = await client.fetch_clan_members(4389205)
+
+        assert [member.id for member in members] == list(range(250))
+
+
+class TestManifestDownload:
+    @pytest.mark.asyncio()
+    async def test_sqlite(
+        self,
+        serve: typing.Any,
+        tmp_path: pathlib.Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        cwd = tmp_path / "cwd"
+        cwd.mkdir()
+        monkeypatch.chdir(cwd)
+        # Bigger than a single chunk.
+        body = b"SQLite format 3\x00" + bytes(3 * 1024 * 1024)
+
+        await serve(manifest_routes(sqlite=body))
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_sqlite_manifest(path=tmp_path)
+
+        assert path == tmp_path / "manifest.sqlite3"
+        assert path.read_bytes() == body
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "cwd",
+            "manifest.sqlite3",
+            "manifest.sqlite3.version",
+        ]
+        assert not any(cwd.iterdir())
+
+    @pytest.mark.asyncio()
+    async def test_sqlite_exists(self, serve: typing.Any, tmp_path: pathlib.Path):
+        (tmp_path / "manifest.sqlite3").write_bytes(b"old")
+
+        await serve(manifest_routes(sqlite=b"new"))
+        async with aiobungie.RESTClient("token") as client:
+            with pytest.raises(FileExistsError):
+                await client.download_sqlite_manifest(path=tmp_path)
+
+            path = await client.download_sqlite_manifest(path=tmp_path, force=True)
+
+        assert path.read_bytes() == b"new"
+
+    @pytest.mark.asyncio()
+    async def test_json_is_written_as_is(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        body = b'{"DestinyInventoryItemDefinition": {"1": {"hash": 1}}}'
+
+        await serve(manifest_routes(json=body))
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_json_manifest(path=tmp_path)
+
+        assert path.read_bytes() == body
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "manifest.json",
+            "manifest.json.version",
+        ]
+
+
+class TestManifestSync:
+    @pytest.mark.asyncio()
+    async def test_downloads_new_versions_only(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        version = "v1"
+        downloads = 0
+        routes = manifest_routes(version=lambda: version)
+        content = routes["/content/world.content"]
+
+        async def counted(request: web.Request) -> web.StreamResponse:
+            nonlocal downloads
+            downloads += 1
+            return await content(request)
+
+        routes["/content/world.content"] = counted
+        await serve(routes)
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_sqlite_manifest(path=tmp_path, sync=True)
+            await client.download_sqlite_manifest(path=tmp_path, sync=True)
+            assert downloads == 1
+            assert (tmp_path / "manifest.sqlite3.version").read_text() == "v1"
+
+            version = "v2"
+            await client.download_sqlite_manifest(path=tmp_path, sync=True)
+            assert downloads == 2
+            assert (tmp_path / "manifest.sqlite3.version").read_text() == "v2"
+
+        assert path.exists()
+
+    @pytest.mark.asyncio()
+    async def test_missing_file_is_downloaded(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        (tmp_path / "manifest.json.version").write_text("v1")
+
+        await serve(manifest_routes())
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_json_manifest(path=tmp_path, sync=True)
+
+        assert path.read_bytes() == b'{"a": 1}'
+
+
+class TestDefinitionDownload:
+    @pytest.mark.asyncio()
+    async def test_download(self, serve: typing.Any, tmp_path: pathlib.Path):
+        await serve(manifest_routes(json=b'{"1": {"hash": 1}}'))
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_json_definition(
+                "DestinyInventoryItemDefinition", tmp_path, sync=True
+            )
+
+        assert path == tmp_path / "DestinyInventoryItemDefinition.json"
+        assert path.read_bytes() == b'{"1": {"hash": 1}}'
+        assert (tmp_path / "DestinyInventoryItemDefinition.json.version").exists()
+
+    @pytest.mark.asyncio()
+    async def test_given_manifest_path(self, serve: typing.Any, tmp_path: pathlib.Path):
+        resolved = 0
+
+        def version() -> str:
+            nonlocal resolved
+            resolved += 1
+            return "v1"
+
+        await serve(manifest_routes(version=version))
+        async with aiobungie.RESTClient("token") as client:
+            manifest_path = await client.fetch_manifest_path()
+            for _ in range(2):
+                await client.download_json_definition(
+                    "DestinyInventoryItemDefinition",
+                    tmp_path,
+                    sync=True,
+                    manifest_path=manifest_path,
+                )
+
+        assert resolved == 1
+
+    @pytest.mark.asyncio()
+    async def test_unknown_definition(self, serve: typing.Any, tmp_path: pathlib.Path):
+        await serve(manifest_routes())
+        async with aiobungie.RESTClient("token") as client:
+            with pytest.raises(ValueError):
+                await client.download_json_definition("Nope", tmp_path)
+
+
+class TestResumableDownload:
+    @pytest.fixture(autouse=True)
+    def no_backoff(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            rest.backoff, "ExponentialBackOff", lambda **_: iter(lambda: 0.0, None)
+        )
+
+    @pytest.mark.asyncio()
+    async def test_resumes_interrupted_download(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        body = bytes(range(256)) * 4096
+        ranges: list[str | None] = []
+
+        async def content(request: web.Request) -> web.StreamResponse:
+            ranges.append(request.headers.get("Range"))
+            if request.http_range.start:
+                start = request.http_range.start
+                return web.Response(
+                    body=body[start:],
+                    status=206,
+                    headers={
+                        "Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"
+                    },
+                )
+
+            # Drop the connection half way through the body.
+            response = web.StreamResponse()
+            response.content_length = len(body)
+            await response.prepare(request)
+            await response.write(body[: len(body) // 2])
+            # Let the client read what was sent before the connection is gone.
+            await asyncio.sleep(0.1)
+            assert request.transport is not None
+            request.transport.close()
+            return response
+
+        routes = manifest_routes()
+        routes["/content/world.json"] = content
+        await serve(routes)
+        async with aiobungie.RESTClient("token", max_retries=2) as client:
+            path = await client.download_json_manifest(path=tmp_path)
+
+        assert path.read_bytes() == body
+        assert ranges[0] is None
+        assert len(ranges) == 2
+        assert ranges[1] is not None
+        assert int(ranges[1][6:-1]) > 0
+        assert not list(tmp_path.glob(".*"))
+
+    @pytest.mark.asyncio()
+    async def test_range_is_ignored(self, serve: typing.Any, tmp_path: pathlib.Path):
+        ranges: list[str | None] = []
+
+        async def content(request: web.Request) -> web.Response:
+            ranges.append(request.headers.get("Range"))
+            return web.Response(body=b'{"a": 1}')
+
+        routes = manifest_routes()
+        routes["/content/world.json"] = content
+        await serve(routes)
+
+        partial = rest._partial_path(tmp_path / "manifest.json", "/content/world.json")
+        partial.write_bytes(b"stale")
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_json_manifest(path=tmp_path)
+
+        assert ranges == ["bytes=5-"]
+        assert path.read_bytes() == b'{"a": 1}'
+        assert not partial.exists()
+
+    @pytest.mark.asyncio()
+    async def test_stale_partials_are_removed(
+        self, serve: typing.Any, tmp_path: pathlib.Path
+    ):
+        await serve(manifest_routes())
+        destination = tmp_path / "manifest.json"
+        stale = rest._partial_path(destination, "/content/old-world.json")
+        stale.write_bytes(b"old version")
+        other = rest._partial_path(tmp_path / "other.json", "/content/old-world.json")
+        other.write_bytes(b"another destination")
+
+        async with aiobungie.RESTClient("token") as client:
+            path = await client.download_json_manifest(path=tmp_path)
+
+        assert path.read_bytes() == b'{"a": 1}'
+        assert not stale.exists()
+        assert other.exists()
+
+    @pytest.mark.asyncio()
+    async def test_gives_up(self, serve: typing.Any, tmp_path: pathlib.Path):
+        async def content(request: web.Request) -> web.StreamResponse:
+            response = web.StreamResponse()
+            response.content_length = 100
+            await response.prepare(request)
+            await response.write(b"x")
+            assert request.transport is not None
+            request.transport.close()
+            return response
+
+        routes = manifest_routes()
+        routes["/content/world.json"] = content
+        await serve(routes)
+        async with aiobungie.RESTClient("token", max_retries=0) as client:
+            with pytest.raises(aiobungie.HTTPError):
+                await client.download_json_manifest(path=tmp_path)
+
+        # The partial file is kept so the next call can resume it.
+        assert not (tmp_path / "manifest.json").exists()
+        assert [p.suffix for p in tmp_path.iterdir()] == [".part"]
+
+
+class TestActivityStream:
+    # 520 activities, From the most recent to the oldest, One hour apart.
+    size = 520
+    latest = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+
+    @pytest_asyncio.fixture()
+    async def history(self, serve: typing.Any) -> dict[str, typing.Any]:
+        state: dict[str, typing.Any] = {"pages": [], "active": 0, "peak": 0}
+
+        async def activities(request: web.Request) -> web.Response:
+            page = int(request.query["page"])
+            count = int(request.query["count"])
+            state["pages"].append(page)
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+
+            ids = range(page * count, min((page + 1) * count, self.size))
+            if not ids:
+                # Bungie returns an empty response past the end of the history.
+                return envelope({})
+
+            return envelope(
+                {
+                    "activities": [
+                        {
+                            **payloads.activity(id),
+                            "period": (
+                                self.latest - datetime.timedelta(hours=id)
+                            ).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        }
+                        for id in ids
+                    ]
+                }
+            )
+
+        await serve(
+            {
+                "/Platform/Destiny2/{type}/Account/{member}/Character/{char}/Stats/Activities/": activities
+            }
+        )
+        return state
+
+    def stream(
+        self, client: aiobungie.Client, **kwargs: typing.Any
+    ) -> typing.AsyncGenerator[typing.Any, None]:
+        return client.stream_activities(
+            4611686018484639825,
+            2305843009444904605,
+            aiobungie.GameMode.RAID,
+            aiobungie.MembershipType.STEAM,
+            limit=100,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio()
+    async def test_full_history(self, history: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            ids = [activity.instance_id async for activity in self.stream(client)]
+
+        assert ids == list(range(self.size))
+        # Page 5 isn't full, So nothing after it is waited on.
+        assert sorted(history["pages"])[:6] == [0, 1, 2, 3, 4, 5]
+        # Pages were fetched ahead of the one being yielded.
+        assert history["peak"] > 1
+
+    @pytest.mark.asyncio()
+    async def test_stops_at_since(self, history: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            activities = [
+                activity
+                async for activity in self.stream(
+                    client, since=self.latest - datetime.timedelta(hours=149)
+                )
+            ]
+
+        assert [activity.instance_id for activity in activities] == list(range(150))
+        # The window ahead of page 1 was requested but nothing past it.
+        assert max(history["pages"]) <= 3
+        assert history["active"] == 0
+
+    @pytest.mark.asyncio()
+    async def test_stops_at_last_instance_id(self, history: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            ids = [
+                activity.instance_id
+                async for activity in self.stream(client, last_instance_id=42)
+            ]
+
+        assert ids == list(range(42))
+        assert max(history["pages"]) <= 2
+
+    @pytest.mark.asyncio()
+    async def test_look_ahead_zero(self, history: dict[str, typing.Any]):
+        client = aiobungie.Client("token")
+        async with client.rest:
+            ids = [
+                activity.instance_id
+                async for activity in self.stream(client, look_ahead=0)
+            ]
+
+        assert ids == list(range(self.size))
+        assert history["pages"] == [0, 1, 2, 3, 4, 5]
+        assert history["peak"] == 1
+
+    @pytest.mark.asyncio()
+    async def test_empty_page_past_the_end(self, history: dict[str, typing.Any]):
+        self.size = 500
+        client = aiobungie.Client("token")
+        async with client.rest:
+            ids = [
+                activity.instance_id
+                async for activity in self.stream(client, look_ahead=0)
+            ]
+
+        assert ids == list(range(500))
+        assert history["pages"] == [0, 1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio()
+    async def test_naive_since(self):
+        client = aiobungie.Client("token")
+        with pytest.raises(ValueError):
+            async for _ in self.stream(client, since=datetime.datetime(2024, 1, 1)):
+                pass
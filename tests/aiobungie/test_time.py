@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+# MIT License
+#
+# Copyright (c) 2020 - Present nxtlo
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import datetime
+
+import pytest
+
+from aiobungie.internal import time
+
+
+class TestCleanDate:
+    @pytest.mark.parametrize(
+        ("iso_date", "expected"),
+        [
+            (
+                "2023-01-07T18:10:41Z",
+                datetime.datetime(2023, 1, 7, 18, 10, 41, tzinfo=datetime.timezone.utc),
+            ),
+            (
+                "2023-01-07T18:10:41.12Z",
+                datetime.datetime(
+                    2023, 1, 7, 18, 10, 41, 120000, tzinfo=datetime.timezone.utc
+                ),
+            ),
+            (
+                "2020-12-09T05:00:00-05:30",
+                datetime.datetime(
+                    2020,
+                    12,
+                    9,
+                    5,
+                    tzinfo=datetime.timezone(-datetime.timedelta(hours=5, minutes=30)),
+                ),
+            ),
+            ("2023-01-07T18:10:41", datetime.datetime(2023, 1, 7, 18, 10, 41)),
+        ],
+    )
+    def test_parse(self, iso_date: str, expected: datetime.datetime):
+        assert time.clean_date(iso_date) == expected
+        assert time._parse_bungie_date(iso_date) == expected
+        assert time._parse_bungie_date(iso_date).tzinfo == expected.tzinfo
+
+    def test_cached(self):
+        first = time.clean_date("2022-02-22T22:22:22Z")
+        assert time.clean_date("2022-02-22T22:22:22Z") is first
+
+    def test_cache_is_bounded(self):
+        assert time.clean_date.cache_info().maxsize == time._DATE_CACHE_SIZE
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            time._parse_bungie_date("07/01/2023")